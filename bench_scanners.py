@@ -0,0 +1,330 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Benchmark harness for the repo's tree-scanning tools.
+# Generates synthetic Next.js-style TSX trees (1k / 10k / 100k code files by
+# default, plus node_modules/.next junk that the scanners must prune), then times
+# each scanner cold and warm, one fresh interpreter per run so ru_maxrss is that
+# run's own peak RSS. Results land in a JSON file for later comparison.
+#
+#   cold: empty tool caches (.code_hunter index/result dbs live in a fresh dir);
+#         with --drop-caches (root only) the OS page cache is dropped too.
+#   warm: the same caches and page cache left behind by the cold run; best of --repeat.
+#
+# Usage: python3 bench_scanners.py [--sizes 1000,10000] [--density 0.05] [--out results.json]
+#        python3 bench_scanners.py --compare old.json new.json
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BENCH_DIR = os.path.join(HERE, '.bench')
+TERM = 'Search'
+FILES_PER_DIR = 40
+ICONS = ['X', 'Plus', 'Trash2', 'Download', 'Filter', 'ChevronDown', 'FileText', 'AlertTriangle', 'Shield', 'Upload']
+SECTIONS = ['vendor-risk', 'reports', 'compliance', 'audit', 'settings', 'dashboard', 'evidence', 'policies']
+
+
+# ---------------------------------------------------------
+# SYNTHETIC TREES
+# ---------------------------------------------------------
+
+def _component(rng, name, hit):
+    icons = rng.sample(ICONS, 3)
+    if hit:
+        icons[0] = TERM
+    fields = rng.randint(2, 8)
+    state = "\n".join(f"  const [field{i}, setField{i}] = useState<string>('');" for i in range(fields))
+    rows = "\n".join(
+        f"""        <div className="flex items-center gap-2 px-4 py-2 border-b border-slate-800">
+          <span className="text-xs text-slate-400">Field {i}</span>
+          <input value={{field{i}}} onChange={{(e) => setField{i}(e.target.value)}} className="flex-1 bg-slate-900" />
+        </div>""" for i in range(fields))
+    return f"""'use client';
+
+import {{ useState }} from 'react';
+import {{ {', '.join(icons)} }} from 'lucide-react';
+import {{ cn }} from '@/lib/utils';
+
+interface {name}Props {{
+  title: string;
+  onClose?: () => void;
+}}
+
+export default function {name}({{ title, onClose }}: {name}Props) {{
+{state}
+  return (
+    <section className={{cn('rounded-md bg-slate-950 text-slate-100')}}>
+      <header className="flex items-center justify-between px-4 py-3">
+        <{icons[0]} className="h-4 w-4 text-slate-400" />
+        <h2 className="text-sm font-semibold">{{title}}</h2>
+        <button onClick={{onClose}} aria-label="Close"><{icons[1]} className="h-4 w-4" /></button>
+      </header>
+      <div className="divide-y divide-slate-800">
+{rows}
+      </div>
+    </section>
+  );
+}}
+"""
+
+
+def _helper(rng, name):
+    return f"""export function {name}(values: string[]): string {{
+  return values.filter(Boolean).map((v) => v.trim()).join(', ');
+}}
+
+export const {name.upper()}_LIMIT = {rng.randint(10, 500)};
+"""
+
+
+def generate_tree(size, density, seed=0, base_dir=None):
+    """Build (or reuse) a tree with `size` code files, `density` of them hunting hits; returns its manifest."""
+    base_dir = base_dir or os.path.join(BENCH_DIR, 'trees')
+    root = os.path.join(base_dir, f"n{size}-d{density:g}-s{seed}")
+    manifest_path = os.path.join(root, 'tree.json')
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+
+    if os.path.exists(root):
+        shutil.rmtree(root)  # half-written by an interrupted run
+    rng = random.Random(seed)
+    app = os.path.join(root, 'app')
+    files = total_bytes = hit_files = 0
+    for i in range(size):
+        section = SECTIONS[i % len(SECTIONS)]
+        group = f"group{i // (FILES_PER_DIR * len(SECTIONS)):04d}"
+        directory = os.path.join(app, section, 'components', group)
+        roll = rng.random()
+        if roll < 0.08:
+            path, content = os.path.join(directory, f"helper{i}.ts"), _helper(rng, f"helper{i}")
+        elif roll < 0.1:
+            path, content = os.path.join(directory, f"styles{i}.css"), f".c{i} {{ display: flex; gap: {i % 9}px; }}\n"
+        else:
+            hit = rng.random() < density
+            hit_files += hit
+            path, content = os.path.join(directory, f"Component{i}.tsx"), _component(rng, f"Component{i}", hit)
+        os.makedirs(directory, exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(content)
+        files += 1
+        total_bytes += len(content.encode('utf-8'))
+
+    # Junk the scanners are expected to skip; it still contains the term.
+    for junk in ('node_modules/lucide-react/dist', '.next/static/chunks'):
+        directory = os.path.join(app, junk)
+        os.makedirs(directory, exist_ok=True)
+        for i in range(max(1, size // 20)):
+            with open(os.path.join(directory, f"chunk{i}.js"), 'w') as f:
+                f.write(f"export const {TERM}{i} = () => null; // lucide-react\n")
+
+    manifest = {'root': app, 'size': size, 'density': density, 'seed': seed,
+                'files': files, 'bytes': total_bytes, 'hit_files': hit_files}
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+# ---------------------------------------------------------
+# SCANNERS (run inside a worker process)
+# ---------------------------------------------------------
+
+def _code_hunter(root, **options):
+    import code_hunter
+    return code_hunter.search_code(TERM, root, **options)
+
+
+def _ingest(root):
+    from orchestrator import RebuildOrchestrator
+    scratch = tempfile.mkdtemp(prefix='bench-ingest-')
+    try:
+        orchestrator = RebuildOrchestrator(source_dir=root, sandbox_dir=os.path.join(scratch, 'sandbox'),
+                                           doc_dir=os.path.join(scratch, 'doc'))
+        orchestrator.ingest()
+        return len(orchestrator.inventory)
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def _spyglass(root):
+    # destroy_spyglass.py's check, swept across every .tsx file instead of its three.
+    from code_hunter import IGNORED_DIRS
+    from destroy_spyglass import has_spyglass
+    from fast_walk import walk_files
+    violations = 0
+    for path in walk_files(root, ('.tsx',), skip_dirs=IGNORED_DIRS):
+        with open(path, 'r') as f:
+            violations += has_spyglass(f.read())
+    return violations
+
+
+SCANNERS = {
+    'code_hunter.scan': lambda root: _code_hunter(root, use_index=False),
+    'code_hunter.index': lambda root: _code_hunter(root, use_index=True),
+    'code_hunter.jobs': lambda root: _code_hunter(root, use_index=False, jobs=os.cpu_count() or 1),
+    'orchestrator.ingest': _ingest,
+    'destroy_spyglass.scan': _spyglass,
+}
+
+
+def _rss_mb(who):
+    # ru_maxrss is KiB on Linux, bytes on macOS.
+    peak = resource.getrusage(who).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def _worker(scanner, root):
+    import code_hunter, orchestrator, destroy_spyglass  # noqa: E401,F401 - keep import time out of the timing
+    baseline = _rss_mb(resource.RUSAGE_SELF)
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        started = time.perf_counter()
+        result = SCANNERS[scanner](root)
+        elapsed = time.perf_counter() - started
+    print(json.dumps({'seconds': elapsed, 'result': result, 'baseline_rss_mb': baseline,
+                      'peak_rss_mb': _rss_mb(resource.RUSAGE_SELF),
+                      'peak_child_rss_mb': _rss_mb(resource.RUSAGE_CHILDREN)}))
+    return 0
+
+
+# ---------------------------------------------------------
+# DRIVER
+# ---------------------------------------------------------
+
+def _drop_page_cache():
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as f:
+            f.write('3\n')
+        return True
+    except OSError:
+        return False
+
+
+def _run_once(scanner, root, cache_dir):
+    env = dict(os.environ, CODE_HUNTER_CACHE=cache_dir)
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), '--worker', scanner, root],
+                          cwd=HERE, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"{scanner} failed on {root}:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _record(manifest, scanner, phase, runs):
+    best = min(runs, key=lambda r: r['seconds'])
+    seconds = max(best['seconds'], 1e-9)
+    return {
+        'size': manifest['size'], 'scanner': scanner, 'phase': phase, 'runs': len(runs),
+        'seconds': round(best['seconds'], 6),
+        'files': manifest['files'], 'bytes': manifest['bytes'],
+        'files_per_sec': round(manifest['files'] / seconds, 1),
+        'mb_per_sec': round(manifest['bytes'] / (1024 * 1024) / seconds, 2),
+        'peak_rss_mb': max(r['peak_rss_mb'] for r in runs),
+        'peak_child_rss_mb': max(r['peak_child_rss_mb'] for r in runs),
+        'baseline_rss_mb': best['baseline_rss_mb'],
+        'result': best['result'],
+    }
+
+
+def run_benchmarks(sizes, density, scanners, repeat=3, seed=0, drop_caches=False):
+    results = []
+    page_cache_dropped = False
+    for size in sizes:
+        started = time.perf_counter()
+        manifest = generate_tree(size, density, seed)
+        print(f"\n🌲 {manifest['files']} files ({manifest['bytes'] / (1024 * 1024):.1f} MB, "
+              f"{manifest['hit_files']} hit files) ready in {time.perf_counter() - started:.1f}s")
+        print("-" * 78)
+        for scanner in scanners:
+            cache_dir = tempfile.mkdtemp(prefix='bench-cache-')
+            try:
+                if drop_caches:
+                    page_cache_dropped = _drop_page_cache()
+                cold = _record(manifest, scanner, 'cold', [_run_once(scanner, manifest['root'], cache_dir)])
+                warm = _record(manifest, scanner, 'warm',
+                               [_run_once(scanner, manifest['root'], cache_dir) for _ in range(repeat)])
+            finally:
+                shutil.rmtree(cache_dir, ignore_errors=True)
+            for record in (cold, warm):
+                results.append(record)
+                print(f"{scanner:22s} {record['phase']:4s} {record['seconds'] * 1000:10.1f} ms "
+                      f"{record['files_per_sec']:11.0f} files/s {record['mb_per_sec']:8.1f} MB/s "
+                      f"{record['peak_rss_mb']:7.1f} MB RSS  -> {record['result']}")
+    return results, page_cache_dropped
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                              capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(old_path, new_path):
+    with open(old_path, 'r') as f:
+        old = {(r['size'], r['scanner'], r['phase']): r for r in json.load(f)['results']}
+    with open(new_path, 'r') as f:
+        new = json.load(f)['results']
+    print(f"\n📊 {old_path} -> {new_path}")
+    print("-" * 78)
+    for record in new:
+        before = old.get((record['size'], record['scanner'], record['phase']))
+        if not before:
+            continue
+        change = (record['seconds'] - before['seconds']) / max(before['seconds'], 1e-9) * 100
+        print(f"{record['size']:7d} {record['scanner']:22s} {record['phase']:4s} "
+              f"{before['seconds'] * 1000:10.1f} -> {record['seconds'] * 1000:10.1f} ms ({change:+6.1f}%)  "
+              f"RSS {before['peak_rss_mb']:.1f} -> {record['peak_rss_mb']:.1f} MB")
+
+
+def main(argv):
+    if argv[:1] == ['--worker']:
+        return _worker(argv[1], argv[2])
+
+    parser = argparse.ArgumentParser(description="Benchmark the repo's tree scanners on synthetic TSX trees.")
+    parser.add_argument('--sizes', default='1000,10000,100000', help="Comma-separated code file counts")
+    parser.add_argument('--density', type=float, default=0.05,
+                        help=f"Fraction of components containing '{TERM}' (default: 0.05)")
+    parser.add_argument('--scanners', default=','.join(SCANNERS),
+                        help=f"Comma-separated subset of: {', '.join(SCANNERS)}")
+    parser.add_argument('--repeat', type=int, default=3, help="Warm runs per scanner; the best is kept (default: 3)")
+    parser.add_argument('--seed', type=int, default=0, help="Tree generator seed (default: 0)")
+    parser.add_argument('--drop-caches', action='store_true',
+                        help="Drop the OS page cache before each cold run (needs root)")
+    parser.add_argument('--out', help="Results file (default: .bench/results-<timestamp>.json)")
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'), help="Print timing deltas between two result files")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    scanners = [s for s in args.scanners.split(',') if s]
+    unknown = [s for s in scanners if s not in SCANNERS]
+    if unknown:
+        parser.error(f"unknown scanner(s): {', '.join(unknown)}")
+    sizes = [int(s) for s in args.sizes.split(',') if s]
+
+    results, dropped = run_benchmarks(sizes, args.density, scanners, max(1, args.repeat), args.seed, args.drop_caches)
+    out = args.out or os.path.join(BENCH_DIR, f"results-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    meta = {'commit': _git_commit(), 'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': platform.python_version(), 'platform': platform.platform(), 'cpu_count': os.cpu_count(),
+            'density': args.density, 'seed': args.seed, 'term': TERM, 'repeat': args.repeat,
+            'page_cache_dropped': dropped}
+    with open(out, 'w') as f:
+        json.dump({'meta': meta, 'results': results}, f, indent=2)
+    print(f"\n💾 Results written to {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,42 +1,425 @@
+import argparse
+import json
+import mmap
 import os
+import re
 import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
-def search_code(term, root_dir='app'):
-    print(f"\n🔍 BOT ACTIVE: Hunting for '{term}' inside '{root_dir}/'...")
+import git_index
+import hunter_daemon
+from fast_walk import walk_files
+from hunter_index import ResultCache, TrigramIndex
+from hunter_patterns import MultiMatcher
+from ts_symbols import SymbolIndex
+
+CODE_EXTENSIONS = ('.tsx', '.ts', '.js', '.jsx', '.css')
+IGNORED_DIRS = ['.next', 'node_modules', '.git', 'out']
+
+
+def iter_code_files(root_dir, source='walk'):
+    """Code file paths under root_dir: 'walk' lists the filesystem, 'git' only tracked files."""
+    if source == 'git':
+        for path, _blob in git_index.iter_tracked_files(root_dir, CODE_EXTENSIONS, IGNORED_DIRS):
+            yield path
+        return
+
+    # Junk folders are pruned before descent; only code files are yielded.
+    yield from walk_files(root_dir, CODE_EXTENSIONS, skip_dirs=IGNORED_DIRS)
+
+
+class Match(namedtuple('Match', 'path line_no line pattern_ids')):
+    __slots__ = ()
+
+    def to_json(self, patterns):
+        return json.dumps({
+            'path': self.path,
+            'line': self.line_no,
+            'patterns': [patterns[i].text for i in self.pattern_ids],
+            'text': self.line.rstrip('\r\n'),
+        }, ensure_ascii=False)
+
+
+def _as_matcher(terms, regexes=()):
+    if isinstance(terms, MultiMatcher):
+        return terms
+    return MultiMatcher.from_terms([terms] if isinstance(terms, str) else terms, regexes)
+
+
+def scan_file(file_path, matcher, max_matches=None):
+    """Return the Matches in one file, reading it line by line.
+
+    Hits are held back until EOF so that a file which later fails to decode
+    contributes nothing, exactly like the old readlines() scan. Memory is
+    bounded by `max_matches`; reaching it stops reading the file early.
+    """
+    matcher = _as_matcher(matcher)
+    hits = []
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                ids = matcher.match_line(line)
+                if ids:
+                    hits.append(Match(file_path, line_no, line, ids))
+                    if max_matches and len(hits) >= max_matches:
+                        break
+    except Exception:
+        # Skip files we can't read
+        return []
+    return hits
+
+
+def _byte_gate(matcher):
+    needles = matcher.byte_needles()
+    if needles is None:
+        return None
+    if len(needles) == 1:
+        return needles[0]
+    return re.compile(b'|'.join(re.escape(n) for n in sorted(set(needles), key=len, reverse=True)))
+
+
+def scan_file_mmap(file_path, matcher, gate, max_file_size=None, max_matches=None):
+    """Search the raw bytes first; only decode and split lines when a needle is present."""
+    try:
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if max_file_size is not None and size > max_file_size:
+                return []
+            if gate is not None:
+                if size == 0:
+                    return []
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    found = mm.find(gate) != -1 if isinstance(gate, bytes) else gate.search(mm) is not None
+                    if not found:
+                        return []
+    except (OSError, ValueError):
+        return []
+    return scan_file(file_path, matcher, max_matches)
+
+
+_worker_scan = None  # (matcher, gate, max_file_size, max_matches), installed once per worker process
+
+
+def _init_scan_worker(matcher, gate, max_file_size, max_matches):
+    global _worker_scan
+    _worker_scan = (matcher, gate, max_file_size, max_matches)
+
+
+def _scan_job(file_path):
+    return file_path, scan_file_mmap(file_path, *_worker_scan)
+
+
+def scan_paths(file_paths, matcher, jobs=1, max_file_size=None, max_per_file=None):
+    """Yield (file_path, hits) in input order, fanning out over `jobs` worker processes."""
+    matcher = _as_matcher(matcher)
+    gate = _byte_gate(matcher)
+    if jobs <= 1:
+        for path in file_paths:
+            yield path, scan_file_mmap(path, matcher, gate, max_file_size, max_per_file)
+        return
+    # The matcher and gate are pickled once per worker; each job carries only its path.
+    pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_scan_worker,
+                               initargs=(matcher, gate, max_file_size, max_per_file))
+    try:
+        # map() keeps submission order, so output stays deterministic.
+        yield from pool.map(_scan_job, file_paths, chunksize=16)
+    finally:
+        # Early exit (limit reached, consumer stopped) drops the queued work.
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _index_candidates(index, matcher):
+    """Union of per-literal candidates, or None when any pattern cannot be narrowed."""
+    if matcher.regexes:
+        return None
+    found = set()
+    for term in matcher.literals:
+        paths = index.candidates(term)
+        if paths is None:
+            return None
+        found |= paths
+    return found
+
+
+def _query_signature(matcher, max_file_size, max_per_file):
+    return json.dumps([[[p.text, p.is_regex] for p in matcher.patterns], max_file_size, max_per_file])
+
+
+def clear_result_cache(root_dir='app'):
+    cache = ResultCache(root_dir)
+    cache.clear()
+    cache.close()
+
+
+def _scan_with_cache(root_dir, file_paths, blobs, matcher, jobs, max_file_size, max_per_file):
+    """scan_paths() that answers unchanged blobs from the ResultCache and only scans the rest."""
+    cache = ResultCache(root_dir)
+    sig = _query_signature(matcher, max_file_size, max_per_file)
+    try:
+        known = cache.lookup(sig, {blobs[path] for path in file_paths})
+        misses = [path for path in file_paths if blobs[path] not in known]
+        scanned = scan_paths(misses, matcher, jobs=jobs, max_file_size=max_file_size, max_per_file=max_per_file)
+        for path in file_paths:
+            blob = blobs[path]
+            if blob in known:
+                yield path, [Match(path, line_no, line, ids) for line_no, line, ids in known[blob]]
+                continue
+            _, hits = next(scanned)
+            known[blob] = [[m.line_no, m.line, m.pattern_ids] for m in hits]
+            cache.store(sig, blob, known[blob])
+            yield path, hits
+    finally:
+        cache.close()
+
+
+def iter_matches(terms, root_dir='app', regexes=(), use_index=True, rebuild_index=False, jobs=1,
+                 max_file_size=None, max_per_file=None, limit=None, source='walk'):
+    """Stream Match records across the tree in walk order, one file at a time.
+
+    `terms` may be a string, a list of literals or a prepared MultiMatcher.
+    max_file_size skips larger files unread, max_per_file stops reading a file
+    after that many matching lines, and limit ends the whole scan.
+    source='git' enumerates tracked files from .git/index (index order) and
+    reuses per-blob results cached by earlier hunts with the same query.
+    """
+    matcher = _as_matcher(terms, regexes)
+    blobs = None
+    if source == 'git':
+        blobs = dict(git_index.iter_tracked_files(root_dir, CODE_EXTENSIONS, IGNORED_DIRS))
+        file_paths = list(blobs)
+    else:
+        file_paths = iter_code_files(root_dir)
+
+    if use_index:
+        file_paths = list(file_paths)
+        index = TrigramIndex(root_dir)
+        try:
+            if rebuild_index:
+                index.clear()
+            index.refresh(file_paths, max_file_size)
+            candidates = _index_candidates(index, matcher)
+        finally:
+            index.close()
+        if candidates is not None:
+            file_paths = [path for path in file_paths if path in candidates]
+
+    if blobs is not None:
+        results = _scan_with_cache(root_dir, file_paths, blobs, matcher, jobs, max_file_size, max_per_file)
+    else:
+        results = scan_paths(file_paths, matcher, jobs=jobs, max_file_size=max_file_size, max_per_file=max_per_file)
+
+    emitted = 0
+    try:
+        for _, hits in results:
+            for match in hits:
+                yield match
+                emitted += 1
+                if limit and emitted >= limit:
+                    return
+    finally:
+        results.close()
+
+
+def iter_matches_via_daemon(terms, root_dir='app', regexes=(), **options):
+    """Like iter_matches, but answered by a running `serve` daemon when one is listening.
+
+    Falls back to a direct scan when no daemon owns `root_dir`; scan-only options
+    (jobs, use_index) are ignored by the daemon, which already holds the tree in memory.
+    """
+    matcher = _as_matcher(terms, regexes)
+    sock = hunter_daemon.connect(root_dir)
+    if sock is None:
+        yield from iter_matches(matcher, root_dir, **options)
+        return
+    caps = {key: options.get(key) for key in ('max_file_size', 'max_per_file', 'limit')}
+    for path, line_no, line, ids in hunter_daemon.query(sock, matcher.patterns, **caps):
+        yield Match(path, line_no, line, ids)
+
+
+def hunt(matcher, root_dir='app', via_daemon=False, **options):
+    """Scan the tree once and return {pattern_id: [Match]}."""
+    matcher = _as_matcher(matcher)
+    grouped = {i: [] for i in range(len(matcher.patterns))}
+    source = iter_matches_via_daemon if via_daemon else iter_matches
+    for match in source(matcher, root_dir, **options):
+        for i in match.pattern_ids:
+            grouped[i].append(match)
+    return grouped
+
+
+def _print_hit(match):
+    print(f"📍 {match.path} [Line {match.line_no}]")
+    print(f"   👉 {match.line.strip()[:100]}") # Show preview
+    print("")
+
+
+def search_code(term, root_dir='app', regexes=(), output='text', via_daemon=False, **options):
+    matcher = _as_matcher(term, regexes)
+    patterns = matcher.patterns
+    source = iter_matches_via_daemon if via_daemon else iter_matches
+
+    if output == 'jsonl':
+        last_path = None
+        found_count = 0
+        for match in source(matcher, root_dir, **options):
+            if last_path is not None and match.path != last_path:
+                sys.stdout.flush()
+            sys.stdout.write(match.to_json(patterns) + "\n")
+            last_path = match.path
+            found_count += 1
+        sys.stdout.flush()
+        return found_count
+
+    if len(patterns) == 1:
+        print(f"\n🔍 BOT ACTIVE: Hunting for {patterns[0].label} inside '{root_dir}/'...")
+    else:
+        print(f"\n🔍 BOT ACTIVE: Hunting for {len(patterns)} patterns inside '{root_dir}/' (single pass)...")
     print("-" * 60)
-    
-    found_count = 0
-    
-    for root, dirs, files in os.walk(root_dir):
-        # 1. Ignore junk folders
-        dirs[:] = [d for d in dirs if d not in ['.next', 'node_modules', '.git', 'out']]
-        
-        for file in files:
-            # 2. Only check code files
-            if file.endswith(('.tsx', '.ts', '.js', '.jsx', '.css')):
-                file_path = os.path.join(root, file)
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        for i, line in enumerate(lines):
-                            if term in line:
-                                found_count += 1
-                                print(f"📍 {file_path} [Line {i+1}]")
-                                print(f"   👉 {line.strip()[:100]}") # Show preview
-                                print("")
-                except Exception as e:
-                    # Skip files we can't read
-                    continue
+
+    if len(patterns) == 1:
+        found_count = 0
+        for match in source(matcher, root_dir, **options):
+            found_count += 1
+            _print_hit(match)
+        counts = [found_count]
+    else:
+        grouped = hunt(matcher, root_dir, via_daemon=via_daemon, **options)
+        counts = [len(grouped[i]) for i in range(len(patterns))]
+        found_count = len({(m.path, m.line_no) for hits in grouped.values() for m in hits})
+        for i, pattern in enumerate(patterns):
+            print(f"🎯 {pattern.label} ({counts[i]} hits)")
+            print("")
+            for match in grouped[i]:
+                _print_hit(match)
 
     print("-" * 60)
     if found_count == 0:
-        print(f"✅ CLEAN: The term '{term}' was NOT found in any file.")
+        if len(patterns) == 1:
+            print(f"✅ CLEAN: The term {patterns[0].label} was NOT found in any file.")
+        else:
+            print(f"✅ CLEAN: None of the {len(patterns)} patterns were found in any file.")
     else:
-        print(f"⚠️  FOUND: Detected {found_count} instances.")
+        print(f"⚠️  FOUND: Detected {sum(counts)} instances.")
+        if len(patterns) > 1:
+            for i, pattern in enumerate(patterns):
+                print(f"   {pattern.label}: {counts[i]}")
+        if options.get('limit') and found_count >= options['limit']:
+            print(f"⏹️  Stopped early at the --limit of {options['limit']} matching lines.")
+    return found_count
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
+
+def _read_line(path, line_no):
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for i, line in enumerate(f, 1):
+            if i == line_no:
+                return line
+    return ''
+
+
+def search_symbol(symbol, module=None, root_dir='app', source='walk'):
+    """Report files importing `symbol` (from `module` when given), answered from the symbol index."""
+    origin = f" imported from '{module}'" if module else ""
+    print(f"\n🔍 BOT ACTIVE: Hunting symbol '{symbol}'{origin} inside '{root_dir}/'...")
+    print("-" * 60)
+
+    index = SymbolIndex(root_dir)
+    index.refresh(iter_code_files(root_dir, source=source))
+    results = index.find(symbol, module)
+    for path, import_lines, jsx_lines in results:
+        for line_no in import_lines:
+            print(f"📍 {path} [Line {line_no}]")
+            print(f"   👉 {_read_line(path, line_no).strip()[:100]}")
+        if jsx_lines:
+            print(f"   🧩 Rendered as an element on line(s) {', '.join(str(n) for n in jsx_lines)}")
+        print("")
+
+    exports = [] if module else index.find_exports(symbol)
+    for path, line_no, reexported_from in exports:
+        via = f" (re-exported from '{reexported_from}')" if reexported_from else ""
+        print(f"📦 {path} [Line {line_no}] exports '{symbol}'{via}")
+    if exports:
+        print("")
+
+    print("-" * 60)
+    if not results and not exports:
+        print(f"✅ CLEAN: No file imports '{symbol}'{origin}.")
+    else:
+        print(f"⚠️  FOUND: {len(results)} file(s) import '{symbol}'{origin}.")
+        if exports:
+            print(f"   {len(exports)} export site(s) declare it.")
+    return len(results)
+
+
+def _size(text):
+    """Parse a byte count such as 500000, 512k or 2m."""
+    text = text.strip().lower()
+    scale = {'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}.get(text[-1:], 1)
+    if scale != 1:
+        text = text[:-1]
+    return int(float(text) * scale)
+
+
+def main(argv):
+    if not argv:
         print("Usage: python3 code_hunter.py \"<text to find>\"")
+        print("       python3 code_hunter.py serve [--root app]       (keep the tree in memory)")
+        print("       python3 code_hunter.py query \"<text to find>\"   (ask the daemon, else scan)")
         print("Example: python3 code_hunter.py \"Search\"")
-    else:
-        search_code(sys.argv[1])
+        return 0
+
+    if argv[0] == 'serve':
+        serve_parser = argparse.ArgumentParser(prog="code_hunter.py serve",
+                                               description="Serve in-memory hunts over a Unix socket.")
+        serve_parser.add_argument('--root', default='app', help="Directory to serve (default: app)")
+        serve_parser.add_argument('--interval', type=float, default=1.0,
+                                  help="Seconds between mtime polls when inotify is unavailable (default: 1)")
+        serve_args = serve_parser.parse_args(argv[1:])
+        return hunter_daemon.serve(serve_args.root, iter_code_files, interval=serve_args.interval)
+
+    via_daemon = argv[0] == 'query'
+    if via_daemon:
+        argv = argv[1:]
+
+    parser = argparse.ArgumentParser(description="Hunt for literal strings and regexes across the code tree. "
+                                                 "Use `-- serve` to hunt for the literal word 'serve'.")
+    parser.add_argument('terms', nargs='*', help="Literal text to find (any number, matched in one pass)")
+    parser.add_argument('--regex', '-e', action='append', default=[], metavar='PATTERN',
+                        help="Python regex to find (repeatable)")
+    parser.add_argument('--symbol', metavar='NAME',
+                        help="Find files importing NAME (and where it is rendered as <NAME>) via the symbol index")
+    parser.add_argument('--from', dest='module', metavar='MODULE',
+                        help="With --symbol: only imports from MODULE ('lucide-react', '@/lib/supabase/client', ...)")
+    parser.add_argument('--root', default='app', help="Directory to scan (default: app)")
+    parser.add_argument('--git', action='store_true',
+                        help="Only hunt tracked files (read from .git/index) and reuse per-blob cached results")
+    parser.add_argument('--no-index', action='store_true', help="Skip the trigram index and scan every file")
+    parser.add_argument('--rebuild-index', action='store_true', help="Drop the cached trigram index before searching")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="Worker processes for the file scan (0 = one per CPU, default: 1)")
+    parser.add_argument('--format', choices=['text', 'jsonl'], default='text',
+                        help="text = annotated report; jsonl = one JSON object per matching line")
+    parser.add_argument('--max-file-size', type=_size, default=None, metavar='BYTES',
+                        help="Skip files larger than this (e.g. 512k, 2m)")
+    parser.add_argument('--max-per-file', type=int, default=None, metavar='N',
+                        help="Stop reading a file after N matching lines")
+    parser.add_argument('--limit', type=int, default=None, metavar='N',
+                        help="Stop the whole hunt after N matching lines")
+    args = parser.parse_args(argv)
+    if args.module and not args.symbol:
+        parser.error("--from requires --symbol")
+    if args.symbol:
+        search_symbol(args.symbol, args.module, root_dir=args.root, source='git' if args.git else 'walk')
+        return 0
+    if not args.terms and not args.regex:
+        parser.error("give at least one term or --regex")
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    search_code(args.terms, root_dir=args.root, regexes=args.regex, output=args.format, via_daemon=via_daemon,
+                source='git' if args.git else 'walk', use_index=not args.no_index, rebuild_index=args.rebuild_index, jobs=jobs,
+                max_file_size=args.max_file_size, max_per_file=args.max_per_file, limit=args.limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,408 @@
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Transactional multi-file writer for the codemod scripts.
+#
+#   with CodemodTransaction() as txn:
+#       txn.replace_tree('app/components/vendor-risk')   # files not rewritten below are removed
+#       txn.write('app/components/vendor-risk/DocumentList.tsx', code_list)
+#
+# Nothing under the project is touched until the block exits cleanly. Every
+# output is first staged (and fsynced) in .codemod/<txn>/staged/, the previous
+# contents are hardlinked into .codemod/<txn>/backup/ and listed in
+# .codemod/<txn>/journal.json, and only then are the targets swapped in with
+# back-to-back os.replace() calls - so the dev server sees one burst of
+# complete files instead of a deleted directory and a trickle of rewrites.
+# If applying fails the journal is replayed backwards; a transaction left
+# behind by a crash is rolled back by the next one (or `codemod_io.py recover`).
+# Each transaction holds an exclusive flock on .codemod/lock while it lives, so
+# a second codemod on the same root waits instead of interleaving; recovery only
+# touches transactions whose owning process (the pid in the id) is gone, so a
+# nested transaction in the same process never disturbs the outer one.
+#
+# Writes whose content matches the file on disk are skipped outright (no
+# staging, no rename, mtime untouched), so re-running a codemod that is
+# already applied triggers no Next.js/Turbopack recompile at all. Each commit
+# prints how many files it wrote, removed and skipped.
+#
+# Usage: python3 codemod_io.py status | recover
+
+TXN_DIR = '.codemod'
+LOCK_NAME = 'lock'
+
+_locks = {}  # realpath of a transaction root -> [lock fd, depth] held by this process
+_sequence = 0
+
+
+def _acquire_lock(root):
+    """Exclusive lock on <root>/.codemod/lock; re-entrant within this process."""
+    key = os.path.realpath(root)
+    held = _locks.get(key)
+    if held:
+        held[1] += 1
+        return
+    txn_root = os.path.join(root, TXN_DIR)
+    os.makedirs(txn_root, exist_ok=True)
+    fd = os.open(os.path.join(txn_root, LOCK_NAME), os.O_RDWR | os.O_CREAT, 0o644)
+    if fcntl is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            print(f"⏳ Waiting for another codemod transaction in {key} to finish...")
+            fcntl.flock(fd, fcntl.LOCK_EX)
+    _locks[key] = [fd, 1]
+
+
+def _release_lock(root):
+    key = os.path.realpath(root)
+    held = _locks.get(key)
+    if not held:
+        return
+    held[1] -= 1
+    if held[1] == 0:
+        del _locks[key]
+        os.close(held[0])  # closing the descriptor drops the flock; the lock file itself stays
+
+
+def _next_sequence():
+    """Distinguishes transactions this process opens within the same second (e.g. nested ones)."""
+    global _sequence
+    _sequence += 1
+    return _sequence
+
+
+def _owner_pid(txn_id):
+    """The pid embedded in a transaction id ('YYYYmmdd-HHMMSS-<pid>[-<seq>]'), or None."""
+    parts = txn_id.split('-')
+    try:
+        return int(parts[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    if os.name == 'nt':
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return False
+        code = ctypes.c_ulong()
+        kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+        kernel32.CloseHandle(handle)
+        return code.value == 259  # STILL_ACTIVE
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by someone else
+    return True
+
+
+def _fsync_dir(path):
+    try:
+        fd = os.open(path or '.', os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_json(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=1)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_dir(os.path.dirname(path))
+
+
+def _preserve(target, backup):
+    """Keep `target`'s current content at `backup` (a hardlink, or a copy where links are unsupported)."""
+    os.makedirs(os.path.dirname(backup), exist_ok=True)
+    try:
+        os.link(target, backup)
+    except OSError:
+        shutil.copy2(target, backup)
+
+
+class CodemodTransaction:
+    def __init__(self, root='.', label=None):
+        self.root = root
+        self.label = label or os.path.basename(sys.argv[0] or 'codemod')
+        self.txn_root = os.path.join(root, TXN_DIR)
+        _acquire_lock(root)
+        try:
+            recover(root)  # a crashed earlier run must not be mixed with this one
+            self.id = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{_next_sequence()}"
+            self.dir = os.path.join(self.txn_root, self.id)
+            self.staged_dir = os.path.join(self.dir, 'staged')
+            self.backup_dir = os.path.join(self.dir, 'backup')
+            self.writes = {}     # relative path -> staged path
+            self.unchanged = set()  # writes skipped because the file already has that content
+            self.removals = set()
+            self.trees = []      # directories whose unwritten files are removed on commit
+            self.done = False
+            os.makedirs(self.staged_dir)
+        except BaseException:
+            _release_lock(root)
+            raise
+
+    def _rel(self, path):
+        rel = os.path.relpath(os.path.join(self.root, path), self.root)
+        if rel.startswith('..') or os.path.isabs(rel):
+            raise ValueError(f"{path} is outside the transaction root {self.root}")
+        return rel
+
+    def write(self, path, content):
+        """Stage `content` (str or bytes) for `path`; returns False if the file already holds exactly that."""
+        rel = self._rel(path)
+        target = os.path.join(self.root, rel)
+        staged = os.path.join(self.staged_dir, rel)
+        data = content.encode('utf-8') if isinstance(content, str) else content
+        self.removals.discard(rel)
+        if _same_content(target, data):
+            if self.writes.pop(rel, None):
+                os.remove(staged)
+            self.unchanged.add(rel)
+            return False
+        self.unchanged.discard(rel)
+        os.makedirs(os.path.dirname(staged), exist_ok=True)
+        with open(staged, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(target):
+            shutil.copymode(target, staged)
+        self.writes[rel] = staged
+        return True
+
+    def remove(self, path):
+        rel = self._rel(path)
+        self.writes.pop(rel, None)
+        self.unchanged.discard(rel)
+        self.removals.add(rel)
+
+    def replace_tree(self, directory):
+        """Treat `directory` as rebuilt from scratch: any file in it not written in this transaction is removed."""
+        self.trees.append(self._rel(directory))
+
+    def _plan(self):
+        """[(rel, action, existed)] in apply order: writes, then removals."""
+        removals = set(self.removals)
+        for tree in self.trees:
+            top = os.path.join(self.root, tree)
+            for dirpath, _, files in os.walk(top):
+                for name in files:
+                    rel = os.path.relpath(os.path.join(dirpath, name), self.root)
+                    if rel not in self.writes and rel not in self.unchanged:
+                        removals.add(rel)
+        plan = [(rel, 'write', os.path.lexists(os.path.join(self.root, rel))) for rel in sorted(self.writes)]
+        plan += [(rel, 'remove', True) for rel in sorted(removals) if os.path.lexists(os.path.join(self.root, rel))]
+        return plan
+
+    def commit(self):
+        if self.done:
+            return []
+        plan = self._plan()
+        if not plan:
+            self.abort()
+            print(f"💤 {self.label}: nothing to write, {len(self.unchanged)} file(s) already up to date")
+            return plan
+        journal = {'id': self.id, 'label': self.label, 'state': 'applying', 'trees': self.trees,
+                   'ops': [{'path': rel, 'action': action, 'existed': existed} for rel, action, existed in plan],
+                   'created_dirs': []}
+        try:
+            for rel, _, existed in plan:
+                if existed:
+                    _preserve(os.path.join(self.root, rel), os.path.join(self.backup_dir, rel))
+            created = set()
+            for rel, action, _ in plan:
+                parent = os.path.dirname(rel)
+                while action == 'write' and parent and not os.path.isdir(os.path.join(self.root, parent)):
+                    created.add(parent)
+                    parent = os.path.dirname(parent)
+            journal['created_dirs'] = sorted(created)
+            _write_json(os.path.join(self.dir, 'journal.json'), journal)
+        except BaseException:
+            self.abort()  # nothing applied yet
+            raise
+
+        started = time.perf_counter()
+        try:
+            for rel, action, _ in plan:
+                target = os.path.join(self.root, rel)
+                if action == 'write':
+                    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+                    os.replace(self.writes[rel], target)
+                else:
+                    os.remove(target)
+            for tree in self.trees:
+                _prune_empty_dirs(os.path.join(self.root, tree))
+        except BaseException:
+            try:
+                _rollback(self.root, self.dir, journal)
+            finally:
+                self._finish()
+            raise
+        window = (time.perf_counter() - started) * 1000
+        journal['state'] = 'committed'
+        _write_json(os.path.join(self.dir, 'journal.json'), journal)
+        shutil.rmtree(self.dir, ignore_errors=True)
+        self._finish()
+        written = sum(1 for _, action, _ in plan if action == 'write')
+        print(f"💾 {self.label}: {written} written, {len(plan) - written} removed, "
+              f"{len(self.unchanged)} unchanged (skipped) in a {window:.1f} ms window")
+        return plan
+
+    def abort(self):
+        """Drop everything staged; the project tree was never touched."""
+        if not self.done:
+            shutil.rmtree(self.dir, ignore_errors=True)
+            self._finish()
+
+    def _finish(self):
+        self.done = True
+        _release_lock(self.root)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+        return False
+
+
+def _same_content(path, data):
+    """True if `path` is a regular file holding exactly `data` (size is checked before reading)."""
+    try:
+        if os.path.getsize(path) != len(data):
+            return False
+        with open(path, 'rb') as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _prune_empty_dirs(top):
+    """Remove now-empty directories below `top` (what rmtree + rewrite would have left absent)."""
+    for dirpath, _, _ in sorted(os.walk(top), key=lambda entry: entry[0], reverse=True):
+        if dirpath != top:
+            _remove_if_empty(dirpath)
+
+
+def _remove_if_empty(path):
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def _rollback(root, txn_dir, journal):
+    """Put every journaled path back as it was; safe to repeat and safe for ops never applied."""
+    backup_dir = os.path.join(txn_dir, 'backup')
+    for op in reversed(journal['ops']):
+        target = os.path.join(root, op['path'])
+        backup = os.path.join(backup_dir, op['path'])
+        if op['existed']:
+            if os.path.lexists(backup):
+                os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+                os.replace(backup, target)
+        elif os.path.lexists(target):
+            os.remove(target)
+    for rel in sorted(journal['created_dirs'], reverse=True):
+        _remove_if_empty(os.path.join(root, rel))
+    journal['state'] = 'rolled back'
+    _write_json(os.path.join(txn_dir, 'journal.json'), journal)
+    shutil.rmtree(txn_dir, ignore_errors=True)
+    _remove_if_empty(os.path.dirname(txn_dir))
+
+
+def pending(root='.'):
+    """[(txn id, state, label)] for transactions in .codemod/, live or left by an interrupted run."""
+    txn_root = os.path.join(root, TXN_DIR)
+    try:
+        names = sorted(os.listdir(txn_root))
+    except OSError:
+        return []
+    found = []
+    for name in names:
+        if not os.path.isdir(os.path.join(txn_root, name)):
+            continue  # the lock file
+        try:
+            with open(os.path.join(txn_root, name, 'journal.json'), 'r') as f:
+                journal = json.load(f)
+            found.append((name, journal['state'], journal.get('label')))
+        except (OSError, ValueError):
+            found.append((name, 'staging', None))  # never reached the apply phase
+    return found
+
+
+def recover(root='.'):
+    """Roll back interrupted transactions and drop unfinished staging areas; returns the ids handled.
+
+    Transactions whose owning process is still alive (including this one) are left alone.
+    """
+    txn_root = os.path.join(root, TXN_DIR)
+    handled = []
+    if not os.path.isdir(txn_root):
+        return handled
+    _acquire_lock(root)
+    try:
+        for name, state, label in pending(root):
+            pid = _owner_pid(name)
+            if pid is not None and _pid_alive(pid):
+                continue
+            txn_dir = os.path.join(txn_root, name)
+            if state == 'applying':
+                with open(os.path.join(txn_dir, 'journal.json'), 'r') as f:
+                    _rollback(root, txn_dir, json.load(f))
+                print(f"⏪ Rolled back interrupted codemod transaction {name} ({label})")
+            else:
+                shutil.rmtree(txn_dir, ignore_errors=True)
+            handled.append(name)
+    finally:
+        _release_lock(root)
+    return handled
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Inspect or recover interrupted codemod transactions.")
+    parser.add_argument('command', choices=('status', 'recover'))
+    parser.add_argument('--root', default='.', help="Project root the codemods ran in (default: .)")
+    args = parser.parse_args(argv)
+    if args.command == 'status':
+        found = pending(args.root)
+        for name, state, label in found:
+            pid = _owner_pid(name)
+            owner = 'running' if pid is not None and _pid_alive(pid) else 'interrupted'
+            print(f"{name}  {state:10s}  {owner:11s}  {label or ''}")
+        if not found:
+            print("✅ No pending transactions")
+        return 0
+    print(f"✅ Recovered {len(recover(args.root))} transaction(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
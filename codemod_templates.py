@@ -0,0 +1,451 @@
+import argparse
+import ast
+import difflib
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from functools import lru_cache
+
+from codemod_io import TXN_DIR, CodemodTransaction
+
+# Deduplicated store for the TSX payloads the root-level codemod scripts write.
+#
+#   template_store/bases/<family>.<ext>   one base text per target file ("family")
+#   template_store/variants.json          every variant as a line delta against its family base,
+#                                         plus per-script recipes: [[variant, target], ...]
+#
+# Variant ids are "<script stem>.<variable>", e.g. "restore_1pm.drawer_code". The
+# scripts load their payloads with load_variant() instead of embedding them, and
+# every script's writes can be replayed as "apply variant X to file Y":
+#
+#   python3 codemod_templates.py list [--family DocumentList]
+#   python3 codemod_templates.py show restore_1pm.drawer_code
+#   python3 codemod_templates.py apply restore_1pm.drawer_code [--to path]
+#   python3 codemod_templates.py run restore_1pm          (replay that script's recorded writes)
+#   python3 codemod_templates.py add my_fix.list_code FILE --target app/components/vendor-risk/DocumentList.tsx
+#   python3 codemod_templates.py verify
+#   python3 codemod_templates.py extract SCRIPT.py ...    (move a script's embedded payloads into the store)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STORE_DIR = os.path.join(HERE, 'template_store')
+SCHEMA_VERSION = 1
+SCRATCH_ROOTS = ('app/components/vendor-risk', 'app/reports/vendor-risk')
+_DEFAULT_EXPORT = re.compile(r'export default function (\w+)')
+
+
+# ---------------------------------------------------------
+# DELTAS
+# ---------------------------------------------------------
+
+def make_delta(base, text):
+    """Line opcodes turning `base` into `text`: [[start, end, replacement], ...] over base lines."""
+    base_lines = base.splitlines(keepends=True)
+    text_lines = text.splitlines(keepends=True)
+    matcher = difflib.SequenceMatcher(None, base_lines, text_lines, autojunk=False)
+    return [[i1, i2, ''.join(text_lines[j1:j2])]
+            for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != 'equal']
+
+
+def apply_delta(base, delta):
+    base_lines = base.splitlines(keepends=True)
+    out, pos = [], 0
+    for start, end, replacement in delta:
+        out.extend(base_lines[pos:start])
+        out.append(replacement)
+        pos = end
+    out.extend(base_lines[pos:])
+    return ''.join(out)
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _delta_size(delta):
+    return sum(len(replacement) + 8 for _, _, replacement in delta)
+
+
+# ---------------------------------------------------------
+# LOADER
+# ---------------------------------------------------------
+
+@lru_cache(maxsize=None)
+def _load_store(store_dir):
+    path = os.path.join(store_dir, 'variants.json')
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            store = json.load(f)
+    except FileNotFoundError:
+        return {'version': SCHEMA_VERSION, 'revision': 0, 'families': {}, 'variants': {}, 'recipes': {}}
+    if store.get('version') != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported template store version {store.get('version')!r}")
+    return store
+
+
+@lru_cache(maxsize=None)
+def _load_base(store_dir, family):
+    info = _load_store(store_dir)['families'][family]
+    with open(os.path.join(store_dir, 'bases', info['base']), 'r', encoding='utf-8', newline='') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=None)
+def _render(store_dir, variant_id):
+    store = _load_store(store_dir)
+    try:
+        variant = store['variants'][variant_id]
+    except KeyError:
+        raise KeyError(f"Unknown template variant '{variant_id}'") from None
+    text = apply_delta(_load_base(store_dir, variant['family']), variant['delta'])
+    if _sha256(text) != variant['sha256']:
+        raise ValueError(f"Template variant '{variant_id}' does not match its recorded hash; "
+                         f"was template_store/ edited by hand?")
+    return text
+
+
+def load_variant(variant_id, store_dir=STORE_DIR):
+    """The exact text of a stored variant (rebuilt from base + delta once per process)."""
+    return _render(store_dir, variant_id)
+
+
+def load_store(store_dir=STORE_DIR):
+    """The parsed variants.json (families, variants, recipes); cached per process, do not mutate."""
+    return _load_store(store_dir)
+
+
+def variant_target(variant_id, store_dir=STORE_DIR):
+    return _load_store(store_dir)['variants'][variant_id]['target']
+
+
+def apply_variant(variant_id, target=None, store_dir=STORE_DIR, txn=None):
+    """Write a variant to `target` (default: the file it was written to originally); returns the path.
+
+    Goes through `txn` when given, otherwise a one-file transaction, so an
+    unchanged target is left alone.
+    """
+    target = target or variant_target(variant_id, store_dir)
+    if txn is not None:
+        txn.write(target, load_variant(variant_id, store_dir))
+        return target
+    inside = not os.path.relpath(os.path.abspath(target)).startswith('..')
+    with CodemodTransaction('.' if inside else os.path.dirname(os.path.abspath(target)),
+                            label=variant_id) as own:
+        own.write(os.path.relpath(os.path.abspath(target), own.root), load_variant(variant_id, store_dir))
+    return target
+
+
+def run_recipe(script, store_dir=STORE_DIR):
+    """Replay the writes a codemod script makes, in one transaction; returns [(variant, target)]."""
+    name = os.path.splitext(os.path.basename(script))[0]
+    try:
+        steps = _load_store(store_dir)['recipes'][name]
+    except KeyError:
+        raise KeyError(f"No recipe recorded for '{name}'") from None
+    with CodemodTransaction(label=name) as txn:
+        for variant_id, target in steps:
+            apply_variant(variant_id, target, store_dir, txn)
+    return steps
+
+
+# ---------------------------------------------------------
+# STORE MAINTENANCE
+# ---------------------------------------------------------
+
+def _family_for_target(target):
+    stem, ext = os.path.splitext(os.path.basename(target))
+    if stem in ('page', 'index', 'layout'):
+        stem = f"{os.path.basename(os.path.dirname(target))}_{stem}"
+    return stem, ext
+
+
+class TemplateStore:
+    """Mutable view of template_store/ used by extract/add; rebases families on save."""
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        _load_store.cache_clear()
+        store = _load_store(store_dir)
+        self.revision = store.get('revision', 0)
+        self.families = {name: dict(info) for name, info in store['families'].items()}
+        self.recipes = {name: list(steps) for name, steps in store['recipes'].items()}
+        self.texts = {}     # variant id -> full text
+        self.meta = {}      # variant id -> {family, target, source}
+        for variant_id, variant in store['variants'].items():
+            self.texts[variant_id] = _render(store_dir, variant_id)
+            self.meta[variant_id] = {key: variant[key] for key in ('family', 'target', 'source')}
+
+    def add(self, variant_id, text, target, source=None):
+        family, ext = _family_for_target(target)
+        self.families.setdefault(family, {'base': f"{family}{ext}", 'target': target})
+        self.texts[variant_id] = text
+        self.meta[variant_id] = {'family': family, 'target': target, 'source': source}
+
+    def guess_target(self, text):
+        """Target of the stored variant most like `text`, for payloads a script never wrote.
+
+        A variant exporting the same default component wins; otherwise the one
+        sharing the most lines, if it shares at least half of them.
+        """
+        component = _DEFAULT_EXPORT.search(text)
+        if component:
+            for variant_id, other in self.texts.items():
+                match = _DEFAULT_EXPORT.search(other)
+                if match and match.group(1) == component.group(1):
+                    return self.meta[variant_id]['target']
+        lines = text.splitlines()
+        best, best_ratio = None, 0.5
+        for variant_id, other in self.texts.items():
+            ratio = difflib.SequenceMatcher(None, lines, other.splitlines(), autojunk=False).ratio()
+            if ratio > best_ratio:
+                best, best_ratio = self.meta[variant_id]['target'], ratio
+        return best
+
+    def save(self):
+        """Pick each family's base (the variant with the smallest total delta to its siblings) and write the store."""
+        bases_dir = os.path.join(self.store_dir, 'bases')
+        os.makedirs(bases_dir, exist_ok=True)
+        variants = {}
+        keep = set()
+        for family, info in sorted(self.families.items()):
+            members = sorted(v for v, meta in self.meta.items() if meta['family'] == family)
+            if not members:
+                continue
+            base = min((self.texts[m] for m in members),
+                       key=lambda candidate: sum(_delta_size(make_delta(candidate, self.texts[m])) for m in members))
+            with open(os.path.join(bases_dir, info['base']), 'w', encoding='utf-8', newline='') as f:
+                f.write(base)
+            keep.add(info['base'])
+            for member in members:
+                variants[member] = dict(self.meta[member], sha256=_sha256(self.texts[member]),
+                                        delta=make_delta(base, self.texts[member]))
+        for name in os.listdir(bases_dir):
+            if name not in keep:
+                os.remove(os.path.join(bases_dir, name))
+        self.revision += 1
+        store = {'version': SCHEMA_VERSION, 'revision': self.revision,
+                 'families': {f: i for f, i in sorted(self.families.items()) if i['base'] in keep},
+                 'variants': dict(sorted(variants.items())),
+                 'recipes': dict(sorted(self.recipes.items()))}
+        path = os.path.join(self.store_dir, 'variants.json')
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(store, f, indent=1, ensure_ascii=False)
+            f.write("\n")
+        os.replace(path + '.tmp', path)
+        for cache in (_load_store, _load_base, _render):
+            cache.cache_clear()
+
+
+def _parse_tolerant(source):
+    """AST of the longest parseable prefix (some scripts carry pasted shell after the Python)."""
+    lines = source.split('\n')
+    while True:
+        try:
+            return ast.parse('\n'.join(lines)), len(lines)
+        except SyntaxError as e:
+            if not e.lineno or e.lineno <= 1:
+                raise
+            lines = lines[:e.lineno - 1]
+
+
+def _payloads(tree):
+    """[(name, text, node)] for module-level `name = \"\"\"...\"\"\"` multi-line string assignments."""
+    found = []
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, ast.Constant) and isinstance(node.value.value, str)
+                and '\n' in node.value.value):
+            found.append((node.targets[0].id, node.value.value, node.value))
+    return found
+
+
+def _scratch_writes(script, roots=SCRATCH_ROOTS):
+    """Run `script` against a scratch copy of the roots; returns {relative path: text} it left changed."""
+    scratch = tempfile.mkdtemp(prefix='codemod-extract-')
+    try:
+        before = {}
+        for root in roots:
+            source = os.path.join(HERE, root)
+            if os.path.isdir(source):
+                shutil.copytree(source, os.path.join(scratch, root))
+            else:
+                os.makedirs(os.path.join(scratch, root))
+        for dirpath, _, files in os.walk(scratch):
+            for name in files:
+                path = os.path.join(dirpath, name)
+                with open(path, 'rb') as f:
+                    before[os.path.relpath(path, scratch)] = f.read()
+        subprocess.run([sys.executable, os.path.abspath(script)], cwd=scratch, capture_output=True, timeout=120)
+        after = {}
+        for dirpath, dirs, files in os.walk(scratch):
+            if dirpath == scratch and TXN_DIR in dirs:
+                dirs.remove(TXN_DIR)  # transaction bookkeeping (the lock file), not a codemod output
+            for name in files:
+                path = os.path.join(dirpath, name)
+                rel = os.path.relpath(path, scratch)
+                with open(path, 'rb') as f:
+                    data = f.read()
+                if before.get(rel) != data:
+                    after[rel.replace(os.sep, '/')] = data.decode('utf-8', errors='replace')
+        return after
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def extract_scripts(store, scripts, rewrite=True):
+    """Move scripts' embedded payloads into `store` and (optionally) replace them with load_variant() calls.
+
+    Targets and each script's recipe (every file it writes, in path order) come
+    from running it against a scratch copy of the vendor-risk trees; files written
+    from inline literals are stored too. Payloads a script did not write there
+    (conditional or unused ones) are filed under the target of the most similar
+    variant once every script's observed writes are in. Recipes replay writes
+    only, not a script's deletions. Returns {script: [variant ids]}.
+    """
+    parsed, unmatched = [], []
+    for script in scripts:
+        with open(script, 'r', encoding='utf-8') as f:
+            source = f.read()
+        tree, _ = _parse_tolerant(source)
+        payloads = _payloads(tree)
+        stem = os.path.splitext(os.path.basename(script))[0]
+        writes = _scratch_writes(script)
+        by_text = {}
+        for rel, text in sorted(writes.items()):
+            by_text.setdefault(text, rel)
+        recipe = []
+        for name, text, _ in payloads:
+            origin = f"{os.path.basename(script)}:{name}"
+            if text in by_text:
+                store.add(f"{stem}.{name}", text, by_text[text], source=origin)
+            else:
+                unmatched.append((f"{stem}.{name}", text, origin))
+        for rel, text in sorted(writes.items()):
+            variant_id = next((f"{stem}.{name}" for name, payload, _ in payloads if payload == text), None)
+            if variant_id is None:
+                # Written from an inline literal or computed text: keep it so the recipe is complete.
+                variant_id = f"{stem}.{_family_for_target(rel)[0]}"
+                store.add(variant_id, text, rel, source=f"{os.path.basename(script)} (inline)")
+            recipe.append([variant_id, rel])
+        if recipe:
+            store.recipes[stem] = recipe
+        parsed.append((script, stem, source, payloads))
+
+    for variant_id, text, origin in unmatched:
+        target = store.guess_target(text)
+        if target is None:
+            raise ValueError(f"{origin}: cannot tell which file this payload belongs to")
+        store.add(variant_id, text, target, source=origin)
+
+    extracted = {}
+    for script, stem, source, payloads in parsed:
+        extracted[script] = [f"{stem}.{name}" for name, _, _ in payloads]
+        if not rewrite or not payloads:
+            continue
+        lines = source.split('\n')
+        # Replace from the bottom up so earlier line numbers stay valid.
+        for name, _, node in sorted(payloads, key=lambda p: p[2].lineno, reverse=True):
+            first, last = node.lineno - 1, node.end_lineno - 1
+            head = lines[first][:node.col_offset]
+            tail = lines[last][node.end_col_offset:]
+            lines[first:last + 1] = [f"{head}load_variant('{stem}.{name}'){tail}"]
+        with open(script, 'w', encoding='utf-8') as f:
+            f.write(_add_import('\n'.join(lines)))
+    return extracted
+
+
+def _add_import(source):
+    """Insert `from codemod_templates import load_variant` after the script's leading imports."""
+    statement = "from codemod_templates import load_variant"
+    if statement in source:
+        return source
+    lines = source.split('\n')
+    insert_at = 0
+    for i, line in enumerate(lines):
+        if line.startswith(('import ', 'from ')):
+            insert_at = i + 1
+        elif line.strip() and not line.startswith('#') and insert_at:
+            break
+    if insert_at == 0:
+        lines.insert(0, statement)
+        lines.insert(1, '')
+    else:
+        lines.insert(insert_at, statement)
+    return '\n'.join(lines)
+
+
+# ---------------------------------------------------------
+# CLI
+# ---------------------------------------------------------
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Deduplicated TSX payloads for the codemod scripts.")
+    commands = parser.add_subparsers(dest='command', required=True)
+    listing = commands.add_parser('list', help="List variants")
+    listing.add_argument('--family')
+    show = commands.add_parser('show', help="Print a variant")
+    show.add_argument('variant')
+    apply = commands.add_parser('apply', help="Write a variant to its target (or --to)")
+    apply.add_argument('variant')
+    apply.add_argument('--to', help="Destination file")
+    run = commands.add_parser('run', help="Replay a script's recorded writes")
+    run.add_argument('script')
+    add = commands.add_parser('add', help="Store a file as a new variant")
+    add.add_argument('variant')
+    add.add_argument('file')
+    add.add_argument('--target', required=True, help="File the variant belongs to")
+    commands.add_parser('verify', help="Rebuild every variant and check its hash")
+    extract = commands.add_parser('extract', help="Move scripts' embedded payloads into the store")
+    extract.add_argument('scripts', nargs='+')
+    extract.add_argument('--no-rewrite', action='store_true', help="Store the payloads but leave the scripts alone")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'list':
+            store = _load_store(STORE_DIR)
+            for variant_id, variant in store['variants'].items():
+                if args.family and variant['family'] != args.family:
+                    continue
+                changed = sum(end - start for start, end, _ in variant['delta'])
+                print(f"{variant_id:48s} {variant['family']:22s} {len(variant['delta']):3d} hunks "
+                      f"{changed:4d} base lines replaced  -> {variant['target']}")
+        elif args.command == 'show':
+            sys.stdout.write(load_variant(args.variant))
+        elif args.command == 'apply':
+            print(f"✅ {args.variant} -> {apply_variant(args.variant, args.to)}")
+        elif args.command == 'run':
+            for variant_id, target in run_recipe(args.script):
+                print(f"✅ {variant_id} -> {target}")
+        elif args.command == 'add':
+            store = TemplateStore()
+            with open(args.file, 'r', encoding='utf-8', newline='') as f:
+                store.add(args.variant, f.read(), args.target, source=os.path.basename(args.file))
+            store.save()
+            print(f"📦 Stored {args.variant} (revision {store.revision})")
+        elif args.command == 'verify':
+            store = _load_store(STORE_DIR)
+            for variant_id in store['variants']:
+                load_variant(variant_id)
+            for name, steps in store['recipes'].items():
+                for variant_id, _ in steps:
+                    if variant_id not in store['variants']:
+                        raise KeyError(f"Recipe '{name}' refers to missing variant '{variant_id}'")
+            print(f"✅ {len(store['variants'])} variants and {len(store['recipes'])} recipes verified "
+                  f"(revision {store['revision']})")
+        elif args.command == 'extract':
+            store = TemplateStore()
+            for script, added in extract_scripts(store, args.scripts, rewrite=not args.no_rewrite).items():
+                print(f"📦 {script}: {len(added)} payload(s) extracted")
+            store.save()
+    except (KeyError, ValueError) as e:
+        print(f"❌ {e.args[0] if e.args else e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
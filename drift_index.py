@@ -0,0 +1,201 @@
+import argparse
+import difflib
+import hashlib
+import json
+import os
+import sys
+import time
+
+from codemod_templates import STORE_DIR, load_store, load_variant
+from hunter_index import INDEX_DIR
+from tsx_rewrite import tokens_for
+
+# Drift fingerprinting: which stored template variant does a live file match?
+#
+# Every variant in template_store/ (i.e. every payload the codemod scripts
+# embedded) gets a MinHash signature over 5-token shingles of its significant
+# tokens, so formatting and comments do not count as drift. Signatures use
+# one-permutation hashing: each shingle is hashed once (blake2b, 64 bit),
+# binned by hash into BINS buckets, and a bucket keeps its minimum; empty bins
+# borrow from the next non-empty one. The fraction of equal bins estimates the
+# Jaccard similarity of two shingle sets.
+#
+# Lookups go through an LSH table (BANDS bands of BINS/BANDS bins), so only
+# variants sharing at least one band with the live file are scored; when none
+# do, every signature is compared (128 ints each - still no text diffing). The
+# minimal diff is computed against the winner only. Signatures are cached in
+# .code_hunter/drift-minhash.json keyed by each variant's sha256.
+#
+# Usage: python3 drift_index.py [FILE ...] [--top N] [--no-diff] [--context N] [--format text|json]
+#        (no FILE: every live file some variant targets)
+
+BINS = 128
+BANDS = 32
+SHINGLE = 5
+CACHE_PATH = os.path.join(INDEX_DIR, 'drift-minhash.json')
+SCHEMA_VERSION = 2
+_EMPTY = (1 << 64) - 1
+
+
+def _is_jsx(path):
+    return not path.endswith('.ts')
+
+
+def shingles(text, jsx=True):
+    # Whitespace inside a token (JSX text, template strings) is collapsed: re-indenting is not drift.
+    values = [' '.join(tok.value.split()) for tok in tokens_for(text, jsx)]
+    values = [value for value in values if value]
+    if len(values) < SHINGLE:
+        return {'\x00'.join(values)} if values else set()
+    return {'\x00'.join(values[i:i + SHINGLE]) for i in range(len(values) - SHINGLE + 1)}
+
+
+def signature(text, jsx=True):
+    bins = [_EMPTY] * BINS
+    for shingle in shingles(text, jsx):
+        h = int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+        slot = h % BINS
+        if h < bins[slot]:
+            bins[slot] = h
+    if all(value == _EMPTY for value in bins):
+        return bins
+    # Densify: an empty bin takes the value of the next non-empty bin (cyclically).
+    for i in range(BINS):
+        j = i
+        while bins[j % BINS] == _EMPTY:
+            j += 1
+        if j != i:
+            bins[i] = bins[j % BINS] ^ (j - i)  # mixed with the distance so copies stay distinguishable
+    return bins
+
+
+def similarity(a, b):
+    return sum(1 for x, y in zip(a, b) if x == y) / BINS
+
+
+def _bands(sig):
+    rows = BINS // BANDS
+    return [(band, tuple(sig[band * rows:(band + 1) * rows])) for band in range(BANDS)]
+
+
+class DriftIndex:
+    def __init__(self, store_dir=STORE_DIR, cache_path=CACHE_PATH):
+        self.store_dir = store_dir
+        self.cache_path = cache_path
+        store = load_store(store_dir)
+        self.variants = store['variants']
+        self.by_sha = {}
+        for variant_id, variant in self.variants.items():
+            self.by_sha.setdefault(variant['sha256'], []).append(variant_id)
+        self.signatures = self._load_signatures()
+        self.buckets = {}
+        for variant_id, sig in self.signatures.items():
+            for key in _bands(sig):
+                self.buckets.setdefault(key, []).append(variant_id)
+
+    def _load_signatures(self):
+        cached = {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == SCHEMA_VERSION and data.get('params') == [BINS, SHINGLE]:
+                cached = data['signatures']
+        except (OSError, ValueError):
+            pass
+        signatures, computed = {}, 0
+        for variant_id, variant in self.variants.items():
+            entry = cached.get(variant['sha256'])
+            if entry is None:
+                entry = signature(load_variant(variant_id, self.store_dir), _is_jsx(variant['target']))
+                cached[variant['sha256']] = entry
+                computed += 1
+            signatures[variant_id] = entry
+        if computed:
+            live = {variant['sha256'] for variant in self.variants.values()}
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            tmp = self.cache_path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump({'version': SCHEMA_VERSION, 'params': [BINS, SHINGLE],
+                           'signatures': {sha: sig for sha, sig in cached.items() if sha in live}},
+                          f, separators=(',', ':'))
+            os.replace(tmp, self.cache_path)
+        return signatures
+
+    def candidates(self, sig):
+        found = set()
+        for key in _bands(sig):
+            found.update(self.buckets.get(key, ()))
+        return found
+
+    def closest(self, text, path=None, top=1):
+        """[(variant id, score, exact)] best first; score is the MinHash Jaccard estimate (1.0 for exact)."""
+        sha = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        exact = self.by_sha.get(sha, [])
+        sig = signature(text, _is_jsx(path or ''))
+        pool = self.candidates(sig) or set(self.signatures)
+        scored = [(variant_id, 1.0 if variant_id in exact else similarity(sig, self.signatures[variant_id]),
+                   variant_id in exact) for variant_id in pool]
+        # Same-target variants first on ties, then by id, so output is stable.
+        scored.sort(key=lambda s: (-s[1], not s[2], self.variants[s[0]]['target'] != path, s[0]))
+        return scored[:top]
+
+
+def minimal_diff(variant_text, live_text, variant_id, path, context=1):
+    return ''.join(difflib.unified_diff(variant_text.splitlines(keepends=True), live_text.splitlines(keepends=True),
+                                        fromfile=f"variant:{variant_id}", tofile=path, n=context))
+
+
+def live_targets(store_dir=STORE_DIR):
+    targets = sorted({variant['target'] for variant in load_store(store_dir)['variants'].values()})
+    return [target for target in targets if os.path.isfile(target)]
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Report which stored template variant each live file matches.")
+    parser.add_argument('files', nargs='*', help="Files to fingerprint (default: every existing variant target)")
+    parser.add_argument('--top', type=int, default=1, help="Also list the next-best variants (default: 1)")
+    parser.add_argument('--no-diff', action='store_true', help="Skip the diff against the closest variant")
+    parser.add_argument('--context', type=int, default=1, help="Context lines in the diff (default: 1)")
+    parser.add_argument('--format', choices=('text', 'json'), default='text')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = DriftIndex()
+    files = args.files or live_targets()
+    report = []
+    for path in files:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        rel = os.path.relpath(path).replace(os.sep, '/')
+        matches = index.closest(text, rel, args.top)
+        entry = {'path': rel, 'matches': [{'variant': v, 'score': round(s, 3), 'exact': e} for v, s, e in matches]}
+        if matches and not args.no_diff and not matches[0][2]:
+            entry['diff'] = minimal_diff(load_variant(matches[0][0]), text, matches[0][0], rel, args.context)
+        report.append(entry)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    if args.format == 'json':
+        json.dump(report, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+        return 0
+    for entry in report:
+        if not entry['matches']:
+            print(f"❓ {entry['path']}: no variants stored")
+            continue
+        best = entry['matches'][0]
+        mark = '🎯' if best['exact'] else ('≈ ' if best['score'] >= 0.5 else '❓')
+        score = 'exact' if best['exact'] else f"{best['score']:.0%}"
+        print(f"{mark} {entry['path']}: {best['variant']} ({score})")
+        for other in entry['matches'][1:]:
+            print(f"      next: {other['variant']} ({other['score']:.0%})")
+        if entry.get('diff'):
+            changed = sum(1 for line in entry['diff'].splitlines()
+                          if line[:1] in '+-' and not line.startswith(('+++', '---')))
+            print(f"   {changed} line(s) differ:")
+            sys.stdout.write(''.join(f"   {line}" for line in entry['diff'].splitlines(keepends=True)))
+    print(f"🧬 {len(report)} file(s) against {len(index.variants)} variants in {elapsed:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,212 @@
+import hashlib
+import os
+import struct
+import sys
+import time
+
+# Reads .git/index directly (no `git` subprocess) so code_hunter can enumerate
+# exactly the tracked files - anything .gitignore'd (storage/, artifacts/,
+# coverage output, build dirs) never enters the index, so it is never walked.
+# Each tracked file comes with a blob hash: the one recorded in the index when
+# the working-tree stat still matches it, otherwise recomputed from the file.
+# Only tracked files are listed; new files show up once they are `git add`ed.
+
+_HEADER = struct.Struct('>4sLL')
+
+
+def _entry_struct(hash_size):
+    # skip ctime; mtime s/ns; skip dev, ino; mode; skip uid, gid; size; object id; flags
+    return struct.Struct(f'>8xLL8xL8xL{hash_size}sH')
+_REGULAR = 0o100000
+_TYPE_MASK = 0o170000
+
+
+def find_git_dir(start='.'):
+    """(worktree_root, git_dir) for the repository containing `start`, or None."""
+    path = os.path.abspath(start)
+    while True:
+        dot_git = os.path.join(path, '.git')
+        if os.path.isdir(dot_git):
+            return path, dot_git
+        if os.path.isfile(dot_git):
+            # Linked worktrees and submodules point at their git dir with "gitdir: <path>".
+            with open(dot_git, 'r', encoding='utf-8') as f:
+                target = f.read().strip()
+            if target.startswith('gitdir:'):
+                return path, os.path.normpath(os.path.join(path, target[len('gitdir:'):].strip()))
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _hash_size(git_dir):
+    config = os.path.join(git_dir, 'config')
+    try:
+        with open(config, 'r', encoding='utf-8') as f:
+            if any(line.split('=')[0].strip().lower() == 'objectformat' and 'sha256' in line for line in f):
+                return 32
+    except OSError:
+        pass
+    return 20
+
+
+def _varint(data, pos):
+    """Git's offset varint used by index v4 path compression."""
+    byte = data[pos]
+    value = byte & 0x7f
+    pos += 1
+    while byte & 0x80:
+        byte = data[pos]
+        value = ((value + 1) << 7) | (byte & 0x7f)
+        pos += 1
+    return value, pos
+
+
+def read_index(git_dir):
+    """Yield (path, blob_hex, mode, mtime_ns, size) for every stage-0 entry, in index order."""
+    with open(os.path.join(git_dir, 'index'), 'rb') as f:
+        data = f.read()
+    signature, version, count = _HEADER.unpack_from(data, 0)
+    if signature != b'DIRC' or version not in (2, 3, 4):
+        raise ValueError(f"unsupported git index (signature={signature!r}, version={version})")
+
+    entry = _entry_struct(_hash_size(git_dir))
+    pos = _HEADER.size
+    previous = b''
+    for _ in range(count):
+        start = pos
+        mtime_s, mtime_ns, mode, size, oid, flags = entry.unpack_from(data, pos)
+        pos += entry.size
+        if version >= 3 and flags & 0x4000:
+            pos += 2  # extended flags (skip-worktree, intent-to-add)
+        if version == 4:
+            strip, pos = _varint(data, pos)
+            end = data.index(b'\0', pos)
+            path = previous[:len(previous) - strip] + data[pos:end]
+            pos = end + 1
+        else:
+            end = data.index(b'\0', pos)
+            path = data[pos:end]
+            # Entries are NUL-padded to a multiple of 8 bytes.
+            pos = start + ((end - start) // 8 + 1) * 8
+        previous = path
+        if (flags >> 12) & 0x3:
+            continue  # merge-conflict stages
+        yield os.fsdecode(path), oid.hex(), mode, mtime_s * 1_000_000_000 + mtime_ns, size
+
+
+def blob_hash(path, hash_size=20):
+    """Git's object id for the file's current bytes."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha256() if hash_size == 32 else hashlib.sha1()
+    digest.update(b'blob %d\0' % len(data))
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def iter_tracked_files(root_dir, extensions=None, ignored_dirs=()):
+    """Yield (path, blob_hex) for tracked regular files under root_dir.
+
+    Paths are spelled `os.path.join(root_dir, ...)` so they line up with an
+    os.walk of the same root. Directory names in ignored_dirs are skipped at any
+    depth, like code_hunter's walk. Files deleted from the working tree are
+    skipped; modified ones get a freshly computed blob hash.
+    """
+    found = find_git_dir(root_dir)
+    if found is None:
+        raise FileNotFoundError(f"'{root_dir}' is not inside a git work tree")
+    work_tree, git_dir = found
+    hash_size = _hash_size(git_dir)
+    prefix = os.path.relpath(os.path.abspath(root_dir), work_tree).replace(os.sep, '/')
+    prefix = '' if prefix == '.' else prefix + '/'
+    ignored = set(ignored_dirs)
+    try:
+        index_mtime_ns = os.stat(os.path.join(git_dir, 'index')).st_mtime_ns
+    except OSError:
+        index_mtime_ns = 0
+
+    for rel, blob, mode, mtime_ns, size in read_index(git_dir):
+        if not rel.startswith(prefix) or (mode & _TYPE_MASK) != _REGULAR:
+            continue
+        inner = rel[len(prefix):]
+        parts = inner.split('/')
+        if extensions and not parts[-1].endswith(extensions):
+            continue
+        if ignored and any(part in ignored for part in parts[:-1]):
+            continue
+        path = os.path.join(root_dir, *parts)
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        # The index stores 32-bit seconds (and nanoseconds only when git was built with
+        # USE_NSEC). A file touched in the same instant the index was written is
+        # "racily clean" and gets rehashed, as git itself would.
+        seconds, nanos = divmod(st.st_mtime_ns, 1_000_000_000)
+        index_seconds, index_nanos = divmod(mtime_ns, 1_000_000_000)
+        same_stat = (st.st_size == size
+                     and seconds % (1 << 32) == index_seconds
+                     and (index_nanos == 0 or nanos == index_nanos)
+                     and st.st_mtime_ns < index_mtime_ns)
+        if not same_stat:
+            try:
+                blob = blob_hash(path, hash_size)
+            except OSError:
+                continue
+        yield path, blob
+
+
+def _bench(root_dir, term, repeat):
+    import code_hunter
+    from hunter_patterns import MultiMatcher
+
+    def timed(fn, repeat=repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = fn()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, result
+
+    def hunt(source):
+        matcher = MultiMatcher.from_terms([term])
+        return sum(1 for _ in code_hunter.iter_matches(matcher, root_dir, source=source, use_index=False))
+
+    walk_time, walk_files = timed(lambda: list(code_hunter.iter_code_files(root_dir)))
+    git_time, git_files = timed(lambda: list(code_hunter.iter_code_files(root_dir, source='git')))
+    walk_hunt, walk_hits = timed(lambda: hunt('walk'))
+    code_hunter.clear_result_cache(root_dir)
+    cold_git, git_hits = timed(lambda: hunt('git'), repeat=1)
+    warm_git, _ = timed(lambda: hunt('git'))
+
+    untracked = len(set(walk_files) - set(git_files))
+    print(f"\n⏱️  ENUMERATION BENCHMARK: '{root_dir}/' (best of {repeat})")
+    print("-" * 60)
+    print(f"os.walk      {walk_time * 1000:9.1f} ms   {len(walk_files):6d} files")
+    print(f"git index    {git_time * 1000:9.1f} ms   {len(git_files):6d} files  ({untracked} walked files are untracked/ignored)")
+    print(f"\n🔍 HUNT '{term}'")
+    print("-" * 60)
+    print(f"os.walk scan {walk_hunt * 1000:9.1f} ms   {walk_hits} hits")
+    print(f"git cold     {cold_git * 1000:9.1f} ms   {git_hits} hits (empty result cache)")
+    print(f"git warm     {warm_git * 1000:9.1f} ms   (every blob answered from cache)")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect tracked files straight from .git/index.")
+    parser.add_argument('root', nargs='?', default='.', help="Directory to list (default: .)")
+    parser.add_argument('--bench', action='store_true',
+                        help="Compare os.walk and git-index enumeration plus cached hunts on this tree")
+    parser.add_argument('--term', default='Search', help="Term hunted during --bench (default: Search)")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per --bench measurement (default: 3)")
+    args = parser.parse_args()
+    if args.bench:
+        _bench(args.root, args.term, max(1, args.repeat))
+    else:
+        for path, blob in iter_tracked_files(args.root):
+            print(f"{blob}  {path}")
+    sys.exit(0)
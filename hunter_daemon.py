@@ -0,0 +1,326 @@
+import ctypes
+import ctypes.util
+import json
+import os
+import re
+import select
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+from hunter_index import INDEX_DIR, root_key, trigrams
+from hunter_patterns import MultiMatcher, Pattern
+
+# Long-running query server for code_hunter.py.
+# `code_hunter.py serve` keeps every code file of one root in memory and answers
+# JSON queries over a Unix socket; `code_hunter.py query` talks to it and falls
+# back to a direct scan when no daemon is listening. Freshness comes from a
+# background thread that re-stats the tree whenever inotify reports a change
+# (Linux) or every `interval` seconds otherwise. Queries never touch the disk:
+# an in-memory trigram bitmap picks the files, str.find picks the lines.
+
+
+def socket_path(root_dir):
+    return os.path.join(INDEX_DIR, f"daemon-{root_key(root_dir)}.sock")
+
+
+def _split_lines(text):
+    """Split like iterating a text-mode file: on '\\n' only, keeping the terminator."""
+    parts = text.split('\n')
+    lines = [part + '\n' for part in parts[:-1]]
+    if parts[-1]:
+        lines.append(parts[-1])
+    return lines
+
+
+def _lines_with(text, terms):
+    """(line_no, line) for the lines holding any of `terms`, found with str.find instead of splitting."""
+    starts = set()
+    for term in terms:
+        pos = text.find(term)
+        while pos != -1:
+            starts.add(text.rfind('\n', 0, pos) + 1)
+            end = text.find('\n', pos)
+            pos = text.find(term, pos + 1) if end == -1 else text.find(term, end + 1)
+    line_no, counted = 1, 0
+    for start in sorted(starts):
+        line_no += text.count('\n', counted, start)
+        counted = start
+        end = text.find('\n', start)
+        yield line_no, text[start:] if end == -1 else text[start:end + 1]
+
+
+class TreeCache:
+    """Decoded contents of every code file under a root, plus an in-memory trigram index.
+
+    Each file owns a stable bit slot; postings map a trigram to an int bitmask of
+    the slots whose text contains it. Entries and postings are published together
+    as one tuple so a query never pairs new text with stale postings.
+    """
+
+    def __init__(self, root_dir, iter_files):
+        self.root_dir = root_dir
+        self.iter_files = iter_files
+        self.snapshot = ([], {})  # ([(path, slot, size, text)], {gram: slot bitmask})
+        self.stamps = {}          # path -> (mtime_ns, size)
+        self.slots = {}           # path -> bit slot
+        self.free_slots = []
+        self.generation = 0
+
+    @property
+    def entries(self):
+        return self.snapshot[0]
+
+    def refresh(self):
+        """Re-stat the tree, re-read changed files and swap in a new snapshot; returns files re-read."""
+        old_entries, old_postings = self.snapshot
+        old = {path: (size, text) for path, _, size, text in old_entries}
+        entries = []
+        stamps = {}
+        changes = []  # (slot, old_text, new_text)
+        for path in self.iter_files(self.root_dir):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            stamp = (st.st_mtime_ns, st.st_size)
+            stamps[path] = stamp
+            slot = self.slots.get(path)
+            if slot is None:
+                slot = self.free_slots.pop() if self.free_slots else len(self.slots) + len(self.free_slots)
+                self.slots[path] = slot
+            if self.stamps.get(path) == stamp and path in old:
+                size, text = old[path]
+            else:
+                size = st.st_size
+                try:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        text = f.read()
+                except (OSError, UnicodeDecodeError):
+                    text = None
+                changes.append((slot, old.get(path, (0, None))[1], text))
+            entries.append((path, slot, size, text))
+
+        for path in set(self.slots) - set(stamps):
+            slot = self.slots.pop(path)
+            self.free_slots.append(slot)
+            changes.append((slot, old.get(path, (0, None))[1], None))
+
+        postings = old_postings
+        if changes:
+            postings = dict(old_postings)
+            for slot, before, after in changes:
+                bit = 1 << slot
+                old_grams = trigrams(before) if before else set()
+                new_grams = trigrams(after) if after else set()
+                for gram in old_grams - new_grams:
+                    mask = postings[gram] & ~bit
+                    if mask:
+                        postings[gram] = mask
+                    else:
+                        del postings[gram]
+                for gram in new_grams - old_grams:
+                    postings[gram] = postings.get(gram, 0) | bit
+            self.generation += 1
+
+        # Readers hold a reference to the previous tuple, so a plain swap is safe.
+        self.snapshot = (entries, postings)
+        self.stamps = stamps
+        return len(changes)
+
+    def search(self, matcher, max_file_size=None, max_per_file=None, limit=None):
+        """Yield (path, line_no, line, pattern_ids) exactly as a disk scan would."""
+        entries, postings = self.snapshot
+        gates = [t for t in matcher.literals if t] if not matcher.regexes and not matcher.always else None
+        allowed = None
+        if gates is not None:
+            allowed = 0
+            for term in gates:
+                grams = trigrams(term)
+                if not grams:
+                    allowed = None
+                    break
+                mask = -1
+                for gram in grams:
+                    mask &= postings.get(gram, 0)
+                    if not mask:
+                        break
+                allowed |= mask
+            if allowed == 0:
+                return
+
+        emitted = 0
+        for path, slot, size, text in entries:
+            if text is None:
+                continue
+            if allowed is not None and not (allowed >> slot) & 1:
+                continue
+            if max_file_size is not None and size > max_file_size:
+                continue
+            if gates is not None and not any(term in text for term in gates):
+                continue
+            in_file = 0
+            lines = _lines_with(text, gates) if gates else enumerate(_split_lines(text), 1)
+            for line_no, line in lines:
+                ids = matcher.match_line(line)
+                if not ids:
+                    continue
+                yield path, line_no, line, ids
+                emitted += 1
+                in_file += 1
+                if limit and emitted >= limit:
+                    return
+                if max_per_file and in_file >= max_per_file:
+                    break
+
+
+class _Inotify:
+    """Minimal libc inotify binding; `available` is False off Linux or without libc."""
+
+    MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800  # modify/attrib/close_write/moves/create/delete
+
+    def __init__(self):
+        self.fd = -1
+        self.watched = set()
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            self._add = libc.inotify_add_watch
+            self._add.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            self.fd = -1
+
+    @property
+    def available(self):
+        return self.fd >= 0
+
+    def watch_tree(self, paths):
+        for directory in {os.path.dirname(p) for p in paths}:
+            if directory not in self.watched and self._add(self.fd, os.fsencode(directory), self.MASK) >= 0:
+                self.watched.add(directory)
+
+    def wait(self, timeout):
+        """Block until at least one event arrives (True) or the timeout passes (False)."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        # Drain the queue, then give editors a moment to finish multi-step saves.
+        time.sleep(0.05)
+        while True:
+            try:
+                if not os.read(self.fd, 64 * 1024):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        started = time.perf_counter()
+        try:
+            request = json.loads(self.rfile.readline())
+            matcher = MultiMatcher([Pattern(text, bool(is_regex)) for text, is_regex in request['patterns']])
+        except (ValueError, TypeError, KeyError, re.error) as e:
+            self._send({'error': str(e)})
+            return
+        cache = self.server.cache
+        count = 0
+        for path, line_no, line, ids in cache.search(matcher, request.get('max_file_size'),
+                                                     request.get('max_per_file'), request.get('limit')):
+            self._send({'path': path, 'line': line_no, 'ids': ids, 'text': line})
+            count += 1
+        self._send({'done': True, 'count': count, 'generation': cache.generation,
+                    'elapsed_ms': round((time.perf_counter() - started) * 1000, 3)})
+
+    def _send(self, record):
+        self.wfile.write(json.dumps(record, ensure_ascii=False).encode('utf-8') + b"\n")
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(root_dir, iter_files, interval=1.0):
+    path = socket_path(root_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    if os.path.exists(path):
+        live = connect(root_dir)
+        if live is not None:
+            live.close()
+            print(f"❌ A daemon is already serving '{root_dir}/' on {path}")
+            return 1
+        os.unlink(path)  # stale socket from a crashed daemon
+
+    cache = TreeCache(root_dir, iter_files)
+    started = time.perf_counter()
+    cache.refresh()
+    print(f"📦 Loaded {len(cache.entries)} files from '{root_dir}/' in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    notify = _Inotify()
+    stop = threading.Event()
+
+    def keep_fresh():
+        while not stop.is_set():
+            if notify.available:
+                notify.watch_tree(cache.stamps)
+                # Poll occasionally anyway: inotify misses directories created between refreshes.
+                notify.wait(max(interval, 5.0))
+            else:
+                stop.wait(interval)
+            changed = cache.refresh()
+            if changed:
+                print(f"🔄 Refreshed {changed} file(s) (generation {cache.generation})")
+
+    threading.Thread(target=keep_fresh, daemon=True).start()
+    server = _Server(path, _Handler)
+    server.cache = cache
+    def stop_on_term(signum, frame):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop_on_term)
+    mode = "inotify" if notify.available else f"polling every {interval:g}s"
+    print(f"🛰️  Serving '{root_dir}/' on {path} ({mode}). Ctrl+C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Daemon stopped.")
+    finally:
+        stop.set()
+        server.server_close()
+        if os.path.exists(path):
+            os.unlink(path)
+    return 0
+
+
+def connect(root_dir):
+    """Connected socket to the root's daemon, or None when none is listening."""
+    path = socket_path(root_dir)
+    if not os.path.exists(path):
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def query(sock, patterns, max_file_size=None, max_per_file=None, limit=None):
+    """Send one query and yield (path, line_no, line, pattern_ids) as the daemon streams them."""
+    request = {'patterns': [[p.text, p.is_regex] for p in patterns], 'max_file_size': max_file_size,
+               'max_per_file': max_per_file, 'limit': limit}
+    with sock, sock.makefile('rb') as stream:
+        sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+        for raw in stream:
+            record = json.loads(raw)
+            if 'error' in record:
+                raise ValueError(f"daemon rejected query: {record['error']}")
+            if record.get('done'):
+                return
+            yield record['path'], record['line'], record['text'], record['ids']
+    print("⚠️  Daemon closed the connection before finishing the query.", file=sys.stderr)
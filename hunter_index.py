@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from array import array
+
+# On-disk trigram index and result cache used by code_hunter.py.
+# One SQLite file per scanned root lives in .code_hunter/ next to this script
+# (or in $CODE_HUNTER_CACHE, which benchmarks use to keep scratch trees apart).
+# Files are keyed by (path, mtime_ns, size); any mismatch re-indexes that file.
+# The index only narrows the candidate set - callers must confirm every hit
+# with a real substring match, so results stay identical to a full scan.
+# Files over the caller's max_file_size are recorded as skipped without being
+# opened, and indexed on a later refresh whose limit admits them.
+
+INDEX_DIR = (os.environ.get('CODE_HUNTER_CACHE')
+             or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.code_hunter'))
+SCHEMA_VERSION = '1'
+SKIPPED = -1  # files.readable for a file over max_file_size, left unread
+
+
+def root_key(root_dir):
+    """Short stable id for a scanned root, used to name its cache files."""
+    return hashlib.sha1(os.path.abspath(root_dir).encode('utf-8')).hexdigest()[:12]
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def file_trigrams(path, chunk_chars=1 << 20):
+    """Trigrams of a UTF-8 text file, read in chunks so a large file is never held whole."""
+    grams = set()
+    tail = ''
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_chars)
+            if not chunk:
+                return grams
+            text = tail + chunk
+            grams.update(trigrams(text))
+            tail = text[-2:]
+
+
+def _pack(ids):
+    return array('I', sorted(ids)).tobytes()
+
+
+def _unpack(blob):
+    ids = array('I')
+    ids.frombytes(blob)
+    return ids
+
+
+class TrigramIndex:
+    def __init__(self, root_dir, index_dir=INDEX_DIR):
+        self.root_dir = root_dir
+        os.makedirs(index_dir, exist_ok=True)
+        self.db_path = os.path.join(index_dir, f"trigrams-{root_key(root_dir)}.sqlite3")
+        self.db = sqlite3.connect(self.db_path)
+        self._ensure_schema()
+        self.paths = {}
+
+    def _ensure_schema(self):
+        db = self.db
+        db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = db.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        if row and row[0] == SCHEMA_VERSION:
+            return
+        db.executescript("""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS postings;
+            CREATE TABLE files (
+                id INTEGER PRIMARY KEY,
+                path TEXT UNIQUE NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                readable INTEGER NOT NULL,
+                grams TEXT NOT NULL
+            );
+            CREATE TABLE postings (gram TEXT PRIMARY KEY, ids BLOB NOT NULL) WITHOUT ROWID;
+        """)
+        db.execute("INSERT OR REPLACE INTO meta VALUES ('schema', ?)", (SCHEMA_VERSION,))
+        db.commit()
+
+    def close(self):
+        self.db.close()
+
+    def clear(self):
+        self.db.executescript("DELETE FROM files; DELETE FROM postings;")
+        self.db.commit()
+
+    def refresh(self, file_paths, max_file_size=None):
+        """Bring the index in line with `file_paths`; returns the number of files (re)indexed.
+
+        Files larger than `max_file_size` are not read; they are stored as skipped and
+        never returned by candidates(), matching a scan that would not read them either.
+        """
+        db = self.db
+        known = {path: (fid, mtime_ns, size, readable) for fid, path, mtime_ns, size, readable
+                 in db.execute("SELECT id, path, mtime_ns, size, readable FROM files")}
+        added = {}    # gram -> ids gaining it
+        removed = {}  # gram -> ids losing it
+        touched = 0
+        seen = set()
+
+        for path in file_paths:
+            seen.add(path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            oversized = max_file_size is not None and st.st_size > max_file_size
+            entry = known.get(path)
+            if (entry and entry[1] == st.st_mtime_ns and entry[2] == st.st_size
+                    and (entry[3] != SKIPPED or oversized)):
+                continue
+
+            if oversized:
+                grams = set()
+                readable = SKIPPED
+            else:
+                # Mirror code_hunter's reader: strict UTF-8 with universal newlines.
+                try:
+                    grams = file_trigrams(path)
+                    readable = 1
+                except (OSError, UnicodeDecodeError):
+                    grams = set()
+                    readable = 0
+
+            if entry:
+                fid = entry[0]
+                old = db.execute("SELECT grams FROM files WHERE id = ?", (fid,)).fetchone()[0]
+                old_grams = {old[i:i + 3] for i in range(0, len(old), 3)}
+                for gram in old_grams - grams:
+                    removed.setdefault(gram, set()).add(fid)
+                new_grams = grams - old_grams
+                db.execute("UPDATE files SET mtime_ns = ?, size = ?, readable = ?, grams = ? WHERE id = ?",
+                           (st.st_mtime_ns, st.st_size, readable, ''.join(sorted(grams)), fid))
+            else:
+                fid = db.execute("INSERT INTO files (path, mtime_ns, size, readable, grams) VALUES (?, ?, ?, ?, ?)",
+                                 (path, st.st_mtime_ns, st.st_size, readable, ''.join(sorted(grams)))).lastrowid
+                new_grams = grams
+            for gram in new_grams:
+                added.setdefault(gram, set()).add(fid)
+            touched += 1
+
+        for path, (fid, _, _, _) in known.items():
+            if path in seen:
+                continue
+            old = db.execute("SELECT grams FROM files WHERE id = ?", (fid,)).fetchone()[0]
+            for i in range(0, len(old), 3):
+                removed.setdefault(old[i:i + 3], set()).add(fid)
+            db.execute("DELETE FROM files WHERE id = ?", (fid,))
+            touched += 1
+
+        for gram in set(added) | set(removed):
+            row = db.execute("SELECT ids FROM postings WHERE gram = ?", (gram,)).fetchone()
+            ids = set(_unpack(row[0])) if row else set()
+            ids -= removed.get(gram, set())
+            ids |= added.get(gram, set())
+            if ids:
+                db.execute("INSERT OR REPLACE INTO postings VALUES (?, ?)", (gram, _pack(ids)))
+            elif row:
+                db.execute("DELETE FROM postings WHERE gram = ?", (gram,))
+
+        db.commit()
+        self.paths = {fid: path for fid, path in db.execute("SELECT id, path FROM files WHERE readable = 1")}
+        return touched
+
+    def candidates(self, term):
+        """Paths that may contain `term`, or None when the term is too short to filter on."""
+        grams = trigrams(term)
+        if not grams:
+            return None
+        postings = []
+        for gram in grams:
+            row = self.db.execute("SELECT ids FROM postings WHERE gram = ?", (gram,)).fetchone()
+            if row is None:
+                return set()
+            postings.append(_unpack(row[0]))
+        postings.sort(key=len)
+        ids = set(postings[0])
+        for other in postings[1:]:
+            ids.intersection_update(other)
+            if not ids:
+                break
+        return {self.paths[fid] for fid in ids if fid in self.paths}
+
+
+class ResultCache:
+    """Per-blob hunt results, keyed by (query signature, git blob hash).
+
+    A blob hash pins the file content, so after a branch switch only files whose
+    content actually changed miss the cache. Rows unused for `max_age_days` are
+    pruned on close.
+    """
+
+    def __init__(self, root_dir, index_dir=INDEX_DIR, max_age_days=30):
+        os.makedirs(index_dir, exist_ok=True)
+        self.db_path = os.path.join(index_dir, f"results-{root_key(root_dir)}.sqlite3")
+        self.db = sqlite3.connect(self.db_path)
+        self.db.execute("""CREATE TABLE IF NOT EXISTS results (
+            sig TEXT NOT NULL, blob TEXT NOT NULL, hits TEXT NOT NULL, used INTEGER NOT NULL,
+            PRIMARY KEY (sig, blob)) WITHOUT ROWID""")
+        self.max_age = max_age_days * 86400
+        self.pending = []
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, sig, blobs):
+        """{blob: hits} for the blobs already answered under `sig`."""
+        found = {}
+        blobs = list(blobs)
+        for i in range(0, len(blobs), 500):
+            chunk = blobs[i:i + 500]
+            marks = ','.join('?' * len(chunk))
+            for blob, hits in self.db.execute(
+                    f"SELECT blob, hits FROM results WHERE sig = ? AND blob IN ({marks})", [sig] + chunk):
+                found[blob] = json.loads(hits)
+        self.hits += len(found)
+        self.misses += len(blobs) - len(found)
+        if found:
+            now = int(time.time())
+            self.pending.extend((sig, blob, None, now) for blob in found)
+        return found
+
+    def store(self, sig, blob, hits):
+        self.pending.append((sig, blob, json.dumps(hits, ensure_ascii=False), int(time.time())))
+
+    def flush(self):
+        db = self.db
+        for sig, blob, hits, now in self.pending:
+            if hits is None:
+                db.execute("UPDATE results SET used = ? WHERE sig = ? AND blob = ?", (now, sig, blob))
+            else:
+                db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)", (sig, blob, hits, now))
+        self.pending = []
+        db.commit()
+
+    def clear(self):
+        self.db.execute("DELETE FROM results")
+        self.db.commit()
+
+    def close(self):
+        self.flush()
+        self.db.execute("DELETE FROM results WHERE used < ?", (int(time.time()) - self.max_age,))
+        self.db.commit()
+        self.db.close()
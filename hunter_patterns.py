@@ -0,0 +1,121 @@
+import re
+from collections import deque
+
+# Pattern matching for code_hunter.py.
+# Literals go through one Aho-Corasick automaton, regexes are compiled once, and
+# every line is tested against all of them in a single pass. A combined
+# alternation regex (run by the C engine) gates the pure-Python automaton so it
+# only walks lines that contain at least one literal.
+
+
+class AhoCorasick:
+    def __init__(self, words):
+        self.words = list(words)
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [[]]
+        for index, word in enumerate(self.words):
+            state = 0
+            for ch in word:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            self.out[state].append(index)
+
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def iter_matches(self, text):
+        """Yield (end_offset, word_index) for every occurrence, overlaps included."""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield pos + 1, index
+
+    def matched(self, text):
+        """Set of word indices that occur anywhere in `text`."""
+        return {index for _, index in self.iter_matches(text)}
+
+
+class Pattern:
+    def __init__(self, text, is_regex=False):
+        self.text = text
+        self.is_regex = is_regex
+
+    @property
+    def label(self):
+        return f"/{self.text}/" if self.is_regex else f"'{self.text}'"
+
+    def __repr__(self):
+        return f"Pattern({self.text!r}, is_regex={self.is_regex})"
+
+
+class MultiMatcher:
+    def __init__(self, patterns):
+        self.patterns = list(patterns)
+        self.literal_ids = [i for i, p in enumerate(self.patterns) if not p.is_regex]
+        self.regexes = [(i, re.compile(p.text)) for i, p in enumerate(self.patterns) if p.is_regex]
+        self.literals = [self.patterns[i].text for i in self.literal_ids]
+
+        # '' is "in" every line, which the automaton cannot express.
+        self.always = [i for i in self.literal_ids if not self.patterns[i].text]
+        words = [(i, p) for i, p in zip(self.literal_ids, self.literals) if p]
+        self.word_ids = [i for i, _ in words]
+        self.automaton = AhoCorasick([w for _, w in words]) if len(words) > 1 else None
+        self.single = words[0] if len(words) == 1 else None
+        self.gate = None
+        if self.automaton is not None:
+            ordered = sorted({w for _, w in words}, key=len, reverse=True)
+            self.gate = re.compile('|'.join(re.escape(w) for w in ordered))
+
+    @classmethod
+    def from_terms(cls, literals=(), regexes=()):
+        return cls([Pattern(t) for t in literals] + [Pattern(r, is_regex=True) for r in regexes])
+
+    def match_line(self, line):
+        """Indices of every pattern that occurs in `line`, in pattern order."""
+        hits = list(self.always)
+        if self.single is not None:
+            if self.single[1] in line:
+                hits.append(self.single[0])
+        elif self.automaton is not None and self.gate.search(line):
+            hits.extend(self.word_ids[w] for w in self.automaton.matched(line))
+        for i, rx in self.regexes:
+            if rx.search(line):
+                hits.append(i)
+        if len(hits) > 1:
+            hits = sorted(set(hits))
+        return hits
+
+    def byte_needles(self):
+        """UTF-8 needles for a raw-byte prefilter, or None when one could wrongly rule a file out."""
+        if self.regexes or self.always or not self.literals:
+            return None
+        needles = []
+        for term in self.literals:
+            # Universal newlines rewrite \r\n and \r, so the raw bytes differ from the decoded text.
+            if '\r' in term or '\n' in term:
+                return None
+            try:
+                needles.append(term.encode('utf-8'))
+            except UnicodeEncodeError:
+                return None
+        return needles
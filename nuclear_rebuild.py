@@ -1,6 +1,5 @@
-import os
-import shutil
-import time
+from codemod_io import CodemodTransaction
+from codemod_templates import load_variant
 
 print("--- ☢️ INITIATING NUCLEAR REBUILD OF VENDOR RISK MODULE ☢️ ---")
 
@@ -8,297 +7,32 @@ print("--- ☢️ INITIATING NUCLEAR REBUILD OF VENDOR RISK MODULE ☢️ ---")
 comp_dir = 'app/components/vendor-risk'
 report_dir = 'app/reports/vendor-risk'
 
-# 1. DESTROY EXISTING DIRECTORIES
-print(f"1. Deleting {comp_dir}...")
-if os.path.exists(comp_dir):
-    shutil.rmtree(comp_dir)
-
-print(f"2. Deleting {report_dir}...")
-if os.path.exists(report_dir):
-    shutil.rmtree(report_dir)
-
-time.sleep(1) # Ensure file system lock releases
-
-# 2. RECREATE DIRECTORIES
-print("3. Recreating directory structure...")
-os.makedirs(comp_dir, exist_ok=True)
-os.makedirs(f'{report_dir}/artifacts', exist_ok=True)
-
-# ------------------------------------------------------------------
-# 3. REWRITE COMPONENTS (CLEAN SLATE)
-# ------------------------------------------------------------------
-
-# A. DocumentList.tsx (The Unified Table - No Search Bar Logic Here)
-code_list = """'use client';
-import React, { useState, useEffect } from 'react';
-import { 
-  MoreVertical, FileText, Trash2, Download, Edit, 
-  AlertCircle, CheckCircle, Clock, FileSpreadsheet, 
-  File as FileIcon, Image as ImageIcon, Box, Mail, Loader2, Shield
-} from 'lucide-react';
-import { sendVendorEmail } from '../../actions/email';
-import ArtifactDrawer from './ArtifactDrawer';
-import { createClient } from '@/lib/supabase/client';
-
-interface DocumentListProps {
-  documents: any[];
-  onDelete: (id: string) => void;
-  onEdit: (doc: any) => void;
-  sortConfig: { key: string; direction: string };
-}
-
-export default function DocumentList({ documents, onDelete, onEdit }: DocumentListProps) {
-  const [activeMenuId, setActiveMenuId] = useState<string | null>(null);
-  const [sendingEmailId, setSendingEmailId] = useState<string | null>(null);
-  const [drawerDoc, setDrawerDoc] = useState<any>(null);
-  const supabase = createClient();
-
-  useEffect(() => {
-    const handleClickOutside = (event: any) => {
-      if (!event.target.closest('.action-menu-container')) {
-        setActiveMenuId(null);
-      }
-    };
-    document.addEventListener('click', handleClickOutside);
-    return () => document.removeEventListener('click', handleClickOutside);
-  }, []);
-  
-  const handleSendEmail = async (doc: any) => {
-    setSendingEmailId(doc.id);
-    const result = await sendVendorEmail(doc.vendorName, doc.name, doc.expiry);
-    if (result.success) {
-      alert(`✅ Compliance request sent to ${doc.vendorName}`);
-      setActiveMenuId(null);
-    } else {
-      alert('❌ Failed to send email.');
-    }
-    setSendingEmailId(null);
-  };
-
-  const getFileIcon = (filename: string) => {
-      const lower = (filename || '').toLowerCase();
-      const className = "w-4 h-4 text-gray-500";
-      if (lower.includes('.pdf')) return <FileText className={className} />;
-      if (lower.includes('.xls') || lower.includes('.csv')) return <FileSpreadsheet className={className} />;
-      return <FileIcon className={className} />;
-  };
-
-  if (!documents || documents.length === 0) {
-    return (
-      <div style={{ padding: '40px', textAlign: 'center', color: '#718096', border: '1px dashed #2d3748', borderRadius: '8px', marginTop: '20px' }}>
-        No documents found.
-      </div>
-    );
-  }
-
-  return (
-    <div className="w-full pb-24">
-      <table className="w-full border-collapse">
-        <thead>
-          <tr className="border-t border-b border-[#2d3139] bg-[#16191f] text-[#718096] text-[10px] font-extrabold tracking-wider">
-            <th className="px-4 py-2 text-left w-[25%]">NAME</th>
-            <th className="px-4 py-2 text-left w-[15%]">VENDOR</th>
-            <th className="px-4 py-2 text-left w-[10%]">TYPE</th>
-            <th className="px-4 py-2 text-left w-[10%]">CRITICALITY</th>
-            <th className="px-4 py-2 text-left w-[10%]">UPLOADED</th>
-            <th className="px-4 py-2 text-left w-[10%]">UPDATED</th>
-            <th className="px-4 py-2 text-left w-[10%]">EXPIRY</th>
-            <th className="px-4 py-2 text-left w-[10%]">STATUS</th>
-            <th className="px-4 py-2 text-right">ACTION</th>
-          </tr>
-        </thead>
-        <tbody>
-          {documents.map((doc) => {
-            const isMenuOpen = activeMenuId === doc.id;
-            const isSending = sendingEmailId === doc.id;
-            let status = { label: 'VALID', color: '#38a169', icon: CheckCircle };
-            
-            if (!doc.expiry) {
-                if (doc.type === 'MSA') status = { label: 'PERMANENT', color: '#718096', icon: CheckCircle };
-                else status = { label: 'INCOMPLETE', color: '#d69e2e', icon: AlertCircle };
-            } else {
-                const days = Math.ceil((new Date(doc.expiry).getTime() - new Date().getTime()) / (1000 * 3600 * 24));
-                if (days < 0) status = { label: 'EXPIRED', color: '#e53e3e', icon: AlertCircle };
-                else if (days < 90) status = { label: 'EXPIRING', color: '#dd6b20', icon: Clock };
-            }
-            const StatusIcon = status.icon;
-
-            return (
-              <tr key={doc.id} className="border-b border-[#2d3139] hover:bg-[#20242b] transition-colors group">
-                <td className="px-4 py-3">
-                  <div className="flex items-center gap-3">
-                    {getFileIcon(doc.url || doc.name)}
-                    <a href={doc.url} target="_blank" rel="noopener noreferrer" className="text-sm font-bold text-gray-200 hover:text-blue-400 truncate max-w-[200px]">{doc.name}</a>
-                  </div>
-                </td>
-                <td className="px-4 py-3 text-xs text-blue-400 hover:underline cursor-pointer">{doc.vendorName}</td>
-                <td className="px-4 py-3"><span className="px-2 py-0.5 rounded text-[10px] font-bold bg-[#2d3748] text-[#cbd5e0]">{doc.type}</span></td>
-                <td className="px-4 py-3"><span style={{ color: doc.criticality === 'HIGH' ? '#fc8181' : '#68d391', fontWeight: 800, fontSize: '10px' }}>{doc.criticality}</span></td>
-                <td className="px-4 py-3 text-xs text-gray-500 font-mono">{new Date(doc.created_at).toLocaleDateString()}</td>
-                <td className="px-4 py-3 text-xs text-gray-500 font-mono">{new Date(doc.updated_at).toLocaleDateString()}</td>
-                <td className="px-4 py-3 text-xs font-mono" style={{ color: doc.expiry ? '#a0aec0' : '#d69e2e' }}>{doc.expiry ? new Date(doc.expiry).toLocaleDateString() : 'Required*'}</td>
-                <td className="px-4 py-3">
-                   <div style={{ display: 'flex', alignItems: 'center', gap: '6px' }}><StatusIcon className="w-3 h-3" style={{ color: status.color }} /><span style={{ color: status.color, fontWeight: 800, fontSize: '10px' }}>{status.label}</span></div>
-                </td>
-                <td className="px-4 py-3 text-right relative action-menu-container">
-                    <button onClick={(e) => { e.stopPropagation(); setActiveMenuId(isMenuOpen ? null : doc.id); }} className={`p-1 rounded hover:bg-gray-700 ${isMenuOpen ? 'text-white' : 'text-gray-500'}`}><MoreVertical className="w-4 h-4" /></button>
-                    {isMenuOpen && (
-                        <div className="absolute right-0 top-8 w-44 bg-[#1a202c] border border-[#2d3748] rounded-md shadow-xl z-50 flex flex-col overflow-hidden text-left">
-                            <button onClick={() => handleSendEmail(doc)} disabled={isSending} className="flex items-center gap-2 px-4 py-2 text-xs text-gray-200 hover:bg-gray-700 border-b border-[#2d3748]">{isSending ? 'Sending...' : 'Request Update'}</button>
-                            <button onClick={() => { setDrawerDoc(doc); setActiveMenuId(null); }} className="flex items-center gap-2 px-4 py-2 text-xs text-gray-200 hover:bg-gray-700 border-b border-[#2d3748]">Audit History</button>
-                            <button onClick={() => { onEdit(doc); setActiveMenuId(null); }} className="flex items-center gap-2 px-4 py-2 text-xs text-gray-200 hover:bg-gray-700">Edit Metadata</button>
-                            <button onClick={() => { if(confirm('Delete?')) onDelete(doc.id); setActiveMenuId(null); }} className="flex items-center gap-2 px-4 py-2 text-xs text-red-400 hover:bg-gray-700">Delete</button>
-                        </div>
-                    )}
-                </td>
-              </tr>
-            );
-          })}
-        </tbody>
-      </table>
-      <ArtifactDrawer isOpen={!!drawerDoc} onClose={() => setDrawerDoc(null)} doc={drawerDoc} />
-    </div>
-  );
-}
-"""
-with open(f'{comp_dir}/DocumentList.tsx', 'w') as f: f.write(code_list)
-
-# B. Helper Components (Simplified for Rebuild)
-with open(f'{comp_dir}/ArtifactDrawer.tsx', 'w') as f: f.write("'use client'; export default function ArtifactDrawer({isOpen, onClose, doc}:any) { if(!isOpen) return null; return <div className=\"fixed inset-0 bg-black/50 z-50\" onClick={onClose}><div className=\"absolute right-0 top-0 h-full w-[400px] bg-[#0d1117] border-l border-[#30363d] p-6 text-white\">Drawer Placeholder</div></div>; }")
-with open(f'{comp_dir}/EditArtifactModal.tsx', 'w') as f: f.write("'use client'; export default function EditArtifactModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Edit Placeholder</div>; }")
-with open(f'{comp_dir}/UploadArtifactModal.tsx', 'w') as f: f.write("'use client'; export default function UploadArtifactModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Upload Placeholder</div>; }")
-with open(f'{comp_dir}/SystemActivityModal.tsx', 'w') as f: f.write("'use client'; export default function SystemActivityModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Activity Placeholder</div>; }")
-
-# ------------------------------------------------------------------
-# 4. REWRITE PAGE (NO SPYGLASS)
-# ------------------------------------------------------------------
-code_page = """'use client';
-import React, { useEffect, useState } from 'react';
-import Link from 'next/link';
-import Header from '@/app/components/structure/Header';
-import DocumentList from '@/app/components/vendor-risk/DocumentList';
-import UploadArtifactModal from '@/app/components/vendor-risk/UploadArtifactModal';
-import EditArtifactModal from '@/app/components/vendor-risk/EditArtifactModal';
-import SystemActivityModal from '@/app/components/vendor-risk/SystemActivityModal'; 
-import { createClient } from '@/lib/supabase/client';
-import { Activity } from 'lucide-react'; 
-
-export default function ArtifactLibraryPage() {
-  const [documents, setDocuments] = useState<any[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
-  const [isUploadOpen, setIsUploadOpen] = useState(false); 
-  const [isEditOpen, setIsEditOpen] = useState(false);
-  const [isActivityOpen, setIsActivityOpen] = useState(false); 
-  const [selectedDoc, setSelectedDoc] = useState<any>(null);
-
-  // --- FILTER STATE (NO SEARCH) ---
-  const [statusFilter, setStatusFilter] = useState('ALL');
-  const [dateRange, setDateRange] = useState('ALL');
-  const [timelineView, setTimelineView] = useState('HISTORY'); 
-   
-  const supabase = createClient();
-
-  const fetchDocs = async () => {
-    setIsLoading(true);
-    const { data } = await supabase.from('vendor_artifacts').select('id, name, document_type, expiry_date, file_url, created_at, updated_at, vendor_id, vendor_risk_inventory ( vendor_name, criticality )');
-    if (data) {
-        setDocuments(data.map((item: any) => ({
-            id: String(item.id),
-            vendor_id: String(item.vendor_id),
-            name: item.name,
-            vendorName: item.vendor_risk_inventory?.vendor_name || 'Unknown Vendor',
-            type: item.document_type,
-            expiry: item.expiry_date,
-            created_at: item.created_at || new Date().toISOString(),
-            updated_at: item.updated_at || item.created_at || new Date().toISOString(), 
-            url: item.file_url,
-            criticality: item.vendor_risk_inventory?.criticality || 'LOW' 
-        })));
-    }
-    setIsLoading(false);
-  };
-
-  useEffect(() => { fetchDocs(); }, []);
-
-  const handleDelete = async (id: string) => {
-      if(confirm("Delete artifact?")) {
-        await supabase.from('vendor_artifacts').delete().eq('id', id);
-        fetchDocs();
-      }
-  };
-
-  const handleEdit = (doc: any) => { setSelectedDoc(doc); setIsEditOpen(true); };
-
-  // --- FILTERING (NO SEARCH LOGIC) ---
-  const processedDocuments = documents.filter(doc => {
-        return true; // Simplified for now to ensure display
-    });
-
-  const inputStyle = { background: '#0d1117', border: '1px solid #2d3139', color: 'white', padding: '8px 12px', borderRadius: '4px', fontSize: '12px' };
-
-  return (
-    <div style={{ height: '100vh', display: 'flex', flexDirection: 'column', background: '#0d1117', color: 'white', fontFamily: 'Inter, sans-serif', overflow: 'hidden' }}>
-      <div className="no-print" style={{ flexShrink: 0 }}>
-        <Header />
-        <div style={{ height: '50px', background: '#2b6cb0', display: 'flex', alignItems: 'center', padding: '0 20px', justifyContent: 'space-between', borderBottom: '1px solid #63b3ed' }}>
-          <div style={{ display: 'flex', gap: '15px', alignItems: 'center' }}>
-            <div style={{ fontSize: '12px', fontWeight: 800, color: '#ebf8ff' }}>📂 EVIDENCE & ARTIFACT LIBRARY</div>
-          </div>
-          <div style={{ display: 'flex', gap: '10px' }}>
-             <button onClick={() => setIsActivityOpen(true)} style={{ background: 'rgba(0,0,0,0.2)', border: '1px solid #ebf8ff', color: '#ebf8ff', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 800, cursor: 'pointer', display: 'flex', alignItems: 'center', gap: '6px' }}>
-                <Activity className="w-3 h-3" /> ACTIVITY LOG
-             </button>
-             <button onClick={() => setIsUploadOpen(true)} style={{ background: '#ebf8ff', border: '1px solid white', color: '#2b6cb0', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 900, cursor: 'pointer', display: 'flex', alignItems: 'center', gap: '5px' }}><span>📤</span> UPLOAD NEW</button>
-             <Link href="/reports/vendor-risk" style={{ color: '#ebf8ff', textDecoration: 'none', fontSize: '10px', fontWeight: 800, background: 'rgba(0,0,0,0.3)', padding: '6px 12px', borderRadius: '4px' }}>◀ REGISTRY</Link>
-          </div>
-        </div>
-      </div>
-
-      <div style={{ flex: 1, display: 'flex', flexDirection: 'column', padding: '20px 40px 0 40px', overflow: 'hidden', maxWidth: '1400px', width: '100%', margin: '0 auto' }}>
-        
-        {/* HEADER SECTION */}
-        <div style={{ flex: 1, display: 'flex', flexDirection: 'column', background: '#1a1d23', borderRadius: '8px 8px 0 0', border: '1px solid #2d3139', borderBottom: 'none', overflow: 'hidden' }}>
-            <div style={{ flexShrink: 0, borderBottom: '1px solid #2d3139', background: '#1a1d23', zIndex: 10 }}>
-                <div style={{ padding: '20px 30px 15px 30px', display: 'flex', alignItems: 'center', gap: '25px' }}>
-                    <div style={{ display: 'flex', alignItems: 'center', gap: '10px' }}>
-                        <h3 style={{ fontSize: '12px', color: '#718096', margin: 0, fontWeight: 900 }}>GLOBAL DOCUMENT INDEX</h3>
-                        <span style={{ fontSize: '11px', background: '#2d3748', padding: '2px 8px', borderRadius: '10px', color: '#cbd5e0' }}>{processedDocuments.length} Items</span>
-                    </div>
-
-                    <div style={{ width: '1px', height: '20px', background: '#2d3139' }}></div>
-
-                    <div style={{ display: 'flex', gap: '10px', alignItems: 'center' }}>
-                        <select value={dateRange} onChange={(e) => setDateRange(e.target.value)} style={{ ...inputStyle, cursor: 'pointer', minWidth: '180px', borderColor: '#2d3139' }}>
-                            <option value="ALL">📅 Any Time</option>
-                            <option value="TODAY">Last 24 Hours</option>
-                            <option value="7D">Last 7 Days</option>
-                        </select>
-                        <select value={statusFilter} onChange={(e) => setStatusFilter(e.target.value)} style={{ ...inputStyle, cursor: 'pointer', minWidth: '150px', borderColor: '#2d3139' }}>
-                            <option value="ALL">All Statuses</option>
-                            <option value="VALID">✅ Valid Only</option>
-                            <option value="EXPIRING">⚠️ Expiring Soon</option>
-                        </select>
-                    </div>
-                </div>
-            </div>
-
-            <div style={{ flex: 1, overflowY: 'auto', padding: '0 30px 30px 30px' }}>
-                {isLoading ? (
-                    <div style={{ padding: '40px', textAlign: 'center', color: '#adbac7' }}>Loading Library...</div>
-                ) : (
-                    <DocumentList documents={processedDocuments} onDelete={handleDelete} onEdit={handleEdit} sortConfig={{ key: '', direction: '' }} />
-                )}
-            </div>
-        </div>
-      </div>
-      
-      <UploadArtifactModal isOpen={isUploadOpen} onClose={() => setIsUploadOpen(false)} />
-      <EditArtifactModal isOpen={isEditOpen} onClose={() => setIsEditOpen(false)} />
-      <SystemActivityModal isOpen={isActivityOpen} onClose={() => setIsActivityOpen(false)} />
-    </div>
-  );
-}
-"""
-with open(f'{report_dir}/artifacts/page.tsx', 'w') as f: f.write(code_page)
+# 1. REPLACE BOTH DIRECTORIES IN ONE TRANSACTION
+# Everything below is staged first; on exit the new files are swapped in and
+# anything else under the two directories is removed, or nothing changes at all.
+print(f"1. Staging a clean rebuild of {comp_dir} and {report_dir}...")
+with CodemodTransaction() as txn:
+    txn.replace_tree(comp_dir)
+    txn.replace_tree(report_dir)
+
+    # ------------------------------------------------------------------
+    # 2. REWRITE COMPONENTS (CLEAN SLATE)
+    # ------------------------------------------------------------------
+
+    # A. DocumentList.tsx (The Unified Table - No Search Bar Logic Here)
+    code_list = load_variant('nuclear_rebuild.code_list')
+    txn.write(f'{comp_dir}/DocumentList.tsx', code_list)
+
+    # B. Helper Components (Simplified for Rebuild)
+    txn.write(f'{comp_dir}/ArtifactDrawer.tsx', "'use client'; export default function ArtifactDrawer({isOpen, onClose, doc}:any) { if(!isOpen) return null; return <div className=\"fixed inset-0 bg-black/50 z-50\" onClick={onClose}><div className=\"absolute right-0 top-0 h-full w-[400px] bg-[#0d1117] border-l border-[#30363d] p-6 text-white\">Drawer Placeholder</div></div>; }")
+    txn.write(f'{comp_dir}/EditArtifactModal.tsx', "'use client'; export default function EditArtifactModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Edit Placeholder</div>; }")
+    txn.write(f'{comp_dir}/UploadArtifactModal.tsx', "'use client'; export default function UploadArtifactModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Upload Placeholder</div>; }")
+    txn.write(f'{comp_dir}/SystemActivityModal.tsx', "'use client'; export default function SystemActivityModal({isOpen, onClose}:any) { if(!isOpen) return null; return <div>Activity Placeholder</div>; }")
+
+    # ------------------------------------------------------------------
+    # 3. REWRITE PAGE (NO SPYGLASS)
+    # ------------------------------------------------------------------
+    code_page = load_variant('nuclear_rebuild.code_page')
+    txn.write(f'{report_dir}/artifacts/page.tsx', code_page)
 
 print("✅ NUCLEAR REBUILD COMPLETE. Search Bar Annihilated.")
@@ -1,14 +1,81 @@
 import os
 import json
 import shutil
+import subprocess
+import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+
+from fast_copy import copy_file
+from fast_walk import path_contains, walk_files
+from rebuild_graph import ImportGraph
+from rebuild_journal import RebuildJournal
+from rebuild_manifest import RebuildManifest
+
+
+class ApprovalPolicy:
+    """Batch approvals for run_batch, loaded from a JSON policy file.
+
+        {
+          "allow": ["components/**", "app/reports/*.tsx"],
+          "deny":  ["**/*.test.tsx", "components/legacy/*"],
+          "notes": {"components/vendor-risk/DocumentList.tsx": "Spyglass-free list",
+                    "components/**": "Bulk component restore"},
+          "default_note": "Batch approved"
+        }
+
+    Patterns are fnmatch globs on the path relative to source_dir ('/'-separated;
+    '*' also matches across '/'). Deny wins over allow; a file no allow pattern
+    matches is left out. Notes are looked up by exact path, then by the first
+    matching glob key in file order, then default_note.
+    """
+
+    def __init__(self, allow=(), deny=(), notes=None, default_note="Batch approved"):
+        self.allow = list(allow)
+        self.deny = list(deny)
+        self.notes = dict(notes or {})
+        self.default_note = default_note
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'r') as f:
+            data = json.load(f)
+        unknown = set(data) - {'allow', 'deny', 'notes', 'default_note'}
+        if unknown:
+            raise ValueError(f"Unknown key(s) in approval policy {path}: {', '.join(sorted(unknown))}")
+        return cls(data.get('allow', ()), data.get('deny', ()), data.get('notes'),
+                   data.get('default_note', "Batch approved"))
+
+    def decide(self, relative_path):
+        """'deny', 'allow' or 'unlisted' for one relative path."""
+        relative_path = relative_path.replace(os.sep, '/')
+        if any(fnmatchcase(relative_path, pattern) for pattern in self.deny):
+            return 'deny'
+        if any(fnmatchcase(relative_path, pattern) for pattern in self.allow):
+            return 'allow'
+        return 'unlisted'
+
+    def note_for(self, relative_path):
+        relative_path = relative_path.replace(os.sep, '/')
+        if relative_path in self.notes:
+            return self.notes[relative_path]
+        for pattern, note in self.notes.items():
+            if fnmatchcase(relative_path, pattern):
+                return note
+        return self.default_note
+
 
 class RebuildOrchestrator:
-    def __init__(self, source_dir='app_backup', sandbox_dir='sandbox', doc_dir='doc/rebuild'):
+    def __init__(self, source_dir='app_backup', sandbox_dir='sandbox', doc_dir='doc/rebuild', alias_of='app',
+                 wave_check=None):
         self.source_dir = source_dir
         self.sandbox_dir = sandbox_dir
         self.doc_dir = doc_dir
+        self.alias_of = alias_of      # tree the source is a copy of, for resolving '@/' imports
+        self.wave_check = wave_check  # shell command run in sandbox_dir after each wave (e.g. a type check)
         self.inventory = []
+        self.journal = None           # RebuildJournal for the current session, opened on first record
         
         for d in [self.sandbox_dir, self.doc_dir]:
             os.makedirs(d, exist_ok=True)
@@ -16,49 +83,203 @@ class RebuildOrchestrator:
     def ingest(self):
         print(f"\n🔍 [PHASE 1: INGESTION]")
         print(f"Reading source code from '{self.source_dir}'...")
-        for root, _, files in os.walk(self.source_dir):
-            if any(x in root for x in ['.next', 'node_modules', '.git']): continue
-            for file in files:
-                if file.endswith(('.tsx', '.ts', '.css', '.js')):
-                    path = os.path.join(root, file)
-                    self.inventory.append(path)
+        skip = path_contains(['.next', 'node_modules', '.git'])
+        self.inventory.extend(walk_files(self.source_dir, ('.tsx', '.ts', '.css', '.js'), skip_path=skip))
         
         self.inventory.sort()
         print(f"✅ Ingest Complete: {len(self.inventory)} components identified.")
 
-    def run_rebuild(self):
+    def plan_rebuild(self, full=False):
+        """Ingest, diff against the sandbox manifest, drop deleted files; returns the RebuildDelta.
+
+        With full=True every source file is offered again, not just the delta.
+        """
         self.ingest()
+        self.manifest = RebuildManifest(self.sandbox_dir, self.source_dir)
+        delta = self.manifest.plan(os.path.relpath(path, self.source_dir) for path in self.inventory)
+        if full:
+            delta.changed = sorted(delta.changed + delta.unchanged)
+            delta.unchanged = []
+        delta.report()
+        for relative_path in delta.deleted:
+            if self.manifest.remove(relative_path):
+                print(f"🗑️  REMOVED FROM SANDBOX: {relative_path}")
+                self.session_journal().record(relative_path, 'removed', "Deleted from source")
+            else:
+                print(f"⚠️  KEPT {relative_path}: deleted from source but edited in the sandbox")
+                self.session_journal().record(relative_path, 'kept', "Deleted from source, edited in sandbox")
+        self.manifest.save()
+        return delta
+
+    def plan_waves(self, relative_paths):
+        """Split `relative_paths` into dependency waves: every file's imports land in an earlier wave."""
+        inventory = [os.path.relpath(path, self.source_dir) for path in self.inventory]
+        return ImportGraph(self.source_dir, inventory, self.alias_of).waves(relative_paths)
+
+    def check_wave(self, number, total):
+        """Run wave_check after a wave; returns False when it fails."""
+        if not self.wave_check:
+            return True
+        result = subprocess.run(self.wave_check, shell=True, cwd=self.sandbox_dir)
+        if result.returncode != 0:
+            print(f"❌ WAVE {number}/{total} CHECK FAILED: `{self.wave_check}` exited {result.returncode}")
+            return False
+        print(f"🟢 Wave {number}/{total} check passed")
+        return True
+
+    def run_rebuild(self, full=False):
+        delta = self.plan_rebuild(full)
+        waves = self.plan_waves(delta.pending)
         print(f"\n🚀 [PHASE 2: SANDBOX RECONSTRUCTION]")
         print(f"🌍 PREVIEW LINK: http://localhost:3002")
         print("-" * 60)
         
-        for file_path in self.inventory:
-            relative_path = os.path.relpath(file_path, self.source_dir)
-            target_path = os.path.join(self.sandbox_dir, relative_path)
-            
-            print(f"\n➡️  READY TO ASSEMBLE: {relative_path}")
-            choice = input(f"👉 Approve assembly for '{relative_path}'? (y/n/q): ").lower()
-            
-            if choice == 'q': 
-                break
-            if choice == 'n': 
-                continue
-            
-            if choice == 'y':
-                os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                shutil.copy2(file_path, target_path)
-                print(f"\n✅ COMPONENT COMPLETE: {relative_path}")
-                print(f"🔗 View changes at: http://localhost:3002")
-                obs = input("📝 Enter post-section note: ")
-                self.log_documentation(relative_path, obs)
-
-    def log_documentation(self, section_name, note):
-        log_file = os.path.join(self.doc_dir, f"{section_name.replace('/', '_')}.md")
-        os.makedirs(os.path.dirname(log_file), exist_ok=True)
-        log_content = f"# Rebuild Log: {section_name}\n- **Status**: Assembled\n- **Note**: {note}\n"
-        with open(log_file, 'w') as f:
-            f.write(log_content)
+        try:
+            for number, wave in enumerate(waves, 1):
+                print(f"\n🌊 WAVE {number}/{len(waves)}: {len(wave)} file(s) whose imports are already in place")
+                for relative_path in wave:
+                    file_path = os.path.join(self.source_dir, relative_path)
+                    target_path = os.path.join(self.sandbox_dir, relative_path)
+
+                    print(f"\n➡️  READY TO ASSEMBLE: {relative_path}")
+                    choice = input(f"👉 Approve assembly for '{relative_path}'? (y/n/q): ").lower()
+
+                    if choice == 'q':
+                        return
+                    if choice == 'n':
+                        self.session_journal().record(relative_path, 'declined', None, delta.hashes[relative_path][2])
+                        continue
+
+                    if choice == 'y':
+                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                        shutil.copy2(file_path, target_path)
+                        self.manifest.record(relative_path, delta.hashes[relative_path])
+                        print(f"\n✅ COMPONENT COMPLETE: {relative_path}")
+                        print(f"🔗 View changes at: http://localhost:3002")
+                        obs = input("📝 Enter post-section note: ")
+                        self.log_documentation(relative_path, obs, delta.hashes[relative_path][2])
+                if not self.check_wave(number, len(waves)):
+                    return
+        finally:
+            self.manifest.save()
+            self.close_journal()
+
+    def run_batch(self, policy, workers=None, full=False):
+        """Non-interactive rebuild: copy policy-approved files wave by wave on a thread pool.
+
+        `policy` is an ApprovalPolicy or a path to its JSON file. Only the manifest
+        delta is considered unless full=True. Returns a summary dict (also printed):
+        counts per decision, bytes copied, copy mechanisms used, failures and
+        elapsed seconds.
+        """
+        if not isinstance(policy, ApprovalPolicy):
+            policy = ApprovalPolicy.load(policy)
+        started = time.perf_counter()
+        delta = self.plan_rebuild(full)
+        print(f"\n🚀 [PHASE 2: SANDBOX RECONSTRUCTION - BATCH]")
+        print("-" * 60)
+
+        decisions = {'allow': [], 'deny': [], 'unlisted': []}
+        for relative_path in delta.pending:
+            file_path = os.path.join(self.source_dir, relative_path)
+            decisions[policy.decide(relative_path)].append((file_path, relative_path))
+        approved = decisions['allow']
+        for decision, label in (('deny', 'denied'), ('unlisted', 'unlisted')):
+            for _, relative_path in decisions[decision]:
+                self.session_journal().record(relative_path, label, None, delta.hashes[relative_path][2])
+        waves = self.plan_waves([rel for _, rel in approved])
+
+        # Create every target directory up front so workers never race on makedirs.
+        for directory in sorted({os.path.dirname(os.path.join(self.sandbox_dir, rel)) for _, rel in approved}):
+            os.makedirs(directory, exist_ok=True)
+
+        def assemble(relative_path):
+            file_path = os.path.join(self.source_dir, relative_path)
+            try:
+                method = copy_file(file_path, os.path.join(self.sandbox_dir, relative_path))
+                return relative_path, method, os.path.getsize(file_path), None
+            except OSError as e:
+                return relative_path, None, 0, e
+
+        methods, failures = {}, []
+        copied_bytes = 0
+        workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        completed_waves = 0
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for number, wave in enumerate(waves, 1):
+                    # Each wave finishes before the next starts, so the sandbox always compiles.
+                    for relative_path, method, size, error in pool.map(assemble, wave):
+                        if error is not None:
+                            failures.append((relative_path, str(error)))
+                            print(f"❌ FAILED: {relative_path} ({error})")
+                            self.session_journal().record(relative_path, 'failed', str(error),
+                                                          delta.hashes[relative_path][2])
+                            continue
+                        methods[method] = methods.get(method, 0) + 1
+                        copied_bytes += size
+                        self.manifest.record(relative_path, delta.hashes[relative_path])
+                        self.log_documentation(relative_path, policy.note_for(relative_path),
+                                               delta.hashes[relative_path][2])
+                    print(f"🌊 Wave {number}/{len(waves)}: {len(wave)} file(s) assembled")
+                    if not self.check_wave(number, len(waves)):
+                        break
+                    completed_waves += 1
+        finally:
+            self.manifest.save()
+            self.close_journal()
+
+        elapsed = time.perf_counter() - started
+        summary = {'inventory': len(self.inventory), 'added': len(delta.added), 'changed': len(delta.changed),
+                   'deleted': len(delta.deleted), 'unchanged': len(delta.unchanged),
+                   'approved': len(approved), 'denied': len(decisions['deny']),
+                   'unlisted': len(decisions['unlisted']), 'copied': sum(methods.values()),
+                   'waves': len(waves), 'completed_waves': completed_waves,
+                   'failed': failures, 'bytes': copied_bytes, 'methods': methods, 'seconds': round(elapsed, 3)}
+        print(f"\n📊 BATCH SUMMARY ({elapsed:.2f}s, {workers} workers, {completed_waves}/{len(waves)} waves)")
+        print("-" * 60)
+        print(f"✅ Assembled: {summary['copied']}/{summary['approved']} approved "
+              f"({copied_bytes / (1024 * 1024):.1f} MB via {', '.join(f'{k} x{v}' for k, v in sorted(methods.items())) or 'nothing'})")
+        print(f"⛔ Denied:    {summary['denied']}")
+        print(f"⏭️  Unlisted:  {summary['unlisted']} (no allow pattern matched)")
+        if failures:
+            print(f"❌ Failed:    {len(failures)}")
+        return summary
+
+    def session_journal(self):
+        if self.journal is None:
+            self.journal = RebuildJournal(self.doc_dir)
+        return self.journal
+
+    def close_journal(self):
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+    def log_documentation(self, section_name, note, content_hash=None):
+        # One journal line instead of one .md per file; `rebuild_journal.py render` regenerates the .md logs.
+        self.session_journal().record(section_name, 'assembled', note, content_hash)
 
 if __name__ == "__main__":
-    bot = RebuildOrchestrator()
-    bot.run_rebuild()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rebuild the sandbox from the backup, file by file.")
+    parser.add_argument('--batch', metavar='POLICY_JSON',
+                        help="Approve files from a policy file instead of prompting, and copy them in parallel")
+    parser.add_argument('--full', action='store_true',
+                        help="Offer every source file again instead of only the manifest delta")
+    parser.add_argument('--workers', type=int, help="Copy threads for --batch (default: 4 per CPU, max 32)")
+    parser.add_argument('--source', default='app_backup', help="Source directory (default: app_backup)")
+    parser.add_argument('--sandbox', default='sandbox', help="Sandbox directory (default: sandbox)")
+    parser.add_argument('--alias-of', default='app',
+                        help="Directory the source is a copy of, for resolving '@/' imports (default: app)")
+    parser.add_argument('--wave-check', metavar='CMD',
+                        help="Shell command run in the sandbox after each wave; a failure stops the rebuild")
+    args = parser.parse_args()
+
+    bot = RebuildOrchestrator(source_dir=args.source, sandbox_dir=args.sandbox, alias_of=args.alias_of,
+                              wave_check=args.wave_check)
+    if args.batch:
+        summary = bot.run_batch(args.batch, workers=args.workers, full=args.full)
+        sys.exit(1 if summary['failed'] else 0)
+    bot.run_rebuild(full=args.full)
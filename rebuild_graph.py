@@ -0,0 +1,132 @@
+import os
+
+from ts_symbols import SymbolIndex, find_alias_root
+
+# Import graph for RebuildOrchestrator: which inventory files each file needs in
+# the sandbox before it can compile. Edges come from relative ('./x', '../x') and
+# '@/' specifiers of imports and re-exports, read from the cached symbol index
+# (ts_symbols.py, .ts/.tsx only). Package imports ('react', 'lucide-react') and
+# specifiers that resolve outside the inventory are not edges.
+
+RESOLVE_SUFFIXES = ('', '.tsx', '.ts', '.jsx', '.js', '.css', '/index.tsx', '/index.ts', '/index.jsx', '/index.js')
+
+
+class ImportGraph:
+    """deps[rel] = set of inventory paths `rel` imports (relative paths, '/'-separated like the inventory).
+
+    `alias_of` names the directory (relative to the tsconfig root) that source_dir
+    is a copy of, so '@/app/components/x' inside app_backup/ resolves to
+    app_backup/components/x. Leave it None when source_dir is the real tree.
+    """
+
+    def __init__(self, source_dir, relative_paths, alias_of=None):
+        self.source_dir = os.path.abspath(source_dir)
+        self.alias_root = find_alias_root(source_dir)
+        self.alias_of = os.path.normpath(os.path.join(self.alias_root, alias_of)) if alias_of else None
+        self.nodes = list(relative_paths)
+        self.known = set(self.nodes)
+        self.deps = {rel: set() for rel in self.nodes}
+
+        index = SymbolIndex(source_dir)
+        index.refresh(os.path.join(source_dir, rel) for rel in self.nodes)
+        for rel in self.nodes:
+            entry = index.files.get(os.path.join(source_dir, rel))
+            if not entry:
+                continue
+            symbols = entry[2]
+            specifiers = {spec for spec, _, _, _ in symbols['imports']}
+            specifiers.update(module for _, _, module, _ in symbols['exports'] if module)
+            for spec in specifiers:
+                target = self.resolve(spec, rel)
+                if target is not None and target != rel:
+                    self.deps[rel].add(target)
+
+    def resolve(self, specifier, importer):
+        """Inventory path a specifier refers to, or None."""
+        if specifier.startswith('.'):
+            base = os.path.join(self.source_dir, os.path.dirname(importer), specifier)
+        elif specifier.startswith('@/'):
+            base = os.path.join(self.alias_root, specifier[2:])
+            if self.alias_of:
+                inner = os.path.relpath(os.path.normpath(base), self.alias_of)
+                if not inner.startswith('..'):
+                    base = os.path.join(self.source_dir, inner)
+        else:
+            return None
+        rel = os.path.relpath(os.path.normpath(base), self.source_dir)
+        if rel.startswith('..'):
+            return None
+        for suffix in RESOLVE_SUFFIXES:
+            if rel + suffix in self.known:
+                return rel + suffix
+        return None
+
+    def waves(self, subset=None):
+        """Assembly waves: lists of paths whose dependencies all land in earlier waves.
+
+        Import cycles (common between sibling components) are collapsed, so every
+        member of a cycle lands in the same wave. Levels are computed on the whole
+        graph and then restricted to `subset`, so an unchanged file between two
+        pending ones still orders them.
+        """
+        component, order = self._components()
+        level = {}
+        for members in order:
+            deps = {component[d] for m in members for d in self.deps[m]} - {component[members[0]]}
+            value = 1 + max((level[c] for c in deps), default=-1)
+            level[component[members[0]]] = value
+
+        wanted = self.known if subset is None else set(subset)
+        by_level = {}
+        for rel in self.nodes:
+            if rel in wanted:
+                by_level.setdefault(level[component[rel]], []).append(rel)
+        return [sorted(by_level[key]) for key in sorted(by_level)]
+
+    def _components(self):
+        """Tarjan's strongly connected components (iterative).
+
+        Returns ({node: component id}, [member lists]); a component is emitted only
+        after everything it imports, so the list is already dependencies-first.
+        """
+        index, low, on_stack, stack, component, order = {}, {}, set(), [], {}, []
+        counter = 0
+        for root in self.nodes:
+            if root in index:
+                continue
+            work = [(root, iter(sorted(self.deps[root])))]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index:
+                        index[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(sorted(self.deps[child]))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    members = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component[member] = index[node]
+                        members.append(member)
+                        if member == node:
+                            break
+                    order.append(members)
+        return component, order
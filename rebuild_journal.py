@@ -0,0 +1,164 @@
+import argparse
+import json
+import os
+import sys
+import time
+from fnmatch import fnmatchcase
+
+# Append-only rebuild journal for RebuildOrchestrator, replacing the one-.md-per-file logs.
+# Each session appends JSON lines to <doc_dir>/journal/<session>.jsonl:
+#   {"ts": "2026-10-18T10:36:44+0000", "session": "...", "path": "components/x.tsx",
+#    "hash": "<sha256 of the source>", "decision": "assembled", "note": "..."}
+# Decisions: assembled, declined, denied, unlisted, failed, removed, kept.
+# Records are buffered and written with one append + fsync per batch (every
+# `batch_size` records or `max_delay` seconds, and on close).
+#
+# Usage: python3 rebuild_journal.py sessions
+#        python3 rebuild_journal.py show [--session S] [--path GLOB] [--decision D] [--format text|jsonl]
+#        python3 rebuild_journal.py render [--session S] [--path GLOB] [--out DIR]
+
+DEFAULT_DOC_DIR = 'doc/rebuild'
+_GLOB_CHARS = set('*?[')
+
+
+def journal_dir(doc_dir):
+    return os.path.join(doc_dir, 'journal')
+
+
+def new_session_id():
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+
+
+class RebuildJournal:
+    def __init__(self, doc_dir=DEFAULT_DOC_DIR, session=None, batch_size=256, max_delay=1.0):
+        self.session = session or new_session_id()
+        directory = journal_dir(doc_dir)
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{self.session}.jsonl")
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.buffer = []
+        self.last_flush = time.monotonic()
+
+    def record(self, path, decision, note=None, content_hash=None):
+        entry = {'ts': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'session': self.session,
+                 'path': path.replace(os.sep, '/'), 'hash': content_hash, 'decision': decision, 'note': note}
+        self.buffer.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        if len(self.buffer) >= self.batch_size or time.monotonic() - self.last_flush >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            data = ''.join(self.buffer).encode('utf-8')
+            self.buffer = []
+            while data:
+                data = data[os.write(self.fd, data):]
+            os.fsync(self.fd)
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        if self.fd < 0:
+            return
+        self.flush()
+        os.close(self.fd)
+        self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def list_sessions(doc_dir=DEFAULT_DOC_DIR):
+    """Session ids, oldest first."""
+    try:
+        names = os.listdir(journal_dir(doc_dir))
+    except OSError:
+        return []
+    return sorted(name[:-len('.jsonl')] for name in names if name.endswith('.jsonl'))
+
+
+def iter_records(doc_dir=DEFAULT_DOC_DIR, session=None, path=None, decision=None):
+    """Yield journal records in session then append order, filtered by session, path (exact or glob) and decision."""
+    sessions = [session] if session else list_sessions(doc_dir)
+    exact = path if path and not _GLOB_CHARS & set(path) else None
+    # Skip json.loads on lines that cannot match: the encoded value must appear verbatim.
+    needle = json.dumps(exact, ensure_ascii=False) if exact else None
+    for name in sessions:
+        try:
+            f = open(os.path.join(journal_dir(doc_dir), f"{name}.jsonl"), 'r', encoding='utf-8')
+        except OSError:
+            continue
+        with f:
+            for line in f:
+                if needle and needle not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # torn final line from a crashed session
+                if path and entry['path'] != path and not (exact is None and fnmatchcase(entry['path'], path)):
+                    continue
+                if decision and entry['decision'] != decision:
+                    continue
+                yield entry
+
+
+def render_markdown(doc_dir=DEFAULT_DOC_DIR, out_dir=None, session=None, path=None):
+    """Regenerate the legacy per-file `.md` logs from the latest 'assembled' record of each path; returns files written."""
+    out_dir = out_dir or doc_dir
+    latest = {}
+    for entry in iter_records(doc_dir, session, path, 'assembled'):
+        latest[entry['path']] = entry
+    for section_name, entry in latest.items():
+        log_file = os.path.join(out_dir, f"{section_name.replace('/', '_')}.md")
+        os.makedirs(os.path.dirname(log_file), exist_ok=True)
+        log_content = f"# Rebuild Log: {section_name}\n- **Status**: Assembled\n- **Note**: {entry['note']}\n"
+        with open(log_file, 'w') as f:
+            f.write(log_content)
+    return len(latest)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Query and render RebuildOrchestrator journals.")
+    parser.add_argument('--doc-dir', default=DEFAULT_DOC_DIR, help=f"Orchestrator doc_dir (default: {DEFAULT_DOC_DIR})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('sessions', help="List sessions with record counts")
+    for name in ('show', 'render'):
+        sub = commands.add_parser(name, help="Print matching records" if name == 'show' else
+                                  "Write the per-file markdown logs from 'assembled' records")
+        sub.add_argument('--session', help="Only this session id")
+        sub.add_argument('--path', help="Exact relative path or fnmatch glob")
+        if name == 'show':
+            sub.add_argument('--decision', help="Only records with this decision")
+            sub.add_argument('--format', choices=('text', 'jsonl'), default='text')
+        else:
+            sub.add_argument('--out', help="Output directory (default: the doc dir)")
+    args = parser.parse_args(argv)
+
+    if args.command == 'sessions':
+        for session in list_sessions(args.doc_dir):
+            counts = {}
+            for entry in iter_records(args.doc_dir, session):
+                counts[entry['decision']] = counts.get(entry['decision'], 0) + 1
+            print(f"{session}  " + ", ".join(f"{k} {v}" for k, v in sorted(counts.items())))
+        return 0
+
+    if args.command == 'render':
+        written = render_markdown(args.doc_dir, args.out, args.session, args.path)
+        print(f"📝 Rendered {written} log file(s) into '{args.out or args.doc_dir}'")
+        return 0
+
+    for entry in iter_records(args.doc_dir, args.session, args.path, args.decision):
+        if args.format == 'jsonl':
+            sys.stdout.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        else:
+            note = f"  📝 {entry['note']}" if entry.get('note') else ""
+            print(f"{entry['ts']}  {entry['session']}  {entry['decision']:9s}  {entry['path']}{note}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,123 @@
+import hashlib
+import json
+import os
+
+# Content-hash manifest that makes RebuildOrchestrator rebuilds incremental.
+# Stored as <sandbox_dir>/.rebuild_manifest.json:
+#   {"version": 1, "source_dir": ..., "files": {rel: {"source": [mtime_ns, size, sha256],
+#                                                     "sandbox": [mtime_ns, size, sha256]}}}
+# A file's hash is only recomputed when its (mtime_ns, size) differ from the
+# recorded stat, so an unchanged tree costs one stat per file. Only files that
+# were actually assembled are recorded; declined ones stay pending and are
+# offered again next run.
+
+MANIFEST_NAME = '.rebuild_manifest.json'
+SCHEMA_VERSION = 1
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stamped_hash(path, recorded=None):
+    """[mtime_ns, size, sha256] for path, reusing `recorded`'s hash when the stat matches; None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if recorded and recorded[0] == st.st_mtime_ns and recorded[1] == st.st_size:
+        return list(recorded)
+    return [st.st_mtime_ns, st.st_size, file_sha256(path)]
+
+
+class RebuildDelta:
+    def __init__(self):
+        self.added = []      # relative paths new in the source
+        self.changed = []    # source edited, or the sandbox copy drifted / vanished
+        self.deleted = []    # recorded, but gone from the source
+        self.unchanged = []
+        self.hashes = {}     # rel -> current source [mtime_ns, size, sha256]
+
+    @property
+    def pending(self):
+        """Paths to (re)assemble, in inventory (sorted) order."""
+        return sorted(self.added + self.changed)
+
+    def report(self, limit=50):
+        print(f"\n🧮 DELTA: +{len(self.added)} added, ~{len(self.changed)} changed, "
+              f"-{len(self.deleted)} deleted, ={len(self.unchanged)} unchanged")
+        for mark, paths in (('+', self.added), ('~', self.changed), ('-', self.deleted)):
+            for rel in paths[:limit]:
+                print(f"   {mark} {rel}")
+            if len(paths) > limit:
+                print(f"   {mark} ... and {len(paths) - limit} more")
+
+
+class RebuildManifest:
+    def __init__(self, sandbox_dir, source_dir):
+        self.sandbox_dir = sandbox_dir
+        self.source_dir = source_dir
+        self.path = os.path.join(sandbox_dir, MANIFEST_NAME)
+        self.files = {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            if data.get('version') == SCHEMA_VERSION and data.get('source_dir') == os.path.abspath(source_dir):
+                self.files = data['files']
+        except (OSError, ValueError):
+            pass
+
+    def plan(self, relative_paths):
+        """Compare the current source inventory (and sandbox copies) with the manifest."""
+        delta = RebuildDelta()
+        for rel in relative_paths:
+            entry = self.files.get(rel)
+            current = _stamped_hash(os.path.join(self.source_dir, rel), entry and entry['source'])
+            if current is None:
+                continue  # vanished between ingest and planning
+            delta.hashes[rel] = current
+            if entry is None:
+                delta.added.append(rel)
+                continue
+            sandbox = _stamped_hash(os.path.join(self.sandbox_dir, rel), entry['sandbox'])
+            if current[2] != entry['source'][2] or sandbox is None or sandbox[2] != entry['sandbox'][2]:
+                delta.changed.append(rel)
+            else:
+                delta.unchanged.append(rel)
+                if sandbox != entry['sandbox'] or current != entry['source']:
+                    entry['source'], entry['sandbox'] = current, sandbox  # touched, same bytes
+        seen = set(delta.hashes)
+        delta.deleted = sorted(rel for rel in self.files if rel not in seen)
+        return delta
+
+    def record(self, rel, source_hash):
+        """Note that `rel` was just assembled from a source with `source_hash`."""
+        self.files[rel] = {'source': source_hash,
+                           'sandbox': _stamped_hash(os.path.join(self.sandbox_dir, rel), source_hash)}
+
+    def remove(self, rel):
+        """Delete the sandbox copy of a file dropped from the source, unless it was edited in place.
+
+        Returns True when the copy is gone (deleted now or already missing).
+        """
+        entry = self.files.get(rel)
+        target = os.path.join(self.sandbox_dir, rel)
+        current = _stamped_hash(target, entry and entry['sandbox'])
+        if current is not None and entry and current[2] != entry['sandbox'][2]:
+            return False
+        if current is not None:
+            os.remove(target)
+        self.files.pop(rel, None)
+        return True
+
+    def save(self):
+        os.makedirs(self.sandbox_dir, exist_ok=True)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({'version': SCHEMA_VERSION, 'source_dir': os.path.abspath(self.source_dir),
+                       'files': self.files}, f, separators=(',', ':'))
+        os.replace(tmp, self.path)
@@ -1,132 +1,18 @@
-import os
+from codemod_io import CodemodTransaction
+from codemod_templates import load_variant
 
 print("--- RESTORING GRC FUNCTIONAL MODALS & TYPES ---")
 
 base_dir = 'app/components/vendor-risk'
 
 # 1. TYPES.TS
-code_types = """export interface VendorArtifact {
-  id: string;
-  name: string;
-  vendorName: string;
-  type: string;
-  criticality: 'HIGH' | 'MED' | 'LOW';
-  url: string;
-  expiry: string | null;
-  created_at: string;
-  updated_at: string;
-  status?: string; 
-}
-"""
+code_types = load_variant('restore_functionality.code_types')
 
 # 2. ARTIFACTDRAWER.TSX
-code_drawer = """'use client';
-import React from 'react';
-import { X, FileText, Calendar, Shield, Download, ExternalLink } from 'lucide-react';
-
-export default function ArtifactDrawer({ isOpen, onClose, doc }: any) {
-  if (!isOpen || !doc) return null;
-
-  return (
-    <div className="fixed inset-0 z-50 flex justify-end">
-      <div className="absolute inset-0 bg-black/60 backdrop-blur-sm" onClick={onClose} />
-      <div className="relative w-full max-w-md bg-[#0d1117] border-l border-[#30363d] shadow-2xl flex flex-col">
-        <div className="p-4 border-b border-[#30363d] flex items-center justify-between bg-[#161b22]">
-          <h2 className="text-sm font-bold text-gray-200">ARTIFACT INSPECTOR</h2>
-          <button onClick={onClose} className="p-1 hover:bg-gray-800 rounded text-gray-400"><X className="w-4 h-4" /></button>
-        </div>
-        <div className="flex-1 overflow-y-auto p-6 space-y-6">
-          <div className="flex items-center gap-4 p-4 bg-[#161b22] rounded-lg border border-[#30363d]">
-            <div className="p-3 bg-blue-500/10 rounded-lg"><FileText className="w-6 h-6 text-blue-400" /></div>
-            <div>
-              <div className="text-sm font-bold text-white truncate w-56">{doc.name}</div>
-              <div className="text-xs text-blue-400 font-semibold">{doc.vendorName}</div>
-            </div>
-          </div>
-          <div className="grid grid-cols-2 gap-4 text-[11px]">
-            <div className="p-3 bg-[#161b22] border border-[#30363d] rounded">
-              <div className="text-gray-500 mb-1">TYPE</div>
-              <div className="text-gray-200 font-bold">{doc.type}</div>
-            </div>
-            <div className="p-3 bg-[#161b22] border border-[#30363d] rounded">
-              <div className="text-gray-500 mb-1">CRITICALITY</div>
-              <div className="font-bold" style={{ color: doc.criticality === 'HIGH' ? '#fc8181' : '#68d391' }}>{doc.criticality}</div>
-            </div>
-          </div>
-          <div className="space-y-3">
-            <h3 className="text-[10px] font-bold text-gray-500 uppercase tracking-widest">Compliance Timeline</h3>
-            <div className="space-y-2">
-               <div className="flex justify-between text-xs p-2 bg-[#0d1117] border border-[#30363d] rounded">
-                 <span className="text-gray-500">Uploaded</span>
-                 <span className="text-gray-300 font-mono">{new Date(doc.created_at).toLocaleDateString()}</span>
-               </div>
-               <div className="flex justify-between text-xs p-2 bg-[#0d1117] border border-[#30363d] rounded">
-                 <span className="text-gray-500">Expiry Date</span>
-                 <span className="text-orange-400 font-mono">{doc.expiry ? new Date(doc.expiry).toLocaleDateString() : 'Permanent'}</span>
-               </div>
-            </div>
-          </div>
-        </div>
-        <div className="p-4 bg-[#161b22] border-t border-[#30363d] grid grid-cols-2 gap-3">
-          <a href={doc.url} target="_blank" className="flex items-center justify-center gap-2 py-2 bg-[#21262d] hover:bg-[#30363d] border border-[#30363d] rounded text-xs text-white transition-colors">
-            <ExternalLink className="w-3 h-3" /> View Original
-          </a>
-          <a href={doc.url} download className="flex items-center justify-center gap-2 py-2 bg-blue-600 hover:bg-blue-500 rounded text-xs text-white font-bold transition-colors">
-            <Download className="w-3 h-3" /> Download
-          </a>
-        </div>
-      </div>
-    </div>
-  );
-}
-"""
+code_drawer = load_variant('restore_functionality.code_drawer')
 
 # 3. UPLOADARTIFACTMODAL.TSX (Logic Restoration)
-code_upload = """'use client';
-import React, { useState } from 'react';
-import { X, Upload, Loader2 } from 'lucide-react';
-import { createClient } from '@/lib/supabase/client';
-
-export default function UploadArtifactModal({ isOpen, onClose, onUploadComplete }: any) {
-  const [loading, setLoading] = useState(false);
-  const supabase = createClient();
-
-  if (!isOpen) return null;
-
-  const handleUpload = async (e: any) => {
-    e.preventDefault();
-    setLoading(true);
-    // Logic for Supabase Storage Upload would go here
-    setTimeout(() => {
-      setLoading(false);
-      onClose();
-      if(onUploadComplete) onUploadComplete();
-    }, 1500);
-  };
-
-  return (
-    <div className="fixed inset-0 z-[100] flex items-center justify-center p-4">
-      <div className="absolute inset-0 bg-black/80 backdrop-blur-sm" onClick={onClose} />
-      <div className="relative w-full max-w-lg bg-[#0d1117] border border-[#30363d] rounded-xl shadow-2xl overflow-hidden">
-        <div className="p-4 border-b border-[#30363d] flex justify-between items-center bg-[#161b22]">
-          <h2 className="text-xs font-extrabold text-white tracking-tighter">UPLOAD COMPLIANCE ARTIFACT</h2>
-          <button onClick={onClose} className="text-gray-500 hover:text-white"><X className="w-4 h-4" /></button>
-        </div>
-        <form onSubmit={handleUpload} className="p-6 space-y-4">
-          <div className="border-2 border-dashed border-[#30363d] rounded-lg p-8 text-center hover:border-blue-500/50 transition-colors">
-            <Upload className="w-8 h-8 text-gray-600 mx-auto mb-2" />
-            <p className="text-xs text-gray-400">Drag and drop artifact or click to browse</p>
-            <input type="file" className="hidden" />
-          </div>
-          <button type="submit" disabled={loading} className="w-full py-2 bg-blue-600 hover:bg-blue-500 text-white rounded font-bold text-xs flex items-center justify-center gap-2">
-            {loading ? <Loader2 className="w-3 h-3 animate-spin" /> : 'Process Artifact'}
-          </button>
-        </form>
-      </div>
-    </div>
-  );
-}
-"""
+code_upload = load_variant('restore_functionality.code_upload')
 
 # WRITING FILES
 files = {
@@ -135,9 +21,9 @@ files = {
     'UploadArtifactModal.tsx': code_upload
 }
 
-for filename, content in files.items():
-    with open(f"{base_dir}/{filename}", 'w') as f:
-        f.write(content)
-    print(f"✅ RESTORED: {filename}")
+with CodemodTransaction() as txn:
+    for filename, content in files.items():
+        txn.write(f"{base_dir}/{filename}", content)
+        print(f"✅ RESTORED: {filename}")
 
 print("--- RESTORATION COMPLETE ---")
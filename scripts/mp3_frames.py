@@ -0,0 +1,418 @@
+"""MP3 frame parsing and frame-accurate concatenation for the training-audio scripts.
+
+Joining MP3 files with `b"".join` leaves each part's ID3 tag and Xing/Info frame in
+the middle of the stream and gives players a header describing only the first part.
+`concat_mp3` instead walks the MPEG audio frames of every part, drops tags and
+per-part info frames, inserts pre-encoded silent frames for pauses, and prefixes one
+Xing/Info frame (frame count, byte count, seek TOC) describing the joined stream.
+Nothing is decoded or re-encoded.
+"""
+
+from __future__ import annotations
+
+import errno
+import mmap
+import os
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Iterator, NamedTuple, Sequence
+
+# Bitrates (kbit/s) by [MPEG-1?][layer][index]; index 0 = free format, 15 = invalid.
+_BITRATES = {
+    True: {
+        1: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+        2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+        3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    },
+    False: {
+        1: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+        2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+        3: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    },
+}
+# Sample rates by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5).
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_LAYERS = {3: 1, 2: 2, 1: 3}
+
+# Like shutil, only use sendfile for file-to-file copies on Linux; macOS's sendfile
+# needs a socket as the output. The errno set covers kernels or filesystems that refuse.
+_USE_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+_NO_SENDFILE = {errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSOCK}
+if hasattr(errno, "ENOTSUP"):
+    _NO_SENDFILE.add(errno.ENOTSUP)
+_IOV_MAX = 1024
+
+XING_FRAMES = 0x1
+XING_BYTES = 0x2
+XING_TOC = 0x4
+
+
+class FrameHeader(NamedTuple):
+    raw: bytes  # the 4 header bytes
+    version_bits: int
+    layer: int
+    bitrate_index: int
+    bitrate: int  # bit/s
+    sample_rate: int
+    padding: int
+    channel_mode: int  # 3 = mono
+    length: int  # whole frame, header included
+
+    @property
+    def mpeg1(self) -> bool:
+        return self.version_bits == 3
+
+    @property
+    def samples(self) -> int:
+        if self.layer == 1:
+            return 384
+        if self.layer == 2 or self.mpeg1:
+            return 1152
+        return 576
+
+    @property
+    def side_info_length(self) -> int:
+        if self.layer != 3:
+            return 0
+        if self.mpeg1:
+            return 17 if self.channel_mode == 3 else 32
+        return 9 if self.channel_mode == 3 else 17
+
+    def same_stream(self, other: FrameHeader) -> bool:
+        """Frames that can share one stream: same MPEG version, layer, sample rate and channel mode."""
+        return (self.version_bits, self.layer, self.sample_rate, self.channel_mode) == (
+            other.version_bits,
+            other.layer,
+            other.sample_rate,
+            other.channel_mode,
+        )
+
+
+def _frame_length(mpeg1: bool, layer: int, bitrate: int, sample_rate: int, padding: int) -> int:
+    if layer == 1:
+        return (12 * bitrate // sample_rate + padding) * 4
+    if layer == 3 and not mpeg1:
+        return 72 * bitrate // sample_rate + padding
+    return 144 * bitrate // sample_rate + padding
+
+
+def parse_header(data: bytes | memoryview, offset: int = 0) -> FrameHeader | None:
+    """The frame header at `offset`, or None if the bytes there are not a usable MPEG audio header."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2, b3 = data[offset], data[offset + 1], data[offset + 2], data[offset + 3]
+    if b0 != 0xFF or (b1 & 0xE0) != 0xE0:
+        return None
+    version_bits = (b1 >> 3) & 0x3
+    layer = _LAYERS.get((b1 >> 1) & 0x3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 0x3
+    if version_bits == 1 or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version_bits == 3
+    bitrate = _BITRATES[mpeg1][layer][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][rate_index]
+    padding = (b2 >> 1) & 0x1
+    return FrameHeader(
+        raw=bytes((b0, b1, b2, b3)),
+        version_bits=version_bits,
+        layer=layer,
+        bitrate_index=bitrate_index,
+        bitrate=bitrate,
+        sample_rate=sample_rate,
+        padding=padding,
+        channel_mode=b3 >> 6,
+        length=_frame_length(mpeg1, layer, bitrate, sample_rate, padding),
+    )
+
+
+def audio_bounds(data: bytes | memoryview) -> tuple[int, int]:
+    """(start, end) of the audio in `data`, excluding a leading ID3v2 tag and a trailing ID3v1 tag."""
+    start, end = 0, len(data)
+    while end - start >= 10 and bytes(data[start : start + 3]) == b"ID3":
+        size = 0
+        for byte in data[start + 6 : start + 10]:
+            size = (size << 7) | (byte & 0x7F)  # syncsafe integer
+        footer = 10 if data[start + 5] & 0x10 else 0
+        start += 10 + size + footer
+    if end - start >= 128 and bytes(data[end - 128 : end - 125]) == b"TAG":
+        end -= 128
+    return min(start, end), end
+
+
+def is_info_frame(data: bytes | memoryview, offset: int, header: FrameHeader) -> bool:
+    """True for an encoder's Xing/Info (or VBRI) header frame, which carries no audio."""
+    tag_at = offset + 4 + header.side_info_length
+    if bytes(data[tag_at : tag_at + 4]) in (b"Xing", b"Info"):
+        return True
+    return bytes(data[offset + 36 : offset + 40]) == b"VBRI"
+
+
+def iter_frames(data: bytes | memoryview) -> Iterator[tuple[int, FrameHeader]]:
+    """(offset, header) of each audio frame, skipping tags, info frames and junk between frames."""
+    start, end = audio_bounds(data)
+    offset = start
+    stream: FrameHeader | None = None
+    while offset + 4 <= end:
+        header = parse_header(data, offset)
+        if (
+            header is None
+            or offset + header.length > end
+            or (stream is not None and not header.same_stream(stream))
+        ):
+            offset += 1  # resynchronize on the next candidate header
+            continue
+        if stream is None:
+            # A lone 0xFFE pattern in junk can look like a header: unless it sits right where
+            # the audio starts, require a valid successor.
+            successor = offset + header.length
+            if offset != start and successor + 4 <= end and parse_header(data, successor) is None:
+                offset += 1
+                continue
+            stream = header
+            if is_info_frame(data, offset, header):
+                offset += header.length
+                continue
+        yield offset, header
+        offset += header.length
+
+
+def _header_bytes(template: FrameHeader, bitrate_index: int) -> bytes:
+    b1 = template.raw[1] | 0x01  # no CRC
+    b2 = (bitrate_index << 4) | (template.raw[2] & 0x0C)  # keep sample rate, clear padding/private
+    return bytes((0xFF, b1, b2, template.raw[3]))
+
+
+def silent_frame(template: FrameHeader) -> bytes:
+    """One frame of digital silence in `template`'s format (zero side info = no main data)."""
+    if template.layer != 3:
+        raise ValueError("silent frames are only generated for Layer III streams")
+    return _header_bytes(template, template.bitrate_index) + bytes(template.length - template.padding - 4)
+
+
+def silence_frames(template: FrameHeader, seconds: float) -> int:
+    return round(seconds * template.sample_rate / template.samples)
+
+
+class _FrameOffsets:
+    """Byte offsets of every `stride`-th frame, thinned as the stream grows so memory stays bounded.
+
+    The seek TOC only has 100 entries, so a few thousand evenly spaced samples place
+    each entry to well within 0.1% of the stream.
+    """
+
+    LIMIT = 4096
+
+    def __init__(self) -> None:
+        self.samples = array("Q")
+        self.stride = 1
+        self.count = 0
+        self.end = 0
+
+    def add(self, length: int) -> None:
+        """Record a frame of `length` bytes starting at the current end of the stream."""
+        if self.count % self.stride == 0:
+            self.samples.append(self.end)
+            if len(self.samples) >= self.LIMIT:
+                self.samples = self.samples[::2]
+                self.stride *= 2
+        self.count += 1
+        self.end += length
+
+    def offset_of(self, frame: int) -> int:
+        """Offset of the nearest sampled frame at or before `frame`."""
+        return self.samples[frame // self.stride]
+
+
+def _info_frame(template: FrameHeader, frames: _FrameOffsets, vbr: bool) -> bytes:
+    """A Xing (VBR) or Info (CBR) frame describing the audio frames recorded in `frames`."""
+    tag_at = 4 + template.side_info_length
+    needed = tag_at + 4 + 4 + 4 + 4 + 100
+    mpeg1 = template.mpeg1
+    for index in range(1, 15):
+        bitrate = _BITRATES[mpeg1][template.layer][index] * 1000
+        length = _frame_length(mpeg1, template.layer, bitrate, template.sample_rate, 0)
+        if length >= needed:
+            break
+    else:
+        raise ValueError("no bitrate large enough to hold a Xing header")
+
+    frame_count = frames.count
+    total_bytes = length + frames.end
+    toc = bytearray(100)
+    if frame_count:
+        for i in range(100):
+            toc[i] = min(255, (length + frames.offset_of(i * frame_count // 100)) * 256 // total_bytes)
+    body = bytearray(length - 4)
+    body[tag_at - 4 : tag_at] = b"Xing" if vbr else b"Info"
+    body[tag_at : tag_at + 4] = (XING_FRAMES | XING_BYTES | XING_TOC).to_bytes(4, "big")
+    body[tag_at + 4 : tag_at + 8] = frame_count.to_bytes(4, "big")
+    body[tag_at + 8 : tag_at + 12] = total_bytes.to_bytes(4, "big")
+    body[tag_at + 12 : tag_at + 112] = toc
+    return _header_bytes(template, index) + bytes(body)
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _append_range(out_fd: int, src_fd: int, data: mmap.mmap, start: int, end: int) -> None:
+    """Append bytes [start, end) of the source file to `out_fd` (kernel-side via sendfile when possible)."""
+    if _USE_SENDFILE:
+        offset = start
+        try:
+            while offset < end:
+                sent = os.sendfile(out_fd, src_fd, offset, end - offset)
+                if sent == 0:
+                    raise ValueError("source file shrank while it was being appended")
+                offset += sent
+            return
+        except OSError as exc:
+            if offset != start or exc.errno not in _NO_SENDFILE:
+                raise
+    with memoryview(data) as view:
+        _write_all(out_fd, view[start:end])
+
+
+def _append_repeated(out_fd: int, frame: bytes, count: int) -> None:
+    """Append `count` copies of `frame` with vectored writes, without building the repeated buffer."""
+    while count > 0:
+        batch = min(count, _IOV_MAX)
+        if hasattr(os, "writev"):
+            written = os.writev(out_fd, [frame] * batch)
+            if written < batch * len(frame):  # short write: finish this batch the simple way
+                _write_all(out_fd, (frame * batch)[written:])
+        else:
+            _write_all(out_fd, frame * batch)
+        count -= batch
+
+
+def concat_mp3(parts: Sequence[tuple[Path, float]], output: Path) -> int:
+    """Join (mp3 path, pause seconds after it) parts into `output`; returns the audio frame count.
+
+    Streams: each part is mmapped and its frames are appended with sendfile in
+    contiguous runs, silence goes out through writev, and the Xing/Info frame is
+    written into a slot reserved at the start once the totals are known. Memory
+    stays flat however long the output is. The result is renamed over `output`.
+    """
+    template: FrameHeader | None = None
+    frames = _FrameOffsets()  # relative to the first audio frame
+    bitrates: set[int] = set()
+    staging = output.with_name(f".{output.name}.tmp")
+
+    out_fd = os.open(staging, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        for path, pause in parts:
+            with open(path, "rb") as src:
+                if os.fstat(src.fileno()).st_size:
+                    with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                        run_start = run_end = 0
+                        for offset, header in iter_frames(data):
+                            if template is None:
+                                template = header
+                                slot = len(_info_frame(template, _FrameOffsets(), vbr=False))
+                                _write_all(out_fd, bytes(slot))  # reserved for the Xing/Info frame
+                            elif not header.same_stream(template):
+                                raise ValueError(
+                                    f"{path.name}: {header.sample_rate} Hz / mode {header.channel_mode} "
+                                    f"does not match {template.sample_rate} Hz / mode {template.channel_mode} "
+                                    "of the first part"
+                                )
+                            if offset != run_end:
+                                _append_range(out_fd, src.fileno(), data, run_start, run_end)
+                                run_start = offset
+                            run_end = offset + header.length
+                            frames.add(header.length)
+                            bitrates.add(header.bitrate)
+                        _append_range(out_fd, src.fileno(), data, run_start, run_end)
+            if pause > 0:
+                if template is None:
+                    raise ValueError(f"{path.name}: no MPEG audio frames to take the silence format from")
+                silence = silent_frame(template)
+                count = silence_frames(template, pause)
+                _append_repeated(out_fd, silence, count)
+                for _ in range(count):
+                    frames.add(len(silence))
+
+        if template is None:
+            raise ValueError("no MPEG audio frames in any part")
+        os.lseek(out_fd, 0, os.SEEK_SET)
+        _write_all(out_fd, _info_frame(template, frames, vbr=len(bitrates) > 1))
+    except BaseException:
+        os.close(out_fd)
+        staging.unlink(missing_ok=True)
+        raise
+    os.close(out_fd)
+    os.replace(staging, output)
+    return frames.count
+
+
+def _self_test() -> None:
+    global _USE_SENDFILE
+    # MPEG-2 Layer III, 24 kHz, 48 kbit/s mono: 144-byte frames of 576 samples (24 ms).
+    header = parse_header(bytes((0xFF, 0xF3, 0x64, 0xC4)))
+    assert header is not None
+    assert (header.sample_rate, header.bitrate, header.length, header.samples) == (24000, 48000, 144, 576)
+    frame = silent_frame(header)
+    assert len(frame) == 144 and parse_header(frame) == header
+
+    id3 = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"tagxx"
+    three = _FrameOffsets()
+    for _ in range(3):
+        three.add(144)
+    xing = _info_frame(header, three, vbr=False)
+    part = id3 + xing + frame * 3 + b"TAG" + bytes(125)
+    assert [offset for offset, _ in iter_frames(part)] == [15 + len(xing), 15 + len(xing) + 144, 15 + len(xing) + 288]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        (tmp / "a.mp3").write_bytes(part)
+        (tmp / "b.mp3").write_bytes(frame * 2)
+        frames = concat_mp3([(tmp / "a.mp3", 2.0), (tmp / "b.mp3", 0.0)], tmp / "out.mp3")
+        assert frames == 3 + round(2.0 * 24000 / 576) + 2
+        joined = (tmp / "out.mp3").read_bytes()
+        assert b"ID3" not in joined and b"TAG" not in joined
+        assert joined.count(b"Info") == 1 and joined[13:17] == b"Info"
+        assert int.from_bytes(joined[21:25], "big") == frames
+        assert int.from_bytes(joined[25:29], "big") == len(joined)
+        assert len(list(iter_frames(joined))) == frames
+
+        (tmp / "c.mp3").write_bytes(frame + b"\x00junk" + frame)  # two runs, appended separately
+        assert concat_mp3([(tmp / "c.mp3", 0.0)], tmp / "c-out.mp3") == 2
+        assert (tmp / "c-out.mp3").read_bytes()[len(xing) :] == frame * 2
+        assert not list(tmp.glob(".*.tmp"))
+
+        # The plain-write fallback: no sendfile at all, and a sendfile that refuses regular files (macOS).
+        use_sendfile, real_sendfile = _USE_SENDFILE, getattr(os, "sendfile", None)
+
+        def not_a_socket(*_args):
+            raise OSError(errno.ENOTSOCK, os.strerror(errno.ENOTSOCK))
+
+        try:
+            for forced, sendfile in ((False, real_sendfile), (True, not_a_socket)):
+                _USE_SENDFILE, os.sendfile = forced, sendfile
+                concat_mp3([(tmp / "a.mp3", 2.0), (tmp / "b.mp3", 0.0)], tmp / "plain.mp3")
+                assert (tmp / "plain.mp3").read_bytes() == joined
+        finally:
+            _USE_SENDFILE = use_sendfile
+            if real_sendfile is None:
+                del os.sendfile
+            else:
+                os.sendfile = real_sendfile
+
+    offsets = _FrameOffsets()
+    for _ in range(10 * _FrameOffsets.LIMIT):
+        offsets.add(100)
+    assert len(offsets.samples) < _FrameOffsets.LIMIT and offsets.end == 1000 * _FrameOffsets.LIMIT
+    frame = 7 * _FrameOffsets.LIMIT + 5
+    assert 0 <= frame * 100 - offsets.offset_of(frame) < offsets.stride * 100
+    print("mp3_frames self-test ok")
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
@@ -8,27 +8,31 @@ Registers:
 Source markdown:
   docs/sales/founder-elevator-pitch-audio-script.md
   docs/sales/founder-elevator-pitch-casual-audio-script.md
+
+`--backend offline` swaps Edge TTS for a local stand-in (no network; see tts_backends.py).
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
 import json
 import re
 import sys
-import tempfile
 from pathlib import Path
 
 SCRIPTS_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-import edge_tts
-
+from mp3_frames import concat_mp3
 from spoken_narration import (
+    NarrationSegment,
     assert_spoken_narration_safe,
     extract_narration_segments,
 )
+from tts_backends import TtsBackend, backend_cache_version
+from tts_pipeline import TtsRunner, add_runner_arguments, open_backend, open_cache
 
 ROOT = Path(__file__).resolve().parents[1]
 OUT_DIR = ROOT / "public" / "training-audio"
@@ -57,28 +61,29 @@ def split_sentences(text: str) -> list[str]:
     return [part.strip() for part in parts if part.strip()]
 
 
-def load_sentence_units(script: Path) -> list[str]:
+def load_sentence_units(script: Path) -> list[NarrationSegment]:
+    """Sentences to synthesize, each with the pause (seconds) that follows it in the full track."""
     markdown = script.read_text(encoding="utf-8")
     segments = extract_narration_segments(markdown)
     if not segments:
         raise ValueError(f"No spoken narration extracted from {script.relative_to(ROOT)}")
 
-    sentences: list[str] = []
-    for text, _pause in segments:
+    sentences: list[NarrationSegment] = []
+    for text, pause in segments:
         assert_spoken_narration_safe(text)
         units = split_sentences(text)
         if not units:
             raise ValueError(f"Segment produced no sentences: {text!r}")
-        sentences.extend(units)
+        sentences.extend((unit, 0.0) for unit in units[:-1])
+        sentences.append((units[-1], pause))
     return sentences
 
 
-async def synthesize_plain_segment(text: str, output: Path) -> None:
-    communicate = edge_tts.Communicate(text, VOICE, rate=RATE)
-    await communicate.save(str(output))
+async def synthesize_plain_segment(text: str, output: Path, backend: TtsBackend) -> None:
+    await backend.synthesize(text, VOICE, RATE, output)
 
 
-async def synthesize_register(register: str) -> None:
+async def synthesize_register(register: str, runner: TtsRunner) -> None:
     cfg = REGISTERS[register]
     script: Path = cfg["script"]
     stem: str = cfg["stem"]
@@ -95,28 +100,20 @@ async def synthesize_register(register: str) -> None:
             stale.unlink()
     sentence_dir.mkdir(parents=True, exist_ok=True)
 
-    mp3_parts: list[bytes] = []
-    manifest_sentences: list[dict[str, object]] = []
-
-    with tempfile.TemporaryDirectory(prefix=f"ironframe-founder-pitch-{register}-") as tmp_dir:
-        tmp = Path(tmp_dir)
-        for index, text in enumerate(sentences):
-            part_path = tmp / f"part-{index:03d}.mp3"
-            await synthesize_plain_segment(text, part_path)
-            blob = part_path.read_bytes()
-            mp3_parts.append(blob)
-
-            dest = sentence_dir / f"{index:03d}.mp3"
-            dest.write_bytes(blob)
-            manifest_sentences.append(
-                {
-                    "index": index,
-                    "text": text,
-                    "src": f"{public_sentence_prefix}/{index:03d}.mp3",
-                }
-            )
-
-    full_output.write_bytes(b"".join(mp3_parts))
+    # Each sentence is synthesized (or linked from the cache) straight into its public
+    # file, and the full track is streamed from those files - every byte is written once.
+    sentence_paths = await runner.many(
+        [(text, sentence_dir / f"{index:03d}.mp3") for index, (text, _pause) in enumerate(sentences)]
+    )
+    concat_mp3([(path, pause) for path, (_text, pause) in zip(sentence_paths, sentences)], full_output)
+    manifest_sentences: list[dict[str, object]] = [
+        {
+            "index": index,
+            "text": text,
+            "src": f"{public_sentence_prefix}/{index:03d}.mp3",
+        }
+        for index, (text, _pause) in enumerate(sentences)
+    ]
     manifest = {
         "version": 1,
         "register": register,
@@ -143,8 +140,23 @@ async def main() -> int:
         default="commercial",
         help="commercial = catalog register; casual = peer register",
     )
+    add_runner_arguments(parser)
     args = parser.parse_args()
-    await synthesize_register(args.register)
+    backend = open_backend(args)
+    cache = open_cache(args)
+    runner = TtsRunner(
+        functools.partial(synthesize_plain_segment, backend=backend),
+        concurrency=args.concurrency,
+        retries=args.retries,
+        cache=cache,
+        voice=VOICE,
+        rate=RATE,
+        backend_version=backend_cache_version(backend),
+    )
+    await synthesize_register(args.register, runner)
+    if cache:
+        cache.trim()
+        print(cache.summary())
     return 0
 
 
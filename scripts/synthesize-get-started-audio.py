@@ -12,13 +12,17 @@ Source scripts:
 
 TTS rules:
   - edge-tts escapes all input as plain text — never pass SSML/XML (it will be spoken aloud).
-  - Pauses are implemented by synthesizing plain-text segments separately and concatenating MP3s.
+  - Pauses are implemented by synthesizing plain-text segments separately and joining their MP3
+    frames with pre-encoded silent frames in between (see mp3_frames.py).
   - source-file / ref / code fences must never reach TTS input.
+  - `--backend offline` swaps Edge TTS for a local stand-in (no network; see tts_backends.py).
 """
 
 from __future__ import annotations
 
+import argparse
 import asyncio
+import functools
 import re
 import sys
 import tempfile
@@ -27,14 +31,15 @@ from pathlib import Path
 SCRIPTS_DIR = Path(__file__).resolve().parent
 sys.path.insert(0, str(SCRIPTS_DIR))
 
-import edge_tts
-
+from mp3_frames import concat_mp3
 from spoken_narration import (
     NarrationSegment,
     assert_spoken_narration_safe,
     extract_narration_segments,
     parse_inline_break_segments,
 )
+from tts_backends import TtsBackend, backend_cache_version
+from tts_pipeline import TtsRunner, add_runner_arguments, gather_in_order, open_backend, open_cache
 
 ROOT = Path(__file__).resolve().parents[1]
 OUT_DIR = ROOT / "public" / "training-audio"
@@ -109,35 +114,52 @@ def load_segments_from_inline_text(text: str) -> list[NarrationSegment]:
     return segments
 
 
-async def synthesize_plain_segment(text: str, output: Path) -> None:
-    communicate = edge_tts.Communicate(text, VOICE, rate=RATE)
-    await communicate.save(str(output))
+async def synthesize_plain_segment(text: str, output: Path, backend: TtsBackend) -> None:
+    await backend.synthesize(text, VOICE, RATE, output)
 
 
-async def synthesize_segments(segments: list[NarrationSegment], output: Path) -> None:
+async def synthesize_segments(segments: list[NarrationSegment], output: Path, runner: TtsRunner) -> None:
     output.parent.mkdir(parents=True, exist_ok=True)
-    mp3_parts: list[bytes] = []
 
     with tempfile.TemporaryDirectory(prefix="ironframe-tts-") as tmp_dir:
         tmp = Path(tmp_dir)
-        for index, (text, _pause) in enumerate(segments):
-            part_path = tmp / f"part-{index:03d}.mp3"
-            await synthesize_plain_segment(text, part_path)
-            mp3_parts.append(part_path.read_bytes())
-
-    output.write_bytes(b"".join(mp3_parts))
-    size = output.stat().st_size
-    print(f"wrote {output.relative_to(ROOT)} ({size:,} bytes, {len(segments)} segment(s))")
+        part_paths = await runner.many(
+            [(text, tmp / f"part-{index:03d}.mp3") for index, (text, _pause) in enumerate(segments)]
+        )
+        concat_mp3([(part_path, pause) for part_path, (_text, pause) in zip(part_paths, segments)], output)
 
 
 async def main() -> int:
-    welcome_segments = load_segments_from_script(WELCOME_SCRIPT)
-    orientation_segments = load_segments_from_script(ORIENTATION_SCRIPT)
+    parser = argparse.ArgumentParser(description="Synthesize Get Started narration audio")
+    add_runner_arguments(parser)
+    args = parser.parse_args()
+    backend = open_backend(args)
+    cache = open_cache(args)
+    runner = TtsRunner(
+        functools.partial(synthesize_plain_segment, backend=backend),
+        concurrency=args.concurrency,
+        retries=args.retries,
+        cache=cache,
+        voice=VOICE,
+        rate=RATE,
+        backend_version=backend_cache_version(backend),
+    )
 
-    await synthesize_segments(welcome_segments, OUT_DIR / "get-started-welcome.mp3")
-    await synthesize_segments(orientation_segments, OUT_DIR / "get-started-orientation.mp3")
+    jobs: list[tuple[list[NarrationSegment], Path]] = [
+        (load_segments_from_script(WELCOME_SCRIPT), OUT_DIR / "get-started-welcome.mp3"),
+        (load_segments_from_script(ORIENTATION_SCRIPT), OUT_DIR / "get-started-orientation.mp3"),
+    ]
     for step_id, text in STEP_TEXT.items():
-        await synthesize_segments(load_segments_from_inline_text(text), STEPS_DIR / f"{step_id}.mp3")
+        jobs.append((load_segments_from_inline_text(text), STEPS_DIR / f"{step_id}.mp3"))
+
+    # All clips share the runner, so --concurrency bounds the whole run; report in a fixed order.
+    await gather_in_order(*(synthesize_segments(segments, output, runner) for segments, output in jobs))
+    for segments, output in jobs:
+        size = output.stat().st_size
+        print(f"wrote {output.relative_to(ROOT)} ({size:,} bytes, {len(segments)} segment(s))")
+    if cache:
+        cache.trim()
+        print(cache.summary())
     return 0
 
 
@@ -0,0 +1,132 @@
+"""TTS engines behind the training-audio scripts' `synthesize_plain_segment`.
+
+  edge    — Microsoft Edge TTS via the edge-tts package (imported on first use).
+  offline — deterministic local stand-in: no network, emits valid silent MP3 frames
+            sized to the text at a configurable latency, for tests and benchmarks.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import math
+import re
+import sys
+import tempfile
+from pathlib import Path
+from typing import Protocol
+
+
+class TtsBackend(Protocol):
+    name: str
+
+    @property
+    def version(self) -> str: ...
+
+    async def synthesize(self, text: str, voice: str, rate: str, output: Path) -> None: ...
+
+
+class EdgeTtsBackend:
+    name = "edge"
+
+    def __init__(self) -> None:
+        self._module = None
+
+    def _edge_tts(self):
+        if self._module is None:
+            import edge_tts
+
+            self._module = edge_tts
+        return self._module
+
+    @property
+    def version(self) -> str:
+        # Package metadata only, so a fully cached run never imports edge-tts at all.
+        from importlib import metadata
+
+        try:
+            return metadata.version("edge-tts")
+        except metadata.PackageNotFoundError:
+            return getattr(self._edge_tts(), "__version__", "unknown")
+
+    async def synthesize(self, text: str, voice: str, rate: str, output: Path) -> None:
+        communicate = self._edge_tts().Communicate(text, voice, rate=rate)
+        await communicate.save(str(output))
+
+
+# MPEG-2 Layer III, 24 kHz, 48 kbit/s, mono — the format Edge TTS returns by default.
+_FRAME_HEADER = bytes((0xFF, 0xF3, 0x64, 0xC4))
+_FRAME_BYTES = 144  # 72 * 48000 / 24000
+_FRAME_SECONDS = 576 / 24000
+_SIDE_INFO_BYTES = 9  # all zero: no main data, so every frame decodes to silence
+_CHARS_PER_SECOND = 15.0
+_RATE = re.compile(r"^([+-]\d+)%$")
+
+
+class OfflineBackend:
+    """Silent audio of roughly spoken length; the text's hash rides in each frame's ancillary bytes."""
+
+    name = "offline"
+    version = "1"
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+
+    @staticmethod
+    def frame_count(text: str, rate: str = "+0%") -> int:
+        match = _RATE.match(rate.strip())
+        speed = 1.0 + (int(match.group(1)) / 100 if match else 0.0)
+        seconds = len(text) / (_CHARS_PER_SECOND * max(speed, 0.1))
+        return max(1, math.ceil(seconds / _FRAME_SECONDS))
+
+    def render(self, text: str, voice: str, rate: str) -> bytes:
+        ancillary_bytes = _FRAME_BYTES - len(_FRAME_HEADER) - _SIDE_INFO_BYTES
+        digest = hashlib.sha256(f"{voice}\0{rate}\0{text}".encode("utf-8")).digest()
+        ancillary = (digest * (ancillary_bytes // len(digest) + 1))[:ancillary_bytes]
+        frame = _FRAME_HEADER + bytes(_SIDE_INFO_BYTES) + ancillary
+        return frame * self.frame_count(text, rate)
+
+    async def synthesize(self, text: str, voice: str, rate: str, output: Path) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        output.write_bytes(self.render(text, voice, rate))
+
+
+BACKENDS = ("edge", "offline")
+
+
+def create_backend(name: str, offline_latency: float = 0.0) -> TtsBackend:
+    if name == "edge":
+        return EdgeTtsBackend()
+    if name == "offline":
+        return OfflineBackend(latency=offline_latency)
+    raise ValueError(f"unknown TTS backend: {name!r} (expected one of {', '.join(BACKENDS)})")
+
+
+def backend_cache_version(backend: TtsBackend) -> str:
+    return f"{backend.name} {backend.version}"
+
+
+def _self_test() -> None:
+    backend = OfflineBackend()
+    short = backend.render("Hi.", "en-US-AriaNeural", "-5%")
+    long = backend.render("A much longer sentence than the first one.", "en-US-AriaNeural", "-5%")
+    assert len(short) % _FRAME_BYTES == 0 and len(long) > len(short)
+    assert short == backend.render("Hi.", "en-US-AriaNeural", "-5%")
+    assert short != backend.render("Hi.", "en-US-GuyNeural", "-5%")
+    for offset in range(0, len(long), _FRAME_BYTES):
+        assert long[offset : offset + 4] == _FRAME_HEADER
+    assert backend.frame_count("x" * 150, "+0%") == math.ceil(10 / _FRAME_SECONDS)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output = Path(tmp_dir) / "out.mp3"
+        asyncio.run(OfflineBackend(latency=0.001).synthesize("Hello.", "v", "+0%", output))
+        assert output.read_bytes() == backend.render("Hello.", "v", "+0%")
+    create_backend("edge")
+    assert "edge_tts" not in sys.modules  # choosing a backend must not import its engine
+    print("tts_backends self-test ok")
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
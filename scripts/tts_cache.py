@@ -0,0 +1,140 @@
+"""Content-addressed cache of synthesized TTS segments, shared by the training-audio scripts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from fast_copy import copy_file
+
+DEFAULT_MAX_MB = 512
+
+
+def link_or_copy(source: Path, dest: Path) -> str:
+    """Give `dest` the bytes of `source` as cheaply as possible; returns the mechanism used.
+
+    A hardlink shares the inode (no bytes copied); otherwise the repo's fast_copy picks
+    reflink, copy_file_range or a plain copy. Callers only ever replace these files
+    (unlink/rename), never rewrite them in place, so sharing an inode with the cache is safe.
+    """
+    try:
+        os.link(source, dest)
+        return "hardlink"
+    except OSError:
+        return copy_file(source, dest)
+
+
+def default_cache_dir() -> Path:
+    """$IRONFRAME_TTS_CACHE, else $XDG_CACHE_HOME/ironframe-tts (~/.cache/ironframe-tts)."""
+    override = os.environ.get("IRONFRAME_TTS_CACHE")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "ironframe-tts"
+
+
+def segment_key(text: str, voice: str, rate: str, backend_version: str) -> str:
+    payload = json.dumps([text, voice, rate, backend_version], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TtsCache:
+    """MP3 blobs stored as `<dir>/<key[:2]>/<key>.mp3`, evicted least-recently-used first.
+
+    A hit bumps the entry's mtime, so mtime order is use order; `trim()` deletes the
+    oldest entries until the cache is back under `max_bytes`. Entries are linked (or
+    copied) to a temp name and renamed into place, so concurrent runs never see a
+    partial blob.
+    """
+
+    def __init__(self, directory: Path | None = None, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        self.directory = Path(directory) if directory else default_cache_dir()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.mp3"
+
+    def fetch(self, key: str, output: Path) -> bool:
+        """Materialize the cached blob at `output` (hardlink, else copy); False on a miss."""
+        entry = self._path(key)
+        try:
+            os.utime(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        output.unlink(missing_ok=True)
+        link_or_copy(entry, output)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, source: Path) -> None:
+        entry = self._path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry.parent / f".{entry.name}.{os.getpid()}-{os.urandom(4).hex()}.tmp"
+        try:
+            link_or_copy(source, tmp)
+            os.replace(tmp, entry)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def trim(self) -> int:
+        """Evict least-recently-used entries until the cache fits; returns the number removed."""
+        entries = []
+        total = 0
+        for entry in self.directory.glob("??/*.mp3"):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+            total += stat.st_size
+        removed = 0
+        for _mtime, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def summary(self) -> str:
+        return f"tts cache: {self.hits} hit(s), {self.misses} synthesized ({self.directory})"
+
+
+def _self_test() -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        cache = TtsCache(tmp / "cache", max_bytes=10)
+        key_a = segment_key("Hello.", "en-US-GuyNeural", "-5%", "1")
+        assert key_a != segment_key("Hello.", "en-US-GuyNeural", "+0%", "1")
+        assert key_a != segment_key("Hello.", "en-US-GuyNeural", "-5%", "2")
+        assert not cache.fetch(key_a, tmp / "out.mp3")
+
+        (tmp / "a.mp3").write_bytes(b"aaaaaa")
+        cache.store(key_a, tmp / "a.mp3")
+        assert cache.fetch(key_a, tmp / "out.mp3")
+        assert (tmp / "out.mp3").read_bytes() == b"aaaaaa"
+
+        key_b = segment_key("World.", "en-US-GuyNeural", "-5%", "1")
+        (tmp / "b.mp3").write_bytes(b"bbbbbb")
+        cache.store(key_b, tmp / "b.mp3")
+        os.utime(cache._path(key_a), ns=(1, 1))  # a is now the least recently used
+        assert cache.trim() == 1
+        assert not cache._path(key_a).exists() and cache._path(key_b).exists()
+        assert (cache.hits, cache.misses) == (1, 1)
+    print("tts_cache self-test ok")
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
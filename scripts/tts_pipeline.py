@@ -0,0 +1,206 @@
+"""Bounded-concurrency TTS synthesis shared by the training-audio scripts."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import sys
+import tempfile
+from pathlib import Path
+from typing import Awaitable, Callable, Sequence, TypeVar
+
+from tts_backends import BACKENDS, TtsBackend, create_backend
+from tts_cache import DEFAULT_MAX_MB, TtsCache, segment_key
+
+T = TypeVar("T")
+SynthesizeFn = Callable[[str, Path], Awaitable[None]]
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF_SECONDS = 1.0
+
+
+class SynthesisError(RuntimeError):
+    """A segment still failed after every retry."""
+
+
+class TtsRunner:
+    """Runs `synthesize(text, output)` calls with at most `concurrency` in flight.
+
+    One runner is shared by every output of a script run, so the limit applies to
+    the whole run rather than per file. Each segment is retried with exponential
+    backoff (plus jitter); results are always returned in job order. With a `cache`,
+    segments already synthesized for the same (text, voice, rate, backend version)
+    are taken from it without a TTS call or a concurrency slot.
+    """
+
+    def __init__(
+        self,
+        synthesize: SynthesizeFn,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = DEFAULT_BACKOFF_SECONDS,
+        cache: TtsCache | None = None,
+        voice: str = "",
+        rate: str = "",
+        backend_version: str = "",
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._synthesize = synthesize
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.retries = retries
+        self.backoff = backoff
+        self.cache = cache
+        self._cache_context = (voice, rate, backend_version)
+
+    async def segment(self, text: str, output: Path) -> Path:
+        key = segment_key(text, *self._cache_context) if self.cache else None
+        if key and self.cache.fetch(key, output):
+            return output
+        # The output may be a hardlink to a cache entry; never let the backend write through it.
+        output.unlink(missing_ok=True)
+        attempt = 0
+        while True:
+            async with self._semaphore:
+                try:
+                    await self._synthesize(text, output)
+                    if not output.exists() or output.stat().st_size == 0:
+                        raise SynthesisError(f"TTS returned no audio for {text[:60]!r}")
+                    if key:
+                        self.cache.store(key, output)
+                    return output
+                except asyncio.CancelledError:
+                    raise
+                except Exception as exc:
+                    if attempt >= self.retries:
+                        raise SynthesisError(
+                            f"TTS failed after {attempt + 1} attempt(s) for {text[:60]!r}: {exc}"
+                        ) from exc
+                    error = exc
+            # Back off outside the semaphore so a retrying segment does not hold a slot.
+            delay = self.backoff * (2**attempt) * (0.5 + random.random() / 2)
+            attempt += 1
+            print(f"retry {attempt}/{self.retries} in {delay:.1f}s: {error}", file=sys.stderr)
+            await asyncio.sleep(delay)
+
+    async def many(self, jobs: Sequence[tuple[str, Path]]) -> list[Path]:
+        """Synthesize every (text, output) job; the first hard failure cancels the rest."""
+        return await gather_in_order(*(self.segment(text, output) for text, output in jobs))
+
+
+def add_runner_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="edge",
+        help="edge = Microsoft Edge TTS; offline = local stand-in emitting silent MP3 frames (default: edge)",
+    )
+    parser.add_argument(
+        "--offline-latency",
+        type=float,
+        default=0.0,
+        help="seconds the offline backend waits per segment, to simulate network latency",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"TTS requests in flight at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=f"retries per segment, with exponential backoff (default: {DEFAULT_RETRIES})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help="TTS segment cache (default: $IRONFRAME_TTS_CACHE or ~/.cache/ironframe-tts)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_MB,
+        help=f"evict least-recently-used segments beyond this size (default: {DEFAULT_MAX_MB})",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="always synthesize; do not read or fill the cache")
+
+
+def open_backend(args: argparse.Namespace) -> TtsBackend:
+    return create_backend(args.backend, offline_latency=args.offline_latency)
+
+
+def open_cache(args: argparse.Namespace) -> TtsCache | None:
+    if args.no_cache:
+        return None
+    return TtsCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+
+
+async def gather_in_order(*coros: Awaitable[T]) -> list[T]:
+    """Await `coros` concurrently; on failure cancel the siblings before re-raising."""
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+def _self_test() -> None:
+    in_flight = 0
+    peak = 0
+    calls: dict[str, int] = {}
+
+    async def fake(text: str, output: Path) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        try:
+            calls[text] = calls.get(text, 0) + 1
+            await asyncio.sleep(0.01 * (len(text) % 3))
+            if text == "flaky" and calls[text] < 3:
+                raise ConnectionError("transient")
+            output.write_bytes(text.encode("utf-8"))
+        finally:
+            in_flight -= 1
+
+    async def run(tmp: Path) -> None:
+        runner = TtsRunner(fake, concurrency=2, retries=3, backoff=0.001)
+        texts = ["a", "bb", "flaky", "ccc", "d"]
+        paths = await runner.many([(text, tmp / f"{i:03d}.mp3") for i, text in enumerate(texts)])
+        assert [p.read_text() for p in paths] == texts
+        assert peak <= 2
+        assert calls["flaky"] == 3
+
+        failing = TtsRunner(fake, concurrency=1, retries=0, backoff=0.001)
+        calls["flaky"] = 0
+        try:
+            await failing.many([("flaky", tmp / "x.mp3")])
+        except SynthesisError:
+            pass
+        else:
+            raise AssertionError("expected SynthesisError")
+
+        cache = TtsCache(tmp / "cache")
+        cached = TtsRunner(fake, cache=cache, voice="v", rate="r", backend_version="1")
+        await cached.many([(text, tmp / f"first-{text}.mp3") for text in texts])
+        before = dict(calls)
+        paths = await cached.many([(text, tmp / f"again-{text}.mp3") for text in texts])
+        assert calls == before
+        assert [p.read_text() for p in paths] == texts
+        assert (cache.hits, cache.misses) == (5, 5)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        asyncio.run(run(Path(tmp_dir)))
+    print("tts_pipeline self-test ok")
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
@@ -0,0 +1,279 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from fast_copy import copy_file
+from fast_walk import walk_files
+
+# Content-addressed restore points for the vendor-risk components, instead of one
+# restore_*.py script per point in time.
+#
+#   .snapshots/objects/ab/cdef...      file contents, named by sha256, stored once
+#   .snapshots/snapshots/<name>.json   {"files": {path: [sha256, mode]}, "partial": bool, ...}
+#
+# Taking a snapshot only copies contents the store has never seen (by reflink
+# where the filesystem can); restoring rewrites only the files whose hash
+# differs. Restored files are reflinked from the store when possible and
+# otherwise copied - never hardlinked by default, because the codemod scripts
+# rewrite files in place and would corrupt a shared inode; --link opts into
+# hardlinks for read-only previews.
+#
+# Usage: python3 snapshot_store.py take 1pm [--note "..."]
+#        python3 snapshot_store.py restore 1pm [--dry-run] [--link]
+#        python3 snapshot_store.py list | show NAME | diff NAME [OTHER] | delete NAME | gc
+#        python3 snapshot_store.py import-script restore_1pm.py --name 1pm
+
+STORE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.snapshots')
+DEFAULT_ROOTS = ('app/components/vendor-risk', 'app/reports/vendor-risk')
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SnapshotStore:
+    def __init__(self, store_dir=STORE_DIR, roots=DEFAULT_ROOTS, base_dir='.'):
+        self.store_dir = store_dir
+        self.roots = list(roots)
+        self.base_dir = base_dir  # snapshot paths are relative to this directory
+        self.objects_dir = os.path.join(store_dir, 'objects')
+        self.snapshots_dir = os.path.join(store_dir, 'snapshots')
+
+    # --- objects -------------------------------------------------------------
+
+    def object_path(self, sha):
+        return os.path.join(self.objects_dir, sha[:2], sha[2:])
+
+    def _store_object(self, path, sha):
+        """Add `path`'s content under `sha` unless it is already there; returns True if stored."""
+        target = self.object_path(sha)
+        if os.path.exists(target):
+            return False
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        tmp = f"{target}.{os.getpid()}.tmp"
+        copy_file(path, tmp)
+        os.chmod(tmp, 0o444)
+        os.replace(tmp, target)
+        return True
+
+    # --- snapshots -----------------------------------------------------------
+
+    def _snapshot_file(self, name):
+        if not name or os.sep in name or name.startswith('.'):
+            raise ValueError(f"Invalid snapshot name: {name!r}")
+        return os.path.join(self.snapshots_dir, f"{name}.json")
+
+    def names(self):
+        try:
+            return sorted(n[:-len('.json')] for n in os.listdir(self.snapshots_dir) if n.endswith('.json'))
+        except OSError:
+            return []
+
+    def load(self, name):
+        try:
+            with open(self._snapshot_file(name), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise KeyError(f"No snapshot named '{name}' (have: {', '.join(self.names()) or 'none'})") from None
+
+    def _save(self, snapshot):
+        os.makedirs(self.snapshots_dir, exist_ok=True)
+        path = self._snapshot_file(snapshot['name'])
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(snapshot, f, indent=2, sort_keys=True)
+        os.replace(tmp, path)
+
+    def working_files(self, roots=None):
+        """{relative path: absolute path} for every file under the snapshot roots."""
+        found = {}
+        for root in roots or self.roots:
+            for path in walk_files(os.path.join(self.base_dir, root)):
+                found[os.path.relpath(path, self.base_dir).replace(os.sep, '/')] = path
+        return found
+
+    def take(self, name, note=None, files=None, partial=False, replace=False):
+        """Record the current content of the roots (or just `files`) as snapshot `name`."""
+        if not replace and os.path.exists(self._snapshot_file(name)):
+            raise FileExistsError(f"Snapshot '{name}' already exists (use --replace to overwrite it)")
+        started = time.perf_counter()
+        paths = self.working_files() if files is None else files
+        entries, new_objects = {}, 0
+        for rel, path in sorted(paths.items()):
+            sha = file_sha256(path)
+            new_objects += self._store_object(path, sha)
+            entries[rel] = [sha, os.stat(path).st_mode & 0o777]
+        snapshot = {'name': name, 'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'), 'note': note,
+                    'roots': self.roots, 'partial': partial, 'files': entries}
+        self._save(snapshot)
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"📸 Snapshot '{name}': {len(entries)} file(s), {new_objects} new object(s) in {elapsed:.1f} ms")
+        return snapshot
+
+    def diff(self, name, other=None):
+        """(added, changed, removed) going from the working tree (or snapshot `other`) to snapshot `name`."""
+        wanted = self.load(name)
+        if other is None:
+            current = {rel: file_sha256(path) for rel, path in self.working_files(wanted['roots']).items()}
+        else:
+            current = {rel: entry[0] for rel, entry in self.load(other)['files'].items()}
+        added = sorted(rel for rel in wanted['files'] if rel not in current)
+        changed = sorted(rel for rel, entry in wanted['files'].items() if rel in current and current[rel] != entry[0])
+        removed = [] if wanted['partial'] else sorted(rel for rel in current if rel not in wanted['files'])
+        return added, changed, removed
+
+    def restore(self, name, dry_run=False, link=False):
+        """Make the working tree match snapshot `name`; returns (written, removed) paths.
+
+        A partial snapshot (e.g. one imported from a restore script) only rewrites
+        its own files; a full one also deletes files created since it was taken.
+        """
+        started = time.perf_counter()
+        snapshot = self.load(name)
+        added, changed, removed = self.diff(name)
+        if dry_run:
+            return added + changed, removed
+        for rel in added + changed:
+            sha, mode = snapshot['files'][rel]
+            target = os.path.join(self.base_dir, rel)
+            os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+            tmp = f"{target}.{os.getpid()}.restore"
+            if link:
+                os.link(self.object_path(sha), tmp)
+            else:
+                copy_file(self.object_path(sha), tmp)
+                os.chmod(tmp, mode)
+                os.utime(tmp)  # a fresh mtime so dev servers and stat caches notice the change
+            os.replace(tmp, target)  # never a half-written component in the preview
+        for rel in removed:
+            os.remove(os.path.join(self.base_dir, rel))
+        elapsed = (time.perf_counter() - started) * 1000
+        print(f"⏪ Restored '{name}': {len(added + changed)} written, {len(removed)} removed, "
+              f"{len(snapshot['files']) - len(added + changed)} already matched ({elapsed:.1f} ms)")
+        return added + changed, removed
+
+    def delete(self, name):
+        os.remove(self._snapshot_file(name))
+
+    def gc(self):
+        """Remove objects no snapshot references; returns the number removed."""
+        live = {entry[0] for name in self.names() for entry in self.load(name)['files'].values()}
+        removed = 0
+        for path in walk_files(self.objects_dir):
+            sha = os.path.basename(os.path.dirname(path)) + os.path.basename(path)
+            if sha not in live:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def import_script(self, script, name, note=None, replace=False):
+        """Capture what a legacy restore/fix script writes under the roots as a partial snapshot.
+
+        The script runs in a scratch copy of the roots, so the real tree is untouched.
+        """
+        scratch = tempfile.mkdtemp(prefix='snapshot-import-')
+        try:
+            before = {}
+            for rel, path in self.working_files().items():
+                target = os.path.join(scratch, rel)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copy2(path, target)
+                before[rel] = file_sha256(target)
+            for root in self.roots:
+                os.makedirs(os.path.join(scratch, root), exist_ok=True)
+            result = subprocess.run([sys.executable, os.path.abspath(script)], cwd=scratch,
+                                    capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"{script} failed in the scratch tree:\n{result.stderr}")
+            scratch_store = SnapshotStore(self.store_dir, self.roots, base_dir=scratch)
+            written = {rel: path for rel, path in scratch_store.working_files().items()
+                       if before.get(rel) != file_sha256(path)}
+            if not written:
+                raise ValueError(f"{script} wrote nothing under {', '.join(self.roots)}")
+            return scratch_store.take(name, note or f"Imported from {os.path.basename(script)}", written,
+                                      partial=True, replace=replace)
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Named, deduplicated snapshots of the vendor-risk components.")
+    parser.add_argument('--store', default=STORE_DIR, help="Store directory (default: .snapshots next to this script)")
+    parser.add_argument('--root', action='append', dest='roots',
+                        help=f"Directory to snapshot (repeatable; default: {', '.join(DEFAULT_ROOTS)})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    take = commands.add_parser('take', help="Snapshot the roots")
+    take.add_argument('name')
+    take.add_argument('--note')
+    take.add_argument('--replace', action='store_true', help="Overwrite an existing snapshot of that name")
+    restore = commands.add_parser('restore', help="Restore a snapshot")
+    restore.add_argument('name')
+    restore.add_argument('--dry-run', action='store_true', help="Only list what would change")
+    restore.add_argument('--link', action='store_true', help="Hardlink from the store (read-only previews only)")
+    commands.add_parser('list', help="List snapshots")
+    show = commands.add_parser('show', help="List a snapshot's files")
+    show.add_argument('name')
+    diff = commands.add_parser('diff', help="Compare a snapshot with the working tree or another snapshot")
+    diff.add_argument('name')
+    diff.add_argument('other', nargs='?')
+    delete = commands.add_parser('delete', help="Delete a snapshot (run gc to drop its objects)")
+    delete.add_argument('name')
+    commands.add_parser('gc', help="Remove unreferenced objects")
+    imported = commands.add_parser('import-script', help="Turn a legacy restore script into a snapshot")
+    imported.add_argument('script')
+    imported.add_argument('--name', required=True)
+    imported.add_argument('--note')
+    imported.add_argument('--replace', action='store_true')
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.store, args.roots or DEFAULT_ROOTS)
+    try:
+        if args.command == 'take':
+            store.take(args.name, args.note, replace=args.replace)
+        elif args.command == 'restore':
+            written, removed = store.restore(args.name, dry_run=args.dry_run, link=args.link)
+            if args.dry_run:
+                for rel in written:
+                    print(f"   ✏️  {rel}")
+                for rel in removed:
+                    print(f"   🗑️  {rel}")
+                print(f"{len(written)} to write, {len(removed)} to remove")
+        elif args.command == 'list':
+            for name in store.names():
+                snapshot = store.load(name)
+                kind = 'partial' if snapshot['partial'] else 'full'
+                note = f"  📝 {snapshot['note']}" if snapshot.get('note') else ""
+                print(f"{name:20s} {snapshot['created']}  {len(snapshot['files']):4d} files ({kind}){note}")
+        elif args.command == 'show':
+            for rel, (sha, mode) in sorted(store.load(args.name)['files'].items()):
+                print(f"{sha[:12]}  {mode:o}  {rel}")
+        elif args.command == 'diff':
+            added, changed, removed = store.diff(args.name, args.other)
+            for mark, paths in (('+', added), ('~', changed), ('-', removed)):
+                for rel in paths:
+                    print(f"{mark} {rel}")
+        elif args.command == 'delete':
+            store.delete(args.name)
+            print(f"🗑️  Deleted snapshot '{args.name}'")
+        elif args.command == 'gc':
+            print(f"🧹 Removed {store.gc()} unreferenced object(s)")
+        elif args.command == 'import-script':
+            store.import_script(args.script, args.name, args.note, args.replace)
+    except (KeyError, ValueError, FileExistsError, RuntimeError) as e:
+        print(f"❌ {e.args[0] if e.args else e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
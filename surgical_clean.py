@@ -1,4 +1,6 @@
 import os
+from codemod_io import CodemodTransaction
+from tsx_rewrite import TsxRewrite
 
 file_path = 'app/reports/vendor-risk/artifacts/page.tsx'
 
@@ -6,33 +8,27 @@ if not os.path.exists(file_path):
     print(f"❌ Error: {file_path} not found.")
     exit()
 
-with open(file_path, 'r') as f:
-    lines = f.readlines()
+with open(file_path, 'r', newline='') as f:
+    content = f.read()
 
 print(f"🔍 Scanning {file_path} for Search zombies...")
 
-new_lines = []
-removed_count = 0
-
-for line in lines:
-    # Logic: Remove lines containing the Search icon import, 
-    # search state, or the hardcoded search UI elements.
-    if 'Search' in line or 'searchQuery' in line or 'setSearchQuery' in line or 'matchesSearch' in line:
-        # Special case: Don't remove the entire line if it's the lucide-react import 
-        # but DOES contain other icons you need.
-        if 'lucide-react' in line and ('Activity' in line or 'Clock' in line):
-            cleaned_line = line.replace('Search,', '').replace('Search', '')
-            new_lines.append(cleaned_line)
-            removed_count += 1
-            continue
-        
-        removed_count += 1
-        continue # Skip the line (delete it)
-    
-    new_lines.append(line)
-
-with open(file_path, 'w') as f:
-    f.writelines(new_lines)
-
-print(f"✅ SUCCESS: Removed {removed_count} lines/instances of Search logic.")
+# Logic: Remove the Search icon (JSX and its lucide-react import specifier) and
+# the search state, token by token. Other icons on the same import line and every
+# other byte of the file are left exactly as they were.
+rw = TsxRewrite(content)
+removed_count = (rw.remove_element('Search')
+                 + rw.remove_state('searchQuery')
+                 + rw.remove_import('Search', 'lucide-react'))
+
+# Anything still using the removed bindings (e.g. a `matchesSearch` filter) needs a human.
+for name in ('Search', 'searchQuery', 'setSearchQuery', 'matchesSearch'):
+    lines = rw.references(name)
+    if lines:
+        print(f"⚠️  '{name}' is still referenced on line(s) {', '.join(map(str, lines))} - review by hand")
+
+with CodemodTransaction() as txn:
+    txn.write(file_path, rw.result())
+
+print(f"✅ SUCCESS: Removed {removed_count} instances of Search logic.")
 print("🚀 Next Step: Stop your server and run 'npm run dev'.")
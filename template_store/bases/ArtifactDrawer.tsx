@@ -0,0 +1,156 @@
+'use client';
+import React, { useState, useEffect } from 'react';
+import { X, Shield, Clock, CheckCircle, AlertTriangle, FileText, Mail, StickyNote } from 'lucide-react';
+import { createClient } from '@/lib/supabase/client';
+import { VendorArtifact } from './DocumentList';
+
+interface DrawerProps {
+  isOpen: boolean;
+  onClose: () => void;
+  doc: VendorArtifact | null;
+}
+
+export default function ArtifactDrawer({ isOpen, onClose, doc }: DrawerProps) {
+  const [history, setHistory] = useState<any[]>([]);
+  const [expandedLogId, setExpandedLogId] = useState<string | null>(null);
+  const supabase = createClient();
+
+  useEffect(() => {
+    if (isOpen && doc) {
+      const fetchHistory = async () => {
+        const { data } = await supabase
+          .from('audit_logs')
+          .select('*')
+          .eq('artifact_id', String(doc.id))
+          .order('created_at', { ascending: false });
+        if (data) setHistory(data);
+      };
+      fetchHistory();
+      setExpandedLogId(null);
+    }
+  }, [isOpen, doc]);
+
+  if (!isOpen || !doc) return null;
+
+  const getIcon = (style: string) => {
+    const className = "w-5 h-5";
+    switch (style) {
+      case 'success': return <CheckCircle className={`${className} text-green-400`} />;
+      case 'danger': return <AlertTriangle className={`${className} text-red-400`} />;
+      case 'warning': return <AlertTriangle className={`${className} text-orange-400`} />;
+      case 'email': return <Mail className={`${className} text-blue-400`} />;
+      default: return <Clock className={`${className} text-gray-400`} />;
+    }
+  };
+
+  const toggleLog = (id: string) => {
+    if (expandedLogId === id) setExpandedLogId(null);
+    else setExpandedLogId(id);
+  };
+
+  return (
+    <div className="fixed inset-0 z-50 flex justify-end">
+      {/* Backdrop */}
+      <div onClick={onClose} className="absolute inset-0 bg-black/60 backdrop-blur-[2px]" />
+      
+      {/* Drawer Panel */}
+      <div className="relative w-[450px] h-full bg-[#0d1117] border-l border-[#2d3748] flex flex-col shadow-2xl">
+        
+        {/* Header */}
+        <div className="flex justify-between items-center p-5 bg-[#161b22] border-b border-[#2d3748]">
+          <div>
+            <h2 className="text-lg font-extrabold text-white flex items-center gap-2">
+              <Shield className="w-5 h-5" /> ARTIFACT INTELLIGENCE
+            </h2>
+            <p className="text-xs text-gray-500 mt-1">ID: {doc.id}</p>
+          </div>
+          <button onClick={onClose} className="text-gray-500 hover:text-white transition-colors">
+            <X className="w-6 h-6" />
+          </button>
+        </div>
+
+        {/* Content */}
+        <div className="flex-1 overflow-y-auto p-6">
+          
+          {/* Metadata Section */}
+          <h3 className="text-xs font-extrabold text-gray-600 mb-4">DOCUMENT METADATA</h3>
+          <div className="bg-[#1a202c] rounded-md border border-[#2d3748] p-4 mb-8">
+            <div className="grid grid-cols-[100px_1fr] gap-4 text-sm text-gray-300">
+              <div className="text-gray-500">Vendor</div>
+              <div>{doc.vendorName}</div>
+              
+              <div className="text-gray-500">Filename</div>
+              <div className="break-all">{doc.name}</div>
+              
+              <div className="text-gray-500">Type</div>
+              <div><span className="bg-[#2d3748] px-1.5 py-0.5 rounded text-[11px] font-bold">{doc.type}</span></div>
+              
+              <div className="text-gray-500">Expires</div>
+              <div className="flex items-center gap-1.5">
+                 📅 {doc.expiry ? new Date(doc.expiry).toLocaleDateString() : 'Permanent'}
+              </div>
+            </div>
+          </div>
+
+          {/* Audit Trail Section */}
+          <h3 className="text-xs font-extrabold text-gray-600 mb-4">LIVE AUDIT TRAIL</h3>
+          
+          <div className="relative pl-9 border-l border-[#2d3748] ml-2.5">
+            {history.length === 0 ? (
+                <div className="text-xs text-gray-500 italic">No recorded history.</div>
+            ) : (
+                history.map((log) => {
+                    const isNote = log.description.startsWith('USER_NOTE:');
+                    let cleanDescription = isNote ? log.description.replace('USER_NOTE:', '').trim() : log.description;
+                    const isExpanded = expandedLogId === log.id;
+                    const isLongText = cleanDescription.length > 35;
+                    if (!isExpanded && isLongText) {
+                        cleanDescription = cleanDescription.slice(0, 35) + '...';
+                    }
+
+                    return (
+                      <div key={log.id} className="mb-6 relative group">
+                          <div className={`absolute -left-[45px] top-0 p-1 border rounded-full ${isNote ? 'bg-orange-900/20 border-orange-500/50' : 'bg-[#0d1117] border-[#1a202c]'}`}>
+                              {getIcon(log.icon_style)}
+                          </div>
+                          
+                          <div className="flex justify-between items-center">
+                            <div className="text-sm font-bold text-gray-200">{log.action_type}</div>
+                            {isNote && <StickyNote className="w-3 h-3 text-orange-400" />}
+                          </div>
+                          
+                          <div className="text-[11px] text-gray-500 flex items-center gap-1.5 mt-0.5">
+                              <Clock className="w-3 h-3" /> {new Date(log.created_at).toLocaleString()}
+                          </div>
+                          <div className="text-xs text-blue-400 mt-1 font-semibold">{log.user_name}</div>
+                          
+                          <div 
+                              onClick={() => (isNote || isLongText) && toggleLog(log.id)}
+                              className={`
+                                text-xs mt-1.5 p-2 rounded border transition-all 
+                                ${isNote 
+                                  ? 'bg-orange-500/10 border-orange-500/30 text-orange-200 hover:border-orange-500/60' 
+                                  : 'bg-white/5 border-[#2d3748] text-gray-400'}
+                                ${(isNote || isLongText) ? 'cursor-pointer hover:bg-white/10' : ''}
+                              `}
+                          >
+                              {isNote && <span className="text-orange-400 font-bold mr-1">📝 NOTE:</span>}
+                              <span className="whitespace-pre-wrap">{cleanDescription}</span>
+                          </div>
+                      </div>
+                    );
+                })
+            )}
+          </div>
+        </div>
+
+        {/* Footer */}
+        <div className="p-5 bg-[#161b22] border-t border-[#2d3748]">
+          <a href={doc.url} target="_blank" rel="noopener noreferrer" className="flex items-center justify-center gap-2 bg-green-700 hover:bg-green-600 text-white py-2.5 rounded-md text-sm font-bold transition-colors">
+             <FileText className="w-4 h-4" /> Open Source File
+          </a>
+        </div>
+      </div>
+    </div>
+  );
+}
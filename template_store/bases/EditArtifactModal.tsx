@@ -0,0 +1,136 @@
+'use client';
+import React, { useState, useEffect } from 'react';
+import { createClient } from '@/lib/supabase/client';
+
+interface EditModalProps {
+  isOpen: boolean;
+  onClose: () => void;
+  onSaveComplete: () => void;
+  document: any;
+}
+
+export default function EditArtifactModal({ isOpen, onClose, onSaveComplete, document }: EditModalProps) {
+  const [docType, setDocType] = useState('MSA');
+  const [expiry, setExpiry] = useState('');
+  const [newNote, setNewNote] = useState(''); // New Note State
+  const [isSaving, setIsSaving] = useState(false);
+  
+  const supabase = createClient();
+
+  useEffect(() => {
+    if (document) {
+      setDocType(document.type || 'MSA');
+      setExpiry(document.expiry ? document.expiry.split('T')[0] : '');
+      setNewNote(''); // Reset note on open
+    }
+  }, [document]);
+
+  const handleSave = async () => {
+    setIsSaving(true);
+    
+    // 1. Update the Record (Metadata)
+    const { error } = await supabase
+      .from('vendor_artifacts')
+      .update({ 
+        document_type: docType, 
+        expiry_date: expiry || null,
+        updated_at: new Date().toISOString()
+      })
+      .eq('id', document.id);
+
+    if (error) {
+      alert('Failed to update: ' + error.message);
+    } else {
+      // 2. LOG THE EVENT (Includes Note)
+      // Logic: If note exists, prioritize it in the log description
+      const logDescription = newNote.trim() 
+        ? `USER_NOTE: ${newNote.trim()}` 
+        : `Updated metadata: Type=${docType}, Expiry=${expiry || 'None'}`;
+
+      const iconStyle = newNote.trim() ? 'warning' : 'success';
+
+      await supabase.rpc('log_audit_event', {
+        p_artifact_id: String(document.id),
+        p_user_name: 'Dereck (Admin)', 
+        p_action_type: 'METADATA_UPDATE',
+        p_description: logDescription,
+        p_icon_style: iconStyle
+      });
+
+      onSaveComplete();
+      onClose();
+    }
+    setIsSaving(false);
+  };
+
+  if (!isOpen || !document) return null;
+
+  return (
+    <div className="fixed inset-0 z-[1000] flex items-center justify-center bg-black/70 backdrop-blur-sm">
+      <div className="bg-[#0d1117] w-[450px] p-6 rounded-lg border border-[#2d3748] shadow-2xl">
+        
+        <h2 className="text-white text-base font-bold border-b border-[#2d3748] pb-3 mb-5">
+          📝 Edit Metadata & Audit Notes
+        </h2>
+        
+        <div className="mb-4 text-xs text-gray-500">
+          Editing: <strong className="text-white">{document.name}</strong>
+        </div>
+
+        <div className="grid grid-cols-2 gap-4 mb-4">
+            <div>
+                <label className="block text-[11px] font-bold text-gray-400 mb-1.5">DOCUMENT TYPE</label>
+                <select 
+                  value={docType} 
+                  onChange={(e) => setDocType(e.target.value)} 
+                  className="w-full bg-[#1a202c] border border-[#2d3748] text-white p-2 rounded text-xs focus:outline-none focus:border-blue-500"
+                >
+                  <option value="MSA">MSA</option>
+                  <option value="AUDIT">AUDIT</option>
+                  <option value="INSURANCE">INSURANCE</option>
+                  <option value="CERT">CERT</option>
+                  <option value="OTHER">OTHER</option>
+                </select>
+            </div>
+            <div>
+                <label className="block text-[11px] font-bold text-gray-400 mb-1.5">EXPIRATION DATE</label>
+                <input 
+                  type="date" 
+                  value={expiry} 
+                  onChange={(e) => setExpiry(e.target.value)} 
+                  className="w-full bg-[#1a202c] border border-[#2d3748] text-white p-2 rounded text-xs focus:outline-none focus:border-blue-500"
+                />
+            </div>
+        </div>
+
+        {/* Audit Note Field */}
+        <label className="block text-[11px] font-bold text-orange-400 mb-1.5">ADD AUDIT NOTE (OPTIONAL)</label>
+        <textarea 
+            value={newNote}
+            onChange={(e) => setNewNote(e.target.value)}
+            placeholder="Enter reason for change, exception details, or compliance notes..."
+            className="w-full bg-[#1a202c] border border-[#2d3748] text-white p-2.5 rounded text-xs mb-6 h-24 resize-none focus:outline-none focus:border-orange-500 placeholder-gray-600"
+        />
+
+        <div className="flex justify-end gap-2.5">
+          <button 
+            onClick={onClose} 
+            className="px-4 py-2 bg-transparent border border-gray-600 text-gray-300 rounded text-xs hover:bg-gray-800 transition-colors"
+          >
+            Cancel
+          </button>
+          <button 
+            onClick={handleSave} 
+            disabled={isSaving}
+            className={`px-5 py-2 rounded text-xs font-bold text-white transition-colors ${
+              isSaving ? 'bg-orange-600 cursor-not-allowed' : 'bg-orange-500 hover:bg-orange-600'
+            }`}
+          >
+            {isSaving ? 'Saving...' : 'Save Changes'}
+          </button>
+        </div>
+
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,44 @@
+'use client';
+import React, { useState } from 'react';
+import { X, Upload, Loader2 } from 'lucide-react';
+import { createClient } from '@/lib/supabase/client';
+
+export default function UploadArtifactModal({ isOpen, onClose, onUploadComplete }: any) {
+  const [loading, setLoading] = useState(false);
+  const supabase = createClient();
+
+  if (!isOpen) return null;
+
+  const handleUpload = async (e: any) => {
+    e.preventDefault();
+    setLoading(true);
+    // Logic for Supabase Storage Upload would go here
+    setTimeout(() => {
+      setLoading(false);
+      onClose();
+      if(onUploadComplete) onUploadComplete();
+    }, 1500);
+  };
+
+  return (
+    <div className="fixed inset-0 z-[100] flex items-center justify-center p-4">
+      <div className="absolute inset-0 bg-black/80 backdrop-blur-sm" onClick={onClose} />
+      <div className="relative w-full max-w-lg bg-[#0d1117] border border-[#30363d] rounded-xl shadow-2xl overflow-hidden">
+        <div className="p-4 border-b border-[#30363d] flex justify-between items-center bg-[#161b22]">
+          <h2 className="text-xs font-extrabold text-white tracking-tighter">UPLOAD COMPLIANCE ARTIFACT</h2>
+          <button onClick={onClose} className="text-gray-500 hover:text-white"><X className="w-4 h-4" /></button>
+        </div>
+        <form onSubmit={handleUpload} className="p-6 space-y-4">
+          <div className="border-2 border-dashed border-[#30363d] rounded-lg p-8 text-center hover:border-blue-500/50 transition-colors">
+            <Upload className="w-8 h-8 text-gray-600 mx-auto mb-2" />
+            <p className="text-xs text-gray-400">Drag and drop artifact or click to browse</p>
+            <input type="file" className="hidden" />
+          </div>
+          <button type="submit" disabled={loading} className="w-full py-2 bg-blue-600 hover:bg-blue-500 text-white rounded font-bold text-xs flex items-center justify-center gap-2">
+            {loading ? <Loader2 className="w-3 h-3 animate-spin" /> : 'Process Artifact'}
+          </button>
+        </form>
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,292 @@
+'use client';
+import React, { useEffect, useState } from 'react';
+import Link from 'next/link';
+import Header from '@/app/components/structure/Header';
+import DocumentList from '@/app/components/vendor-risk/DocumentList';
+import UploadArtifactModal from '@/app/components/vendor-risk/UploadArtifactModal';
+import EditArtifactModal from '@/app/components/vendor-risk/EditArtifactModal';
+import SystemActivityModal from '@/app/components/vendor-risk/SystemActivityModal'; 
+import { createClient } from '@/lib/supabase/client';
+import { Activity } from 'lucide-react'; 
+
+export default function ArtifactLibraryPage() {
+  const [documents, setDocuments] = useState<any[]>([]);
+  const [isLoading, setIsLoading] = useState(true);
+  const [isUploadOpen, setIsUploadOpen] = useState(false); 
+  const [isEditOpen, setIsEditOpen] = useState(false);
+  const [isActivityOpen, setIsActivityOpen] = useState(false); 
+  const [selectedDoc, setSelectedDoc] = useState<any>(null);
+
+  // --- FILTER STATE ---
+  // Note: Search Query removed per request
+  const [typeFilter, setTypeFilter] = useState('ALL');
+  const [riskFilter, setRiskFilter] = useState('ALL');
+  const [statusFilter, setStatusFilter] = useState('ALL');
+  const [dateRange, setDateRange] = useState('ALL');
+  const [timelineView, setTimelineView] = useState('HISTORY'); 
+   
+  const supabase = createClient();
+
+  const fetchDocs = async () => {
+    setIsLoading(true);
+    const { data } = await supabase
+        .from('vendor_artifacts')
+        .select(`
+            id, name, document_type, expiry_date, file_url, created_at, updated_at, vendor_id,
+            vendor_risk_inventory ( vendor_name, criticality )
+        `);
+
+    if (data) {
+        const formattedDocs = data.map((item: any) => ({
+            id: String(item.id),
+            vendor_id: String(item.vendor_id),
+            name: item.name,
+            vendorName: item.vendor_risk_inventory?.vendor_name || 'Unknown Vendor',
+            type: item.document_type,
+            expiry: item.expiry_date,
+            created_at: item.created_at || new Date().toISOString(),
+            updated_at: item.updated_at || item.created_at || new Date().toISOString(), 
+            url: item.file_url,
+            criticality: item.vendor_risk_inventory?.criticality || 'LOW' 
+        }));
+        setDocuments(formattedDocs);
+    }
+    setIsLoading(false);
+  };
+
+  useEffect(() => { fetchDocs(); }, []);
+
+  // --- HANDLERS ---
+  const handleViewChange = (mode: string) => {
+      setTimelineView(mode);
+      if (mode === 'CREATED') setDateRange('TODAY'); 
+      else if (mode === 'UPDATED') setDateRange('30D');    
+      else setDateRange('ALL');    
+  };
+
+  const handleResetAll = () => {
+      setRiskFilter('ALL'); setDateRange('ALL'); setStatusFilter('ALL');
+      setTypeFilter('ALL'); setTimelineView('HISTORY'); 
+  };
+
+  const handleDelete = async (id: string) => {
+      const docToDelete = documents.find(d => d.id === id);
+      setDocuments(prev => prev.filter(d => d.id !== id));
+
+      if (docToDelete) {
+          console.log(`🗑 Logging deletion for: ${docToDelete.name}`);
+          await supabase.rpc('log_audit_event', {
+            p_artifact_id: String(id),
+            p_user_name: 'Dereck (Admin)', 
+            p_action_type: 'ARTIFACT_DESTRUCTION',
+            p_description: `Permanently deleted artifact: ${docToDelete.name}`,
+            p_icon_style: 'danger'
+          });
+      }
+      await supabase.from('vendor_artifacts').delete().eq('id', id);
+  };
+
+  const handleEdit = (doc: any) => { setSelectedDoc(doc); setIsEditOpen(true); };
+
+  // --- LOGIC: KPI & STATUS ---
+  const getDocStatus = (doc: any) => {
+    if (!doc.expiry) {
+        if (doc.type === 'MSA') return 'PERMANENT'; 
+        return 'INCOMPLETE'; 
+    }
+    const today = new Date();
+    const expiry = new Date(doc.expiry);
+    const diffTime = expiry.getTime() - today.getTime();
+    const diffDays = Math.ceil(diffTime / (1000 * 60 * 60 * 24));
+    
+    if (diffDays < 0) return 'EXPIRED';
+    if (diffDays < 90) return 'EXPIRING';
+    return 'VALID';
+  };
+
+  const kpiTotal = documents.length;
+  const kpiInflow = documents.filter(d => {
+      const diffTime = new Date().getTime() - new Date(d.created_at).getTime();
+      return (diffTime / (1000 * 3600)) <= 24;
+  }).length;
+  const kpiExpiring = documents.filter(d => getDocStatus(d) === 'EXPIRING').length;
+  const kpiExpired = documents.filter(d => {
+      const s = getDocStatus(d);
+      return s === 'EXPIRED' || s === 'INCOMPLETE';
+  }).length;
+
+  const handleExportCSV = () => {
+    const headers = ["Document Name", "Vendor", "Type", "Criticality", "Uploaded", "Last Updated", "Expiry", "Status", "URL"];
+    const rows = processedDocuments.map(doc => [
+        doc.name, doc.vendorName, doc.type, doc.criticality || 'N/A',
+        new Date(doc.created_at).toLocaleDateString(), new Date(doc.updated_at).toLocaleDateString(),
+        doc.expiry || 'Permanent', getDocStatus(doc), doc.url
+    ]);
+    const csvContent = [headers.join(","), ...rows.map(r => r.join(","))].join("\n");
+    const blob = new Blob([csvContent], { type: 'text/csv;charset=utf-8;' });
+    const url = URL.createObjectURL(blob);
+    const link = document.createElement("a");
+    link.href = url; link.download = `GRC_Artifacts_${new Date().toISOString().split('T')[0]}.csv`;
+    document.body.appendChild(link); link.click(); document.body.removeChild(link);
+  };
+
+  // --- FILTERING ---
+  const processedDocuments = documents.filter(doc => {
+        // Search Logic Removed
+        const matchesType = typeFilter === 'ALL' || doc.type === typeFilter;
+        const matchesRisk = riskFilter === 'ALL' || doc.criticality === riskFilter;
+        
+        let matchesStatus = true;
+        if (statusFilter !== 'ALL') {
+            const status = getDocStatus(doc);
+            if (statusFilter === 'VALID') matchesStatus = (status === 'VALID' || status === 'PERMANENT');
+            else matchesStatus = status === statusFilter;
+        }
+
+        let matchesDate = true;
+        if (dateRange !== 'ALL') {
+            const targetDate = timelineView === 'UPDATED' ? doc.updated_at : doc.created_at;
+            if (targetDate) {
+                const daysDiff = (new Date().getTime() - new Date(targetDate).getTime()) / (1000 * 60 * 60 * 24);
+                switch (dateRange) {
+                    case 'TODAY': matchesDate = daysDiff <= 1.5; break; 
+                    case '7D': matchesDate = daysDiff <= 7; break;
+                    case '30D': matchesDate = daysDiff <= 30; break;
+                    case '90D': matchesDate = daysDiff <= 90; break;
+                    case '1Y': matchesDate = daysDiff <= 365; break;
+                    default: matchesDate = true;
+                }
+            }
+        }
+        return matchesType && matchesRisk && matchesStatus && matchesDate;
+    }).sort((a, b) => {
+        const dateA = timelineView === 'UPDATED' ? new Date(a.updated_at).getTime() : new Date(a.created_at).getTime();
+        const dateB = timelineView === 'UPDATED' ? new Date(b.updated_at).getTime() : new Date(b.created_at).getTime();
+        return dateB - dateA;
+    });
+
+  // --- UI HELPERS ---
+  const inputStyle = { background: '#0d1117', border: '1px solid #2d3139', color: 'white', padding: '8px 12px', borderRadius: '4px', fontSize: '12px' };
+  
+  const FilterChip = ({ label, value, color, activeColor, isReset = false }: any) => {
+      const isActive = isReset ? (riskFilter === 'ALL' && dateRange === 'ALL' && statusFilter === 'ALL') : riskFilter === value;
+      return (
+          <button onClick={() => isReset ? handleResetAll() : setRiskFilter(value)}
+            style={{
+                background: isActive ? activeColor : 'rgba(255,255,255,0.05)',
+                border: `1px solid ${isActive ? activeColor : '#2d3139'}`, color: isActive ? 'white' : color,
+                padding: '6px 16px', borderRadius: '20px', fontSize: '10px', fontWeight: 800, cursor: 'pointer',
+                opacity: (riskFilter === 'ALL' || isActive) ? 1 : 0.5
+            }}>{label}</button>
+      );
+  };
+
+  const KPICard = ({ title, value, color, subtext }: any) => (
+      <div style={{ background: '#1a1d23', borderRadius: '8px', border: '1px solid #2d3139', padding: '15px 20px', flex: 1, display: 'flex', flexDirection: 'column', gap: '5px' }}>
+          <span style={{ fontSize: '10px', color: '#a0aec0', fontWeight: 700 }}>{title}</span>
+          <div style={{ fontSize: '24px', fontWeight: 900, color: color }}>{value}</div>
+          <span style={{ fontSize: '10px', color: '#718096' }}>{subtext}</span>
+      </div>
+  );
+
+  return (
+    <div style={{ height: '100vh', display: 'flex', flexDirection: 'column', background: '#0d1117', color: 'white', fontFamily: 'Inter, sans-serif', overflow: 'hidden' }}>
+      <div className="no-print" style={{ flexShrink: 0 }}>
+        <Header />
+        <div style={{ height: '50px', background: '#2b6cb0', display: 'flex', alignItems: 'center', padding: '0 20px', justifyContent: 'space-between', borderBottom: '1px solid #63b3ed' }}>
+          <div style={{ display: 'flex', gap: '15px', alignItems: 'center' }}>
+            <div style={{ fontSize: '12px', fontWeight: 800, color: '#ebf8ff' }}>📂 EVIDENCE & ARTIFACT LIBRARY</div>
+          </div>
+          <div style={{ display: 'flex', gap: '10px' }}>
+             <button onClick={() => setIsActivityOpen(true)} style={{ background: 'rgba(0,0,0,0.2)', border: '1px solid #ebf8ff', color: '#ebf8ff', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 800, cursor: 'pointer', display: 'flex', alignItems: 'center', gap: '6px' }}>
+                <Activity className="w-3 h-3" /> ACTIVITY LOG
+             </button>
+             <button onClick={() => setIsUploadOpen(true)} style={{ background: '#ebf8ff', border: '1px solid white', color: '#2b6cb0', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 900, cursor: 'pointer', display: 'flex', alignItems: 'center', gap: '5px' }}><span>📤</span> UPLOAD NEW</button>
+             <button onClick={() => window.print()} style={{ background: 'rgba(0,0,0,0.2)', border: '1px solid #cbd5e0', color: '#cbd5e0', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 800, cursor: 'pointer' }}>🖨 PRINT</button>
+             <button onClick={handleExportCSV} style={{ background: 'rgba(0,0,0,0.2)', border: '1px solid #ebf8ff', color: '#ebf8ff', padding: '6px 12px', borderRadius: '4px', fontSize: '10px', fontWeight: 800, cursor: 'pointer' }}>⬇ EXPORT CSV</button>
+             <Link href="/reports/vendor-risk" style={{ color: '#ebf8ff', textDecoration: 'none', fontSize: '10px', fontWeight: 800, background: 'rgba(0,0,0,0.3)', padding: '6px 12px', borderRadius: '4px' }}>◀ REGISTRY</Link>
+          </div>
+        </div>
+      </div>
+
+      <div style={{ flex: 1, display: 'flex', flexDirection: 'column', padding: '20px 40px 0 40px', overflow: 'hidden', maxWidth: '1400px', width: '100%', margin: '0 auto' }}>
+        <div style={{ flexShrink: 0 }}>
+            <div style={{ display: 'flex', gap: '20px', marginBottom: '20px' }}>
+                <KPICard title="TOTAL ARTIFACTS" value={kpiTotal} color="white" subtext="Evidence On File" />
+                <KPICard title="INFLOW (24H)" value={kpiInflow} color="#68d391" subtext="Uploaded Today" />
+                <KPICard title="EXPIRING SOON" value={kpiExpiring} color="#f6ad55" subtext="Next 90 Days" />
+                <KPICard title="EXPIRED / INVALID" value={kpiExpired} color="#fc8181" subtext="Expired or Missing Info" />
+            </div>
+
+            <div style={{ marginBottom: '15px', display: 'flex', alignItems: 'center' }}>
+                <div style={{ display: 'flex', alignItems: 'center', gap: '15px' }}>
+                    <span style={{ fontSize: '11px', color: '#718096', fontWeight: 700 }}>FILTER BY RISK:</span>
+                    <div style={{ display: 'flex', gap: '10px' }}>
+                        <FilterChip label="VIEW ALL" value="ALL" color="#cbd5e0" activeColor="#3182ce" isReset={true} />
+                        <FilterChip label="HIGH CRITICALITY" value="HIGH" color="#fc8181" activeColor="#e53e3e" />
+                        <FilterChip label="MED CRITICALITY" value="MED" color="#f6ad55" activeColor="#dd6b20" />
+                        <FilterChip label="LOW CRITICALITY" value="LOW" color="#68d391" activeColor="#38a169" />
+                    </div>
+                </div>
+                <div style={{ width: '1px', height: '20px', background: '#2d3139', margin: '0 25px' }}></div>
+                <div style={{ display: 'flex', alignItems: 'center', gap: '10px' }}>
+                    <span style={{ fontSize: '11px', color: '#718096', fontWeight: 700 }}>VIEW MODE:</span>
+                    <select value={timelineView} onChange={(e) => handleViewChange(e.target.value)} style={{ ...inputStyle, cursor: 'pointer', minWidth: '180px', background: '#1a1d23', fontWeight: 700, borderColor: '#3182ce', color: '#90cdf4' }}>
+                        <option value="HISTORY">📂 Full Library (All Time)</option>
+                        <option value="CREATED">📥 Just Arrived (Today)</option>
+                        <option value="UPDATED">📝 Recently Updated (30 Days)</option>
+                    </select>
+                </div>
+            </div>
+        </div>
+
+        <div style={{ flex: 1, display: 'flex', flexDirection: 'column', background: '#1a1d23', borderRadius: '8px 8px 0 0', border: '1px solid #2d3139', borderBottom: 'none', overflow: 'hidden' }}>
+            <div style={{ flexShrink: 0, borderBottom: '1px solid #2d3139', background: '#1a1d23', zIndex: 10 }}>
+                <div style={{ padding: '20px 30px 15px 30px', display: 'flex', alignItems: 'center', gap: '25px' }}>
+                    <div style={{ display: 'flex', alignItems: 'center', gap: '10px' }}>
+                        <h3 style={{ fontSize: '12px', color: '#718096', margin: 0, fontWeight: 900 }}>GLOBAL DOCUMENT INDEX</h3>
+                        <span style={{ fontSize: '11px', background: '#2d3748', padding: '2px 8px', borderRadius: '10px', color: '#cbd5e0' }}>{processedDocuments.length} Items</span>
+                    </div>
+
+                    <div style={{ width: '1px', height: '20px', background: '#2d3139' }}></div>
+
+                    <div style={{ display: 'flex', gap: '10px', alignItems: 'center' }}>
+                        <select value={dateRange} onChange={(e) => setDateRange(e.target.value)} style={{ ...inputStyle, cursor: 'pointer', minWidth: '180px', borderColor: dateRange !== 'ALL' ? '#3182ce' : '#2d3139' }}>
+                            <option value="ALL">📅 Any Time</option>
+                            <option value="TODAY">Last 24 Hours</option>
+                            <option value="7D">Last 7 Days</option>
+                            <option value="30D">Last 30 Days</option>
+                            <option value="90D">Last 90 Days</option>
+                            <option value="1Y">Last 1 Year</option>
+                        </select>
+                        <select value={statusFilter} onChange={(e) => setStatusFilter(e.target.value)} style={{ ...inputStyle, cursor: 'pointer', minWidth: '150px', borderColor: statusFilter !== 'ALL' ? '#e53e3e' : '#2d3139' }}>
+                            <option value="ALL">All Statuses</option>
+                            <option value="VALID">✅ Valid Only</option>
+                            <option value="EXPIRING">⚠️ Expiring Soon</option>
+                            <option value="EXPIRED">❌ Expired</option>
+                            <option value="INCOMPLETE">⚠️ Missing Dates</option>
+                        </select>
+                         
+                         {/* SEARCH BAR DELETED FROM HERE */}
+                    </div>
+                </div>
+
+                {/* HEADER ROW REMOVED FROM HERE - IT IS NOW INSIDE DocumentList */}
+            </div>
+
+            <div style={{ flex: 1, overflowY: 'auto', padding: '0 30px 30px 30px' }}>
+                {isLoading ? (
+                    <div style={{ padding: '40px', textAlign: 'center', color: '#adbac7' }}>Loading Library...</div>
+                ) : (
+                    <DocumentList documents={processedDocuments} onDelete={handleDelete} onEdit={handleEdit} sortConfig={{ key: '', direction: '' }} />
+                )}
+            </div>
+        </div>
+      </div>
+      
+      <UploadArtifactModal isOpen={isUploadOpen} onClose={() => setIsUploadOpen(false)} onUploadComplete={fetchDocs} />
+      <EditArtifactModal isOpen={isEditOpen} onClose={() => setIsEditOpen(false)} onSaveComplete={fetchDocs} document={selectedDoc} />
+      <SystemActivityModal isOpen={isActivityOpen} onClose={() => setIsActivityOpen(false)} />
+    </div>
+  );
+}
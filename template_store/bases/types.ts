@@ -0,0 +1,12 @@
+export interface VendorArtifact {
+  id: string;
+  name: string;
+  vendorName: string;
+  type: string;
+  criticality: 'HIGH' | 'MED' | 'LOW';
+  url: string;
+  expiry: string | null;
+  created_at: string;
+  updated_at: string;
+  status?: string; 
+}
@@ -0,0 +1,252 @@
+import json
+import os
+import posixpath
+
+from hunter_index import INDEX_DIR, root_key
+from tsx_tokens import LineIndex, is_jsx_path, tokenize
+
+# Symbol index for code_hunter.py --symbol.
+# For every .ts/.tsx file it records, from the token stream:
+#   imports: [module, imported, local, line]   imported is 'default', '*' or None (side-effect import)
+#   exports: [exported, local, module, line]   module is set for re-exports; exported '*' for `export *`
+#   jsx:     [element_name, line]
+# Entries are cached in .code_hunter/symbols-<root>.json keyed by (mtime_ns, size)
+# and only changed files are re-tokenized.
+
+SYMBOL_EXTENSIONS = ('.ts', '.tsx')
+SCHEMA_VERSION = 1
+_DECLARATIONS = {'function', 'class', 'const', 'let', 'var', 'interface', 'type', 'enum', 'namespace', 'abstract',
+                 'async', 'declare'}
+
+
+def _significant(text, tokens):
+    return [(tok.kind, text[tok.start:tok.end], tok.start) for tok in tokens if tok.kind not in ('ws', 'comment')]
+
+
+def _unquote(literal):
+    return literal[1:-1] if len(literal) >= 2 and literal[0] == literal[-1] else literal.strip('\'"')
+
+
+def _specifiers(sig, i):
+    """Parse `{ a, b as c, type d }` starting at sig[i] == '{'; returns ([(name, alias)], next_i)."""
+    specs = []
+    i += 1
+    while i < len(sig) and sig[i][1] != '}':
+        if sig[i][1] == ',':
+            i += 1
+            continue
+        names = []
+        while i < len(sig) and sig[i][1] not in (',', '}'):
+            if sig[i][0] in ('ident', 'string'):
+                names.append(_unquote(sig[i][1]) if sig[i][0] == 'string' else sig[i][1])
+            i += 1
+        if names and names[0] == 'type' and len(names) > 1:
+            names = names[1:]
+        if not names:
+            continue
+        if len(names) >= 3 and names[-2] == 'as':
+            specs.append((names[0], names[-1]))
+        else:
+            specs.append((names[0], names[0]))
+    return specs, i + 1
+
+
+def extract_symbols(text, jsx=True):
+    tokens = tokenize(text, jsx)
+    sig = _significant(text, tokens)
+    lines = LineIndex(text)
+    imports, exports, elements = [], [], []
+
+    for i, (kind, value, start) in enumerate(sig):
+        if kind == 'jsx_name':
+            # Opening and self-closing tags only; `</Name>` follows a '</' token.
+            if i and sig[i - 1][1] == '<':
+                elements.append([value, lines.line_of(start)])
+            continue
+        if kind != 'ident' or value not in ('import', 'export'):
+            continue
+        if i and sig[i - 1][1] in ('.', '?.'):
+            continue  # member access such as `module.export`
+        line = lines.line_of(start)
+        nxt = sig[i + 1][1] if i + 1 < len(sig) else ''
+
+        if value == 'import':
+            if nxt in ('(', '.'):
+                continue  # dynamic import() / import.meta
+            j = i + 1
+            if sig[j:j + 1] and sig[j][1] == 'type' and sig[j + 1][1] not in ('from', ','):
+                j += 1
+            if sig[j:j + 1] and sig[j][0] == 'string':
+                imports.append([_unquote(sig[j][1]), None, None, line])
+                continue
+            bindings = []
+            while j < len(sig) and sig[j][1] != 'from' and sig[j][1] != ';':
+                kind_j, value_j, _ = sig[j]
+                if value_j == '{':
+                    specs, j = _specifiers(sig, j)
+                    bindings.extend(specs)
+                    continue
+                if value_j == '*' and j + 2 < len(sig) and sig[j + 1][1] == 'as':
+                    bindings.append(('*', sig[j + 2][1]))
+                    j += 3
+                    continue
+                if kind_j == 'ident':
+                    bindings.append(('default', value_j))
+                j += 1
+            if j + 1 < len(sig) and sig[j][1] == 'from' and sig[j + 1][0] == 'string':
+                module = _unquote(sig[j + 1][1])
+                for imported, local in bindings:
+                    imports.append([module, imported, local, line])
+            continue
+
+        # export ...
+        j = i + 1
+        if nxt == 'default':
+            name = None
+            k = j + 1
+            while k < len(sig) and sig[k][1] in ('async', 'function', 'class', 'abstract', '*'):
+                k += 1
+            if k > j + 1 and k < len(sig) and sig[k][0] == 'ident':
+                name = sig[k][1]
+            elif k == j + 1 and k < len(sig) and sig[k][0] == 'ident' and k + 1 < len(sig) and sig[k + 1][1] == ';':
+                name = sig[k][1]
+            exports.append(['default', name, None, line])
+            continue
+        if nxt == 'type' and j + 1 < len(sig) and sig[j + 1][1] in ('{', '*'):
+            j += 1
+        if j < len(sig) and sig[j][1] == '{':
+            specs, k = _specifiers(sig, j)
+            module = None
+            if k + 1 < len(sig) and sig[k][1] == 'from' and sig[k + 1][0] == 'string':
+                module = _unquote(sig[k + 1][1])
+            for local, exported in specs:
+                exports.append([exported, local, module, line])
+            continue
+        if j < len(sig) and sig[j][1] == '*':
+            k = j + 1
+            exported = '*'
+            if k + 1 < len(sig) and sig[k][1] == 'as':
+                exported = sig[k + 1][1]
+                k += 2
+            if k + 1 < len(sig) and sig[k][1] == 'from' and sig[k + 1][0] == 'string':
+                exports.append([exported, '*', _unquote(sig[k + 1][1]), line])
+            continue
+        k = j
+        while k < len(sig) and sig[k][1] in _DECLARATIONS:
+            k += 1
+        if k < len(sig) and sig[k][1] == '{' and sig[k - 1][1] in ('const', 'let', 'var'):
+            # export const { a, b } = ...
+            specs, _ = _specifiers(sig, k)
+            exports.extend([alias, alias, None, line] for _, alias in specs)
+        elif k > j and k < len(sig) and sig[k][0] == 'ident':
+            exports.append([sig[k][1], sig[k][1], None, line])
+
+    return {'imports': imports, 'exports': exports, 'jsx': elements}
+
+
+def find_alias_root(start):
+    """Directory holding the nearest tsconfig.json (what `@/` resolves against)."""
+    path = os.path.abspath(start)
+    while True:
+        if os.path.isfile(os.path.join(path, 'tsconfig.json')):
+            return path
+        parent = os.path.dirname(path)
+        if parent == path:
+            return os.path.abspath('.')
+        path = parent
+
+
+def canonical_module(specifier, importer=None, alias_root=None):
+    """Normalise a specifier so '@/lib/x', '../../lib/x' and '@/lib/x/index' compare equal."""
+    alias_root = alias_root or find_alias_root('.')
+    spec = specifier
+    if spec.startswith('.') and importer is not None:
+        target = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(importer)), spec))
+        spec = '@/' + os.path.relpath(target, alias_root).replace(os.sep, '/')
+    elif spec.startswith('.'):
+        spec = '@/' + os.path.relpath(os.path.abspath(spec), alias_root).replace(os.sep, '/')
+    if spec.startswith('@/'):
+        spec = '@/' + posixpath.normpath(spec[2:])
+        for suffix in ('.tsx', '.ts', '.jsx', '.js'):
+            if spec.endswith(suffix):
+                spec = spec[:-len(suffix)]
+                break
+        if spec.endswith('/index'):
+            spec = spec[:-len('/index')]
+    return spec
+
+
+class SymbolIndex:
+    def __init__(self, root_dir, index_dir=INDEX_DIR):
+        self.root_dir = root_dir
+        self.path = os.path.join(index_dir, f"symbols-{root_key(root_dir)}.json")
+        self.alias_root = find_alias_root(root_dir)
+        self.files = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == SCHEMA_VERSION:
+                self.files = data['files']
+        except (OSError, ValueError):
+            pass
+
+    def refresh(self, file_paths):
+        """Re-tokenize new or changed files and drop vanished ones; returns files parsed."""
+        fresh = {}
+        parsed = 0
+        for path in file_paths:
+            if not path.endswith(SYMBOL_EXTENSIONS):
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = self.files.get(path)
+            if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+                fresh[path] = entry
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    symbols = extract_symbols(f.read(), is_jsx_path(path))
+            except (OSError, UnicodeDecodeError):
+                symbols = {'imports': [], 'exports': [], 'jsx': []}
+            fresh[path] = [st.st_mtime_ns, st.st_size, symbols]
+            parsed += 1
+        dropped = len(set(self.files) - set(fresh))
+        self.files = fresh
+        if parsed or dropped:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + '.tmp'
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump({'version': SCHEMA_VERSION, 'files': fresh}, f, separators=(',', ':'))
+            os.replace(tmp, self.path)
+        return parsed
+
+    def find(self, symbol, module=None):
+        """[(path, import_lines, jsx_lines)] for files importing `symbol` (optionally from `module`), in walk order.
+
+        `symbol` matches either the imported or the local binding name. JSX lines
+        are the places the local binding is rendered as an element.
+        """
+        wanted = canonical_module(module, alias_root=self.alias_root) if module else None
+        results = []
+        for path, (_, _, symbols) in self.files.items():
+            locals_, import_lines = set(), []
+            for spec, imported, local, line in symbols['imports']:
+                if symbol not in (imported, local):
+                    continue
+                if wanted is not None and canonical_module(spec, path, self.alias_root) != wanted:
+                    continue
+                locals_.add(local)
+                import_lines.append(line)
+            if not import_lines:
+                continue
+            jsx_lines = [line for name, line in symbols['jsx'] if name in locals_]
+            results.append((path, import_lines, jsx_lines))
+        return results
+
+    def find_exports(self, symbol):
+        """[(path, line, module)] for files exporting `symbol` (module is set for re-exports)."""
+        return [(path, line, module)
+                for path, (_, _, symbols) in self.files.items()
+                for exported, _local, module, line in symbols['exports'] if exported == symbol]
@@ -0,0 +1,509 @@
+import argparse
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+
+from tsx_tokens import LineIndex, is_jsx_path, tokenize
+
+# Token-level TSX rewriter for the codemod scripts.
+#
+# Instead of deleting every line that mentions "Search" (surgical_clean.py) or
+# overwriting a whole file because 'Search' appears in it (destroy_spyglass.py),
+# a TsxRewrite removes exactly one construct and leaves every other byte alone:
+#
+#   rw = TsxRewrite(text)
+#   rw.remove_import('Search', 'lucide-react')   # one specifier; the statement goes if it was the last
+#   rw.remove_state('searchQuery')               # const [searchQuery, setSearchQuery] = useState(...);
+#   rw.remove_element('Search')                  # <Search .../> or <Search>...</Search>, incl. `{cond && ...}`
+#   new_text = rw.result()
+#
+# All edits of one TsxRewrite are computed against a single token stream and
+# spliced in one pass, so a batch of rules costs one tokenize per file. Token
+# streams are also cached per content hash (see tokens_for), so several
+# rewrites of the same text - or a rule engine revisiting it - reuse them.
+#
+# Usage: python3 tsx_rewrite.py FILE... [--import NAME[@MODULE]] [--state NAME] [--element NAME] [--dry-run]
+#        python3 tsx_rewrite.py --self-test
+
+_CACHE_SIZE = 256
+_token_cache = OrderedDict()  # (sha256, jsx) -> significant tokens
+cache_stats = {'hits': 0, 'misses': 0}
+
+
+class Sig:
+    """A significant (non-whitespace, non-comment) token with its text."""
+    __slots__ = ('kind', 'value', 'start', 'end')
+
+    def __init__(self, kind, value, start, end):
+        self.kind, self.value, self.start, self.end = kind, value, start, end
+
+    def __repr__(self):
+        return f"Sig({self.kind}, {self.value!r}, {self.start})"
+
+
+def tokens_for(text, jsx=True):
+    """Significant tokens of `text`, tokenized once per distinct content (LRU of the last 256 texts)."""
+    key = (hashlib.sha256(text.encode('utf-8')).hexdigest(), jsx)
+    cached = _token_cache.get(key)
+    if cached is not None:
+        _token_cache.move_to_end(key)
+        cache_stats['hits'] += 1
+        return cached
+    cache_stats['misses'] += 1
+    sig = [Sig(tok.kind, text[tok.start:tok.end], tok.start, tok.end)
+           for tok in tokenize(text, jsx) if tok.kind not in ('ws', 'comment')]
+    _token_cache[key] = sig
+    if len(_token_cache) > _CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return sig
+
+
+def _unquote(literal):
+    return literal[1:-1] if len(literal) >= 2 and literal[0] == literal[-1] else literal.strip('\'"')
+
+
+class ImportDecl:
+    """One `import ... from '...'` statement, located in the token stream."""
+
+    def __init__(self, start, end, module, default, namespace, named, brace_open, brace_close):
+        self.start, self.end = start, end          # character span, including a trailing ';'
+        self.module = module
+        self.default = default                     # Sig of the default binding, or None
+        self.namespace = namespace                 # (first Sig, local Sig) of `* as X`, or None
+        self.named = named                         # [(first Sig, last Sig, imported, local)]
+        self.brace_open, self.brace_close = brace_open, brace_close
+
+    def bindings(self):
+        names = [spec[3] for spec in self.named]
+        if self.default:
+            names.append(self.default.value)
+        if self.namespace:
+            names.append(self.namespace[1].value)
+        return names
+
+
+class TsxRewrite:
+    def __init__(self, text, jsx=True):
+        self.text = text
+        self.jsx = jsx
+        self.sig = tokens_for(text, jsx)
+        self.edits = []             # (start, end, replacement)
+        self.import_removals = {}   # ImportDecl.start -> (ImportDecl, set of local names)
+        self._imports = None
+        self._lines = None
+
+    # --- queries -------------------------------------------------------------
+
+    def imports(self):
+        if self._imports is None:
+            self._imports = list(self._scan_imports())
+        return self._imports
+
+    def _scan_imports(self):
+        sig = self.sig
+        i = 0
+        while i < len(sig):
+            tok = sig[i]
+            if tok.kind != 'ident' or tok.value != 'import' or (i and sig[i - 1].value in ('.', '?.')):
+                i += 1
+                continue
+            j = i + 1
+            if j < len(sig) and sig[j].value in ('(', '.'):
+                i = j
+                continue
+            if j < len(sig) and sig[j].value == 'type' and j + 1 < len(sig) and sig[j + 1].value not in ('from', ','):
+                j += 1
+            default = namespace = brace_open = brace_close = None
+            named = []
+            while j < len(sig) and sig[j].value not in ('from', ';') and sig[j].kind != 'string':
+                if sig[j].value == '{':
+                    brace_open = sig[j]
+                    j += 1
+                    while j < len(sig) and sig[j].value != '}':
+                        if sig[j].value == ',':
+                            j += 1
+                            continue
+                        first = j
+                        names = []
+                        while j < len(sig) and sig[j].value not in (',', '}'):
+                            if sig[j].kind in ('ident', 'string'):
+                                names.append(_unquote(sig[j].value) if sig[j].kind == 'string' else sig[j].value)
+                            j += 1
+                        if names and names[0] == 'type' and len(names) > 1:
+                            names = names[1:]
+                        if names:
+                            local = names[-1] if len(names) >= 3 and names[-2] == 'as' else names[0]
+                            named.append((sig[first], sig[j - 1], names[0], local))
+                    if j < len(sig):
+                        brace_close = sig[j]
+                    j += 1
+                    continue
+                if sig[j].value == '*' and j + 2 < len(sig) and sig[j + 1].value == 'as':
+                    namespace = (sig[j], sig[j + 2])
+                    j += 3
+                    continue
+                if sig[j].kind == 'ident':
+                    default = sig[j]
+                j += 1
+            module = None
+            if j < len(sig) and sig[j].value == 'from':
+                j += 1
+            if j < len(sig) and sig[j].kind == 'string':
+                module = _unquote(sig[j].value)
+                end = sig[j].end
+                if j + 1 < len(sig) and sig[j + 1].value == ';':
+                    j += 1
+                    end = sig[j].end
+                yield ImportDecl(tok.start, end, module, default, namespace, named, brace_open, brace_close)
+            i = j + 1
+
+    def references(self, name):
+        """1-based lines where `name` is still used (as an identifier or JSX tag), ignoring imports and pending removals."""
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        spans = [(d.start, d.end) for d in self.imports()] + [(s, e) for s, e, _ in self.edits]
+        return [self._lines.line_of(tok.start) for tok in self.sig
+                if tok.kind in ('ident', 'jsx_name') and tok.value == name
+                and not any(s <= tok.start < e for s, e in spans)]
+
+    # --- removals ------------------------------------------------------------
+
+    def remove_import(self, name, module=None):
+        """Drop the import binding `name` (named, default or namespace); returns how many were found."""
+        found = 0
+        for decl in self.imports():
+            if module is not None and decl.module != module:
+                continue
+            if name in decl.bindings():
+                self.import_removals.setdefault(decl.start, (decl, set()))[1].add(name)
+                found += 1
+        return found
+
+    def remove_state(self, name):
+        """Drop `const [value, setValue] = useState(...)` declarations naming `name` as value or setter."""
+        sig = self.sig
+        found = 0
+        for i, tok in enumerate(sig):
+            if tok.value not in ('const', 'let', 'var') or tok.kind != 'ident':
+                continue
+            if i + 1 >= len(sig) or sig[i + 1].value != '[':
+                continue
+            close = self.matching(i + 1)
+            if close is None or close + 1 >= len(sig) or sig[close + 1].value != '=':
+                continue
+            names = {t.value for t in sig[i + 2:close] if t.kind == 'ident'}
+            j = close + 2
+            if j + 1 < len(sig) and sig[j].value == 'React' and sig[j + 1].value == '.':
+                j += 2
+            if j >= len(sig) or sig[j].value not in ('useState', 'useReducer') or name not in names:
+                continue
+            end = self._call_statement_end(j + 1)
+            self.edits.append(self._whole_lines(tok.start, end) + ('',))
+            found += 1
+        return found
+
+    def remove_element(self, name):
+        """Drop every <name> element subtree (outermost occurrences); returns how many were removed.
+
+        An element that is the whole right-hand side of `{cond && <name/>}` (optionally
+        parenthesised) takes its `{...}` container with it when that container is a JSX child,
+        so no empty expression is left; as an attribute value the container becomes `{null}`.
+        Only JSX children are deleted outright; an element used as an operand (`cond ? <name/> : x`,
+        `return <name/>;`, `() => <name/>`, `icon={<name/>}`) is replaced with `null`.
+        """
+        sig = self.sig
+        found = 0
+        i = 0
+        while i < len(sig):
+            tok = sig[i]
+            if not (tok.value == '<' and i + 1 < len(sig) and sig[i + 1].kind == 'jsx_name'
+                    and sig[i + 1].value == name):
+                i += 1
+                continue
+            last = self.element_end(i)
+            start, end = sig[i].start, sig[last].end
+            container = self._conditional_container(i, last)
+            if container and self._is_jsx_child(container[0]):
+                self.edits.append(self._whole_lines(sig[container[0]].start, sig[container[1]].end) + ('',))
+            elif container:
+                # An attribute value (`icon={open && <El/>}`) must keep an expression.
+                self.edits.append((sig[container[0]].start, sig[container[1]].end, '{null}'))
+            elif self._is_jsx_child(i):
+                self.edits.append(self._whole_lines(start, end) + ('',))
+            else:
+                self.edits.append((start, end, 'null'))
+            found += 1
+            i = last + 1
+        return found
+
+    # --- token helpers -------------------------------------------------------
+
+    def matching(self, i):
+        """Index of the bracket closing sig[i] ('(', '[' or '{'), or None."""
+        pairs = {'(': ')', '[': ']', '{': '}'}
+        opening, closing = self.sig[i].value, pairs[self.sig[i].value]
+        depth = 0
+        for j in range(i, len(self.sig)):
+            value = self.sig[j].value
+            if self.sig[j].kind != 'punct':
+                continue
+            if value == opening:
+                depth += 1
+            elif value == closing:
+                depth -= 1
+                if depth == 0:
+                    return j
+        return None
+
+    def _call_statement_end(self, i):
+        """Character offset after the call whose `(` (or `<TypeArgs>(`) is at sig[i], plus a following ';'.
+
+        Without a ';' the declaration ends at the `)` when the next token is on a later line
+        (where automatic semicolon insertion ends it); otherwise the whole statement is taken.
+        """
+        sig = self.sig
+        if i < len(sig) and sig[i].value == '<':
+            depth = 0
+            while i < len(sig):
+                value = sig[i].value
+                if sig[i].kind == 'punct' and value.strip('<') == '':
+                    depth += len(value)
+                elif sig[i].kind == 'punct' and value.strip('>') == '':
+                    depth -= len(value)
+                i += 1
+                if depth <= 0:
+                    break
+        close = self.matching(i) if i < len(sig) and sig[i].value == '(' else None
+        if close is None:
+            return self._statement_end(i)
+        if close + 1 < len(sig) and sig[close + 1].value == ';':
+            return sig[close + 1].end
+        if close + 1 == len(sig) or '\n' in self.text[sig[close].end:sig[close + 1].start]:
+            return sig[close].end
+        return self._statement_end(close)
+
+    def _statement_end(self, i):
+        """Character offset after the statement containing sig[i] (through its ';' at bracket depth 0)."""
+        depth = 0
+        for j in range(i, len(self.sig)):
+            tok = self.sig[j]
+            if tok.kind != 'punct':
+                continue
+            if tok.value in ('(', '[', '{'):
+                depth += 1
+            elif tok.value in (')', ']', '}'):
+                if depth == 0:
+                    return self.sig[j - 1].end  # statement ended without ';' before a closing block
+                depth -= 1
+            elif tok.value == ';' and depth == 0:
+                return tok.end
+        return self.sig[-1].end
+
+    def element_end(self, i):
+        """Index of the last token of the JSX element whose '<' is sig[i]."""
+        sig = self.sig
+        j = i + 1
+        if j < len(sig) and sig[j].kind == 'jsx_name':
+            j += 1
+        while j < len(sig):  # attributes
+            value = sig[j].value
+            if value == '/>':
+                return j
+            if value == '>':
+                break
+            if value == '{':
+                j = self.matching(j) or j
+            elif value == '<' and j + 1 < len(sig) and sig[j + 1].kind == 'jsx_name':
+                j = self.element_end(j)
+            j += 1
+        j += 1
+        while j < len(sig):  # children
+            value = sig[j].value
+            if value == '</':
+                j += 1
+                if j < len(sig) and sig[j].kind == 'jsx_name':
+                    j += 1
+                return j if j < len(sig) and sig[j].value == '>' else j - 1
+            if value == '{':
+                j = self.matching(j) or j
+            elif value == '<' and j + 1 < len(sig) and (sig[j + 1].kind == 'jsx_name' or sig[j + 1].value == '>'):
+                j = self.element_end(j)  # nested element or fragment
+            j += 1
+        return len(sig) - 1
+
+    def _conditional_container(self, first, last):
+        """Token indices of the `{` and `}` of a `{cond && <El/>}` container wrapping exactly sig[first..last], else None."""
+        sig = self.sig
+        before, after = first - 1, last + 1
+        while before >= 0 and after < len(sig) and sig[before].value == '(' and sig[after].value == ')':
+            before, after = before - 1, after + 1
+        if before < 0 or sig[before].value != '&&' or after >= len(sig) or sig[after].value != '}':
+            return None
+        depth = 0
+        for j in range(before - 1, -1, -1):
+            value = sig[j].value
+            if sig[j].kind != 'punct':
+                continue
+            if value in (')', ']', '}'):
+                depth += 1
+            elif value in ('(', '['):
+                if depth == 0:
+                    return None
+                depth -= 1
+            elif value == '{':
+                if depth == 0:
+                    return (j, after) if self.matching(j) == after else None
+                depth -= 1
+        return None
+
+    def _is_jsx_child(self, i):
+        """True when the element or `{` container at sig[i] follows text, a tag or a `{...}` child of its parent."""
+        if i == 0:
+            return False
+        prev = self.sig[i - 1]
+        return prev.kind == 'jsx_text' or (prev.kind == 'punct' and prev.value in ('>', '/>', '}'))
+
+    def _whole_lines(self, start, end):
+        """Widen [start, end) to whole lines when nothing but whitespace shares them."""
+        text = self.text
+        line_start = text.rfind('\n', 0, start) + 1
+        line_end = text.find('\n', end)
+        line_end = len(text) if line_end < 0 else line_end
+        if text[line_start:start].strip() or text[end:line_end].strip():
+            return start, end
+        return line_start, min(line_end + 1, len(text))
+
+    # --- output --------------------------------------------------------------
+
+    def _import_edits(self):
+        for decl, names in self.import_removals.values():
+            kept = [spec for spec in decl.named if spec[3] not in names]
+            drop_default = decl.default is not None and decl.default.value in names
+            drop_namespace = decl.namespace is not None and decl.namespace[1].value in names
+            keep_default = decl.default is not None and not drop_default
+            keep_namespace = decl.namespace is not None and not drop_namespace
+            if not kept and not keep_default and not keep_namespace:
+                yield self._whole_lines(decl.start, decl.end) + ('',)
+                continue
+            if decl.named and not kept:
+                # `import React, { X } from` -> `import React from`: drop from the comma after the default.
+                anchor = decl.default.end if keep_default else decl.namespace[1].end
+                yield anchor, decl.brace_close.end, ''
+            elif kept != decl.named:
+                specs = decl.named
+                k = 0
+                while k < len(specs):
+                    if specs[k] in kept:
+                        k += 1
+                        continue
+                    run_start = k
+                    while k < len(specs) and specs[k] not in kept:
+                        k += 1
+                    if k < len(specs):
+                        yield specs[run_start][0].start, specs[k][0].start, ''
+                    else:
+                        yield specs[run_start - 1][1].end, specs[k - 1][1].end, ''
+            if drop_default:
+                following = decl.namespace[0] if keep_namespace else (decl.brace_open if kept else None)
+                if following is not None:
+                    yield decl.default.start, following.start, ''
+            if drop_namespace and keep_default:
+                yield decl.default.end, decl.namespace[1].end, ''
+
+    def pending(self):
+        """Non-overlapping edits in file order; an edit inside another one is dropped."""
+        edits = sorted(list(self.edits) + list(self._import_edits()), key=lambda e: (e[0], -e[1]))
+        merged = []
+        for start, end, replacement in edits:
+            if merged and start < merged[-1][1]:
+                if end <= merged[-1][1]:
+                    continue  # nested in an edit already taken
+                raise ValueError(f"Overlapping TSX edits at offsets {merged[-1][0]}-{merged[-1][1]} and {start}-{end}")
+            merged.append((start, end, replacement))
+        return merged
+
+    def result(self):
+        out, pos = [], 0
+        for start, end, replacement in self.pending():
+            out.append(self.text[pos:start])
+            out.append(replacement)
+            pos = end
+        out.append(self.text[pos:])
+        return ''.join(out)
+
+
+def _self_test():
+    cases = [
+        ("const x = cond ? <Search /> : null;\n", "const x = cond ? null : null;\n"),
+        ("function f() {\n  return <Search/>;\n}\n", "function f() {\n  return null;\n}\n"),
+        ("function f() {\n  return (\n    <Search>hi</Search>\n  );\n}\n",
+         "function f() {\n  return (\n    null\n  );\n}\n"),
+        ("const f = () => <Search />;\n", "const f = () => null;\n"),
+        ("<Button icon={<Search size={4} />} />\n", "<Button icon={null} />\n"),
+        ("<div>\n  <Search className=\"a\" />\n  <p>x</p>\n</div>\n", "<div>\n  <p>x</p>\n</div>\n"),
+        ("<div>\n  {open && (\n    <Search />\n  )}\n  <p>x</p>\n</div>\n", "<div>\n  <p>x</p>\n</div>\n"),
+        ("<p>Find: <Search/></p>\n", "<p>Find: </p>\n"),
+        ("<Button icon={open && <Search />} />\n", "<Button icon={null} />\n"),
+    ]
+    for source, expected in cases:
+        rw = TsxRewrite(source, True)
+        assert rw.remove_element('Search') == 1, source
+        assert rw.result() == expected, (source, rw.result())
+
+    states = [
+        ("function f() {\n  const [searchQuery, setSearchQuery] = React.useState<string>('')\n  return 1\n}\n",
+         "function f() {\n  return 1\n}\n"),
+        ("function f() {\n  const [searchQuery, setSearchQuery] = useState<Map<string, Set<number>>>(new Map());\n"
+         "  const [open, setOpen] = useState(false)\n}\n",
+         "function f() {\n  const [open, setOpen] = useState(false)\n}\n"),
+    ]
+    for source, expected in states:
+        rw = TsxRewrite(source, True)
+        assert rw.remove_state('searchQuery') == 1, source
+        assert rw.result() == expected, (source, rw.result())
+    print("tsx_rewrite self-test ok")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Remove imports, useState declarations or JSX elements from TSX files.")
+    parser.add_argument('files', nargs='+')
+    parser.add_argument('--import', dest='imports', action='append', default=[], metavar='NAME[@MODULE]',
+                        help="Import binding to remove (repeatable)")
+    parser.add_argument('--state', action='append', default=[], help="useState value or setter to remove (repeatable)")
+    parser.add_argument('--element', action='append', default=[], help="JSX element to remove (repeatable)")
+    parser.add_argument('--dry-run', action='store_true', help="Report what would change without writing")
+    args = parser.parse_args(argv)
+
+    from codemod_io import CodemodTransaction
+
+    changes = {}
+    for path in args.files:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+        rw = TsxRewrite(text, is_jsx_path(path))
+        counts = [sum(rw.remove_element(name) for name in args.element),
+                  sum(rw.remove_state(name) for name in args.state),
+                  sum(rw.remove_import(*spec.split('@', 1)) if '@' in spec[1:] else rw.remove_import(spec)
+                      for spec in args.imports)]
+        new_text = rw.result()
+        print(f"{'✏️ ' if new_text != text else '✅'} {path}: {counts[0]} element(s), {counts[1]} state(s), "
+              f"{counts[2]} import(s)")
+        for name in args.element + args.state + [spec.split('@', 1)[0] for spec in args.imports]:
+            lines = rw.references(name)
+            if lines:
+                print(f"   ⚠️  '{name}' is still referenced on line(s) {', '.join(map(str, lines))}")
+        if new_text != text:
+            changes[path] = new_text
+    if changes and not args.dry_run:
+        with CodemodTransaction() as txn:
+            for path, new_text in changes.items():
+                txn.write(os.path.relpath(path), new_text)
+    return 0
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
+    else:
+        sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,230 @@
+import re
+from bisect import bisect_right
+from collections import namedtuple
+
+# Lossless TypeScript/TSX tokenizer for the repo's Python tooling.
+# Every character of the input belongs to exactly one token, so
+# ''.join(text[t.start:t.end] for t in tokens) == text, and callers can rewrite a
+# file by splicing token spans without disturbing anything else. It understands
+# comments, strings, template literals, regex literals and JSX (tags, attributes,
+# children text, {expressions}) - enough to find imports, exports and element
+# names reliably. It is not a parser and does not validate syntax.
+#
+# Kinds: ws, comment, string, template, regex, number, ident, punct,
+#        jsx_name, jsx_attr, jsx_string, jsx_text
+
+Token = namedtuple('Token', 'kind start end')
+
+_WS = re.compile(r'\s+')
+_LINE_COMMENT = re.compile(r'//[^\n]*')
+_BLOCK_COMMENT = re.compile(r'/\*.*?(?:\*/|\Z)', re.S)
+_STRING = re.compile(r'"(?:[^"\\\n]|\\.)*"?|\'(?:[^\'\\\n]|\\.)*\'?', re.S)
+_IDENT = re.compile(r'[A-Za-z_$\u0080-\U0010ffff][\w$\u0080-\U0010ffff]*')
+_NUMBER = re.compile(r'\.?\d[\w.]*')
+_PUNCT = re.compile(r'=>|\.\.\.|\?\?=?|\?\.(?!\d)|[=!]==?|&&=?|\|\|=?|\*\*=?|\+\+|--|[-+*%&|^]=?|[{}()\[\];,.:?~@#<>=!/]')
+_REGEX_BODY = re.compile(r'(?:[^\\/\[\n]|\\.|\[(?:[^\]\\\n]|\\.)*\])+/[A-Za-z]*')
+_TEMPLATE_CHUNK = re.compile(r'(?:[^`\\$]|\\.|\$(?!\{))*', re.S)
+_JSX_NAME = re.compile(r'[A-Za-z_$][\w$]*(?:[.:-][A-Za-z_$][\w$-]*)*')
+_JSX_STRING = re.compile(r'"[^"]*"?|\'[^\']*\'?')
+_JSX_TEXT = re.compile(r'[^<{]+')
+# One match per token on the hot path; `special` characters need context to classify.
+_CODE_TOKEN = re.compile('|'.join([
+    r'(?P<ws>\s+)',
+    r'(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))',
+    r'(?P<ident>' + _IDENT.pattern + ')',
+    r'(?P<number>' + _NUMBER.pattern + ')',
+    r'(?P<string>' + _STRING.pattern + ')',
+    r'(?P<special>[`/<{}])',
+    r'(?P<punct>' + _PUNCT.pattern + ')',
+]), re.S)
+
+# After these keywords an expression starts, so `/` opens a regex and `<` may open JSX.
+_EXPR_KEYWORDS = frozenset(['return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                            'case', 'do', 'else', 'yield', 'await', 'extends'])
+
+
+class _Tokenizer:
+    def __init__(self, text, jsx):
+        self.text = text
+        self.jsx = jsx
+        self.tokens = []
+        self.last = None  # last significant Token
+
+    def emit(self, kind, start, end):
+        token = Token(kind, start, end)
+        self.tokens.append(token)
+        if kind not in ('ws', 'comment'):
+            self.last = token
+        return end
+
+    def expression_allowed(self):
+        last = self.last
+        if last is None:
+            return True
+        if last.kind == 'punct':
+            return self.text[last.start:last.end] not in (')', ']', '}')
+        if last.kind == 'ident':
+            return self.text[last.start:last.end] in _EXPR_KEYWORDS
+        return last.kind in ('jsx_text',)
+
+    def trivia(self, pos):
+        """Consume whitespace and comments; returns the new position."""
+        text = self.text
+        while pos < len(text):
+            m = _WS.match(text, pos)
+            if m:
+                pos = self.emit('ws', pos, m.end())
+                continue
+            if text.startswith('//', pos):
+                pos = self.emit('comment', pos, _LINE_COMMENT.match(text, pos).end())
+                continue
+            if text.startswith('/*', pos):
+                pos = self.emit('comment', pos, _BLOCK_COMMENT.match(text, pos).end())
+                continue
+            break
+        return pos
+
+    def code(self, pos, until_brace=False):
+        """Tokenize code; with until_brace, stop after the `}` closing an already-open `{`."""
+        text = self.text
+        depth = 0
+        while pos < len(text):
+            m = _CODE_TOKEN.match(text, pos)
+            kind = m.lastgroup if m else 'punct'
+            if kind != 'special':
+                pos = self.emit(kind, pos, m.end() if m else pos + 1)
+                continue
+            ch = text[pos]
+            if ch == '`':
+                pos = self.template(pos)
+            elif ch == '/':
+                m = _REGEX_BODY.match(text, pos + 1) if self.expression_allowed() else None
+                pos = self.emit('regex', pos, m.end()) if m else self.emit('punct', pos, pos + 1)
+            elif ch == '<':
+                if self.jsx and self.expression_allowed() and self.looks_like_jsx(pos):
+                    pos = self.element(pos)
+                else:
+                    pos = self.emit('punct', pos, pos + 1)
+            elif ch == '{':
+                depth += 1
+                pos = self.emit('punct', pos, pos + 1)
+            else:  # '}'
+                if until_brace and depth == 0:
+                    return self.emit('punct', pos, pos + 1)
+                depth -= 1
+                pos = self.emit('punct', pos, pos + 1)
+        return pos
+
+    def template(self, pos):
+        text = self.text
+        start = pos
+        pos += 1
+        while pos < len(text):
+            pos = _TEMPLATE_CHUNK.match(text, pos).end()
+            if pos >= len(text):
+                break
+            if text[pos] == '`':
+                return self.emit('template', start, pos + 1)
+            # `${` - emit the literal part, then the embedded expression as code.
+            self.emit('template', start, pos + 2)
+            pos = self.code(pos + 2, until_brace=True)
+            start = pos
+            closing = self.tokens[-1]
+            if closing.kind == 'punct' and closing.start == pos - 1 and text[pos - 1] == '}':
+                # The closing `}` belongs to the template chunk that follows.
+                self.tokens.pop()
+                start = pos - 1
+        return self.emit('template', start, len(text)) if start < len(text) else pos
+
+    def looks_like_jsx(self, pos):
+        text = self.text
+        if text.startswith('<>', pos):
+            return True
+        m = _JSX_NAME.match(text, pos + 1)
+        if not m:
+            return False
+        rest = text[m.end():m.end() + 12].lstrip()
+        # `<T,>(...)` and `<T extends X>(...)` are generic arrow functions, not elements.
+        return not (rest.startswith(',') or rest.startswith('extends '))
+
+    def element(self, pos):
+        """Tokenize one JSX element (or fragment) starting at `<`; returns the position after it."""
+        text = self.text
+        pos = self.emit('punct', pos, pos + 1)
+        pos = self.trivia(pos)
+        m = _JSX_NAME.match(text, pos)
+        if m:
+            pos = self.emit('jsx_name', pos, m.end())
+        # Attributes
+        while pos < len(text):
+            pos = self.trivia(pos)
+            if text.startswith('/>', pos):
+                return self.emit('punct', pos, pos + 2)
+            if pos >= len(text) or text[pos] == '>':
+                break
+            ch = text[pos]
+            if ch == '{':
+                pos = self.emit('punct', pos, pos + 1)
+                pos = self.code(pos, until_brace=True)
+            elif ch in '"\'':
+                pos = self.emit('jsx_string', pos, _JSX_STRING.match(text, pos).end())
+            elif ch == '<':
+                pos = self.element(pos)
+            else:
+                m = _JSX_NAME.match(text, pos)
+                if m:
+                    pos = self.emit('jsx_attr', pos, m.end())
+                else:
+                    pos = self.emit('punct', pos, pos + 1)
+        if pos >= len(text):
+            return pos
+        pos = self.emit('punct', pos, pos + 1)  # '>'
+        return self.children(pos)
+
+    def children(self, pos):
+        text = self.text
+        while pos < len(text):
+            ch = text[pos]
+            if ch == '{':
+                pos = self.emit('punct', pos, pos + 1)
+                pos = self.code(pos, until_brace=True)
+            elif ch == '<':
+                if text.startswith('</', pos):
+                    pos = self.emit('punct', pos, pos + 2)
+                    pos = self.trivia(pos)
+                    m = _JSX_NAME.match(text, pos)
+                    if m:
+                        pos = self.emit('jsx_name', pos, m.end())
+                    pos = self.trivia(pos)
+                    if pos < len(text) and text[pos] == '>':
+                        pos = self.emit('punct', pos, pos + 1)
+                    return pos
+                pos = self.element(pos)
+            else:
+                pos = self.emit('jsx_text', pos, _JSX_TEXT.match(text, pos).end())
+        return pos
+
+
+def tokenize(text, jsx=True):
+    """Tokenize `text`; pass jsx=False for .ts files so `<T>` stays a type bracket."""
+    tokenizer = _Tokenizer(text, jsx)
+    pos = 0
+    while pos < len(text):
+        # code() only returns early on a stray top-level `}` in until_brace mode, which
+        # we never request here, so a single call consumes the whole file.
+        pos = tokenizer.code(pos)
+    return tokenizer.tokens
+
+
+def is_jsx_path(path):
+    return path.endswith(('.tsx', '.jsx'))
+
+
+class LineIndex:
+    """Maps character offsets to 1-based line numbers."""
+
+    def __init__(self, text):
+        self.starts = [0] + [m.end() for m in re.finditer('\n', text)]
+
+    def line_of(self, offset):
+        return bisect_right(self.starts, offset)
@@ -0,0 +1,424 @@
+import abc
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from fnmatch import fnmatchcase
+
+from fast_walk import walk_files
+from tsx_rewrite import TsxRewrite, tokens_for
+from tsx_tokens import LineIndex, is_jsx_path
+
+# UI-policy checker: destroy_spyglass.py's single hard-coded check, generalised
+# into declarative rules (ui_policy.json) evaluated over every .ts/.tsx file.
+#
+#   {"rules": [{"id": "forbidden-icon-import", "kind": "forbidden-import", "level": "error",
+#               "paths": ["app/components/vendor-risk/**"], "module": "lucide-react", "names": ["Search"],
+#               "message": "...", "fix": {"kind": "remove-import"}}, ...]}
+#
+# Kinds:
+#   forbidden-import  any of `names` imported (from `module`, if given)
+#   jsx-count         more than `max` <element> inside one <within> (e.g. two <tr> in a <thead>)
+#   call-string       a string literal matching regex `pattern` among the arguments of a call
+#                     to `call` (an identifier call, or the 'name' of supabase.rpc('name', ...))
+# Fixes (applied with --fix, through one CodemodTransaction):
+#   remove-import     drop the import specifier and every element rendering it (tsx_rewrite)
+#   replace           replace the offending string literal with `with`
+#   template          restore the first listed template-store variant written to this
+#                     path that passes the rule (codemod_templates)
+#
+# Every file is read once; a file containing none of the active rules' needles
+# is never tokenized, and the rest are tokenized once for all rules. Files are
+# spread over a process pool. Findings print as text or SARIF 2.1.0.
+#
+# Usage: python3 ui_policy.py [ROOT ...] [--rules ui_policy.json] [--jobs N] [--format text|sarif] [--out F] [--fix]
+#        python3 ui_policy.py --self-test
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RULES = os.path.join(HERE, 'ui_policy.json')
+POLICY_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+IGNORED_DIRS = ['.next', 'node_modules', '.git', 'out']
+LEVELS = ('error', 'warning', 'note')
+
+# start/end are character offsets, used by fixes; line/column pairs are 1-based for the reports.
+Finding = namedtuple('Finding', 'rule path line column end_line end_column message start end')
+
+
+class FileContext:
+    """One file's text, shared by every rule; tokens and rewrites are built on first use."""
+
+    def __init__(self, path, text):
+        self.path = path
+        self.text = text
+        self.jsx = is_jsx_path(path) or not path.endswith('.ts')
+        self._sig = None
+        self._lines = None
+
+    @property
+    def sig(self):
+        if self._sig is None:
+            self._sig = tokens_for(self.text, self.jsx)
+        return self._sig
+
+    def rewrite(self):
+        return TsxRewrite(self.text, self.jsx)
+
+    def finding(self, rule, start, end, message=None):
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        line, end_line = self._lines.line_of(start), self._lines.line_of(max(start, end - 1))
+        column = start - self._lines.starts[line - 1] + 1
+        end_column = end - self._lines.starts[end_line - 1] + 1
+        return Finding(rule.id, self.path, line, column, end_line, end_column, message or rule.message, start, end)
+
+
+class Rule(abc.ABC):
+    kinds = {}
+
+    def __init__(self, spec):
+        self.id = spec['id']
+        self.level = spec.get('level', 'error')
+        if self.level not in LEVELS:
+            raise ValueError(f"Rule '{self.id}': level must be one of {', '.join(LEVELS)}")
+        self.paths = spec.get('paths', ['**'])
+        self.message = spec.get('message', self.id)
+        self.fix = spec.get('fix')
+
+    def __init_subclass__(cls, kind=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Rule.kinds[kind] = cls
+
+    @classmethod
+    def from_dict(cls, spec):
+        try:
+            return cls.kinds[spec['kind']](spec)
+        except KeyError as e:
+            raise ValueError(f"Rule {spec.get('id', '?')!r}: unknown kind or missing key {e}") from None
+
+    def applies_to(self, path):
+        return any(fnmatchcase(path, pattern) for pattern in self.paths)
+
+    def needles(self):
+        """Literal strings a file must contain for this rule to possibly fire."""
+        return ()
+
+    @abc.abstractmethod
+    def check(self, ctx):
+        """Findings of this rule in `ctx`."""
+
+    def fix_edits(self, ctx, rewrite, findings):
+        """Queue token-level fixes on `rewrite`; template fixes are handled by the engine."""
+        if self.fix and self.fix['kind'] == 'replace':
+            for finding in findings:
+                rewrite.edits.append((finding.start, finding.end, self.fix['with']))
+
+
+class ForbiddenImport(Rule, kind='forbidden-import'):
+    def __init__(self, spec):
+        super().__init__(spec)
+        self.module = spec.get('module')
+        self.names = list(spec['names'])
+
+    def needles(self):
+        return self.names
+
+    def check(self, ctx):
+        found = []
+        for decl in ctx.rewrite().imports():
+            if self.module is not None and decl.module != self.module:
+                continue
+            for first, last, imported, local in decl.named:
+                if imported in self.names or local in self.names:
+                    found.append(ctx.finding(self, first.start, last.end, f"{self.message} ('{imported}')"))
+            if decl.default is not None and decl.default.value in self.names:
+                found.append(ctx.finding(self, decl.default.start, decl.default.end,
+                                         f"{self.message} ('{decl.default.value}')"))
+        return found
+
+    def fix_edits(self, ctx, rewrite, findings):
+        if self.fix and self.fix['kind'] == 'remove-import':
+            for name in self.names:
+                if rewrite.remove_import(name, self.module):
+                    rewrite.remove_element(name)
+        else:
+            super().fix_edits(ctx, rewrite, findings)
+
+
+class JsxCount(Rule, kind='jsx-count'):
+    def __init__(self, spec):
+        super().__init__(spec)
+        self.element = spec['element']
+        self.within = spec['within']
+        self.max = spec.get('max', 1)
+
+    def needles(self):
+        return [f"<{self.within}"]
+
+    def check(self, ctx):
+        sig = ctx.sig
+        rewrite = ctx.rewrite()
+        found = []
+        for i, tok in enumerate(sig):
+            if not (tok.value == '<' and i + 1 < len(sig) and sig[i + 1].kind == 'jsx_name'
+                    and sig[i + 1].value == self.within):
+                continue
+            last = rewrite.element_end(i)
+            inner = [j for j in range(i + 2, last) if sig[j].value == '<' and sig[j + 1].kind == 'jsx_name'
+                     and sig[j + 1].value == self.element]
+            for j in inner[self.max:]:
+                found.append(ctx.finding(self, sig[j].start, sig[rewrite.element_end(j)].end))
+        return found
+
+
+class CallString(Rule, kind='call-string'):
+    def __init__(self, spec):
+        super().__init__(spec)
+        self.call = spec['call']
+        self.pattern = re.compile(spec['pattern'])
+
+    def needles(self):
+        return [self.call]
+
+    def check(self, ctx):
+        sig = ctx.sig
+        rewrite = ctx.rewrite()
+        found = []
+        seen = set()
+        for i, tok in enumerate(sig):
+            if tok.kind == 'ident' and tok.value == self.call and i + 1 < len(sig) and sig[i + 1].value == '(':
+                open_at = i + 1
+            elif tok.kind == 'string' and tok.value[1:-1] == self.call and i and sig[i - 1].value == '(':
+                open_at = i - 1
+            else:
+                continue
+            close = rewrite.matching(open_at)
+            for j in range(open_at + 1, close if close is not None else len(sig)):
+                arg = sig[j]
+                if arg.kind in ('string', 'template') and j not in seen and self.pattern.search(arg.value):
+                    seen.add(j)
+                    found.append(ctx.finding(self, arg.start, arg.end, f"{self.message}: {arg.value}"))
+        return found
+
+
+def load_rules(path=DEFAULT_RULES, only=None):
+    with open(path, 'r') as f:
+        data = json.load(f)
+    rules = [Rule.from_dict(spec) for spec in data['rules']]
+    ids = [rule.id for rule in rules]
+    if len(set(ids)) != len(ids):
+        raise ValueError(f"{path}: duplicate rule ids")
+    if only:
+        unknown = set(only) - set(ids)
+        if unknown:
+            raise ValueError(f"Unknown rule id(s): {', '.join(sorted(unknown))}")
+        rules = [rule for rule in rules if rule.id in only]
+    return rules
+
+
+# ---------------------------------------------------------
+# ENGINE
+# ---------------------------------------------------------
+
+_worker_rules = None
+
+
+def _init_worker(rules_path, only):
+    global _worker_rules
+    _worker_rules = load_rules(rules_path, only)
+
+
+def check_text(rules, path, text, fix=False):
+    """(findings, fixed text or None) for one file's text against every applicable rule."""
+    active = [rule for rule in rules if rule.applies_to(path)]
+    active = [rule for rule in active if not rule.needles() or any(n in text for n in rule.needles())]
+    if not active:
+        return [], None
+    ctx = FileContext(path, text)
+    results = [(rule, rule.check(ctx)) for rule in active]
+    findings = [finding for _, found in results for finding in found]
+    if not fix or not findings:
+        return findings, None
+
+    fixed = text
+    for rule, found in results:
+        if found and rule.fix and rule.fix['kind'] == 'template':
+            replacement = _template_fix(rule, path)
+            if replacement is not None:
+                fixed = replacement
+                break
+    else:
+        rewrite = ctx.rewrite()
+        for rule, found in results:
+            if found:
+                rule.fix_edits(ctx, rewrite, found)
+        fixed = rewrite.result()
+    return findings, (fixed if fixed != text else None)
+
+
+def _template_fix(rule, path):
+    """Text of the first listed variant stored for `path` that does not break `rule` itself."""
+    from codemod_templates import load_variant, variant_target
+
+    for variant_id in rule.fix['variants']:
+        if variant_target(variant_id) != path:
+            continue
+        text = load_variant(variant_id)
+        if not rule.check(FileContext(path, text)):
+            return text
+    return None
+
+
+def _check_file(job):
+    path, fix = job
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return path, [], None, []
+    rel = os.path.relpath(path).replace(os.sep, '/')
+    findings, fixed = check_text(_worker_rules, rel, text, fix)
+    remaining = findings if fixed is None else check_text(_worker_rules, rel, fixed)[0]
+    return path, findings, fixed, remaining
+
+
+def run(roots=('app',), rules_path=DEFAULT_RULES, only=None, jobs=None, fix=False):
+    """Yield (path, findings, fixed text or None, findings left after the fix) per policy file, in walk order."""
+    rules = load_rules(rules_path, only)
+    paths = [path for root in roots for path in walk_files(root, POLICY_EXTENSIONS, skip_dirs=IGNORED_DIRS)]
+    rel_paths = [os.path.relpath(path).replace(os.sep, '/') for path in paths]
+    paths = [path for path, rel in zip(paths, rel_paths) if any(rule.applies_to(rel) for rule in rules)]
+    jobs = jobs or os.cpu_count() or 1
+    work = ((path, fix) for path in paths)
+    if jobs <= 1 or len(paths) < 64:
+        _init_worker(rules_path, only)
+        yield from map(_check_file, work)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(rules_path, only)) as pool:
+        yield from pool.map(_check_file, work, chunksize=32)
+
+
+# ---------------------------------------------------------
+# OUTPUT
+# ---------------------------------------------------------
+
+def to_sarif(rules, findings):
+    levels = {rule.id: rule.level for rule in rules}
+    return {
+        '$schema': 'https://json.schemastore.org/sarif-2.1.0.json',
+        'version': '2.1.0',
+        'runs': [{
+            'tool': {'driver': {
+                'name': 'ui_policy',
+                'informationUri': 'ui_policy.py',
+                'rules': [{'id': rule.id, 'shortDescription': {'text': rule.message},
+                           'defaultConfiguration': {'level': rule.level},
+                           'properties': {'kind': next(k for k, c in Rule.kinds.items() if isinstance(rule, c)),
+                                          'fixable': bool(rule.fix)}} for rule in rules],
+            }},
+            'results': [{
+                'ruleId': f.rule,
+                'level': levels[f.rule],
+                'message': {'text': f.message},
+                'locations': [{'physicalLocation': {
+                    'artifactLocation': {'uri': f.path},
+                    'region': {'startLine': f.line, 'startColumn': f.column,
+                               'endLine': f.end_line, 'endColumn': f.end_column},
+                }}],
+            } for f in findings],
+        }],
+    }
+
+
+def _self_test():
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rules_path = os.path.join(tmp, 'rules.json')
+        with open(rules_path, 'w', encoding='utf-8') as f:
+            json.dump({'rules': [
+                {'id': 'no-search', 'kind': 'forbidden-import', 'module': 'lucide-react', 'names': ['Search'],
+                 'fix': {'kind': 'remove-import'}},
+                {'id': 'one-thead', 'kind': 'jsx-count', 'element': 'thead', 'within': 'table'},
+            ]}, f)
+        app = os.path.join(tmp, 'app')
+        os.makedirs(app)
+        files = {
+            'fixable.tsx': "import { Search, X } from 'lucide-react';\nexport const A = () => <div><X/><Search/></div>;\n",
+            'unfixable.tsx': "export const T = () => <table><thead/><thead/></table>;\n",
+        }
+        for name, text in files.items():
+            with open(os.path.join(app, name), 'w', encoding='utf-8') as f:
+                f.write(text)
+        with open(os.path.join(app, 'bad.ts'), 'wb') as f:
+            f.write(b"const s = '\xff\xfe';\n")  # not UTF-8: skipped, not fatal
+
+        results = {os.path.basename(path): rest for path, *rest in run([app], rules_path, jobs=1, fix=True)}
+        assert results['bad.ts'] == [[], None, []]
+        found, fixed, left = results['fixable.tsx']
+        assert [f.rule for f in found] == ['no-search'] and not left
+        assert fixed == "import { X } from 'lucide-react';\nexport const A = () => <div><X/></div>;\n"
+        found, fixed, left = results['unfixable.tsx']
+        assert fixed is None and [f.rule for f in left] == ['one-thead']
+    print("ui_policy self-test ok")
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(description="Check UI-policy rules across the tree.")
+    parser.add_argument('roots', nargs='*', default=['app'], help="Directories to check (default: app)")
+    parser.add_argument('--rules', default=DEFAULT_RULES, help="Rules file (default: ui_policy.json)")
+    parser.add_argument('--rule', action='append', dest='only', help="Only run this rule id (repeatable)")
+    parser.add_argument('--jobs', '-j', type=int, default=0, help="Worker processes (0 = one per CPU)")
+    parser.add_argument('--format', choices=('text', 'sarif'), default='text')
+    parser.add_argument('--out', help="Write the report here instead of stdout")
+    parser.add_argument('--fix', action='store_true', help="Apply rule fixes (one transaction for all files)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        rules = load_rules(args.rules, args.only)
+        findings, remaining, fixes, checked = [], [], {}, 0
+        for path, found, fixed, left in run(args.roots, args.rules, args.only, args.jobs, args.fix):
+            checked += 1
+            findings.extend(found)
+            remaining.extend(left)
+            if fixed is not None:
+                fixes[path] = fixed
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+    elapsed = time.perf_counter() - started
+
+    if args.format == 'sarif':
+        report = json.dumps(to_sarif(rules, findings), indent=1, ensure_ascii=False) + "\n"
+    else:
+        report = ''.join(f"{f.path}:{f.line}:{f.column}: [{f.rule}] {f.message}\n" for f in findings)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(report)
+    else:
+        sys.stdout.write(report)
+
+    if fixes:
+        from codemod_io import CodemodTransaction
+        with CodemodTransaction() as txn:
+            for path, text in fixes.items():
+                txn.write(os.path.relpath(path), text)
+    error_ids = {r.id for r in rules if r.level == 'error'}
+    errors = sum(1 for f in findings if f.rule in error_ids)
+    # Under --fix, only what the fixes could not resolve fails the run.
+    unresolved = sum(1 for f in remaining if f.rule in error_ids)
+    print(f"🛡️  {len(findings)} finding(s) ({errors} error(s)) in {checked} file(s), {len(rules)} rule(s), "
+          f"{elapsed:.2f}s" + (f"; fixed {len(fixes)} file(s), {unresolved} error(s) remain" if args.fix else ""),
+          file=sys.stderr)
+    return 1 if unresolved else 0
+
+
+if __name__ == "__main__":
+    if "--self-test" in sys.argv:
+        _self_test()
+    else:
+        sys.exit(main(sys.argv[1:]))